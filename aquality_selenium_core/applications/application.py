@@ -2,13 +2,24 @@
 from abc import ABC
 from abc import abstractmethod
 from datetime import timedelta
+from typing import Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from aquality_selenium_core.applications.element_cache_registry import (
+    ElementCacheRegistry,
+)
+from aquality_selenium_core.applications.implicit_wait_tracker import (
+    ImplicitWaitTracker,
+)
+
 
 class AbstractApplication(ABC):
     """Interface of any application controlled by Selenium WebDriver API."""
 
+    __implicit_wait_tracker: Optional[ImplicitWaitTracker] = None
+    __element_cache_registry: Optional[ElementCacheRegistry] = None
+
     @property
     @abstractmethod
     def driver(self) -> WebDriver:
@@ -29,3 +40,17 @@ class AbstractApplication(ABC):
         :param value: Timeout value to set.
         """
         pass
+
+    @property
+    def implicit_wait_tracker(self) -> ImplicitWaitTracker:
+        """:return: Tracker of implicit wait timeout which skips redundant WebDriver commands."""
+        if self.__implicit_wait_tracker is None:
+            self.__implicit_wait_tracker = ImplicitWaitTracker(self)
+        return self.__implicit_wait_tracker
+
+    @property
+    def element_cache_registry(self) -> ElementCacheRegistry:
+        """:return: Registry of cached elements of the application."""
+        if self.__element_cache_registry is None:
+            self.__element_cache_registry = ElementCacheRegistry(self)
+        return self.__element_cache_registry
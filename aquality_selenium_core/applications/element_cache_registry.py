@@ -0,0 +1,161 @@
+"""Module defines registry of element caches shared within application session."""
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any
+from typing import Callable
+from typing import cast
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException
+
+from aquality_selenium_core.configurations.element_cache_configuration import (
+    AbstractElementCacheConfiguration,
+)
+from aquality_selenium_core.utilities.java_script import JavaScript
+
+if TYPE_CHECKING:
+    from aquality_selenium_core.applications.application import AbstractApplication
+    from aquality_selenium_core.elements.element_cache_handler import (
+        AbstractElementCacheHandler,
+    )
+
+
+class ElementCacheRegistry:
+    """
+    Owns cache handlers of all elements of application.
+
+    Number of handlers is limited, least recently used ones are evicted.
+    All cached elements are invalidated when the page is changed: the registry periodically compares
+    identity of the current document and its URL with the last known ones in a single script call.
+    Switching to another window or frame changes the document, so it invalidates cache too.
+    """
+
+    def __init__(
+        self,
+        application: "AbstractApplication",
+        max_size: int = 1000,
+        navigation_check_interval: Optional[timedelta] = timedelta(seconds=1),
+    ):
+        """
+        Initialize registry for application.
+
+        :param application: Application which elements are cached.
+        :param max_size: Maximal number of cached elements.
+        :param navigation_check_interval: Minimal interval between checks that page was changed.
+        If None, page changes are not checked and cache is invalidated only by invalidate_all.
+        """
+        self.__application = application
+        self.__max_size = max_size
+        self.__navigation_check_interval = navigation_check_interval
+        self.__handlers: "OrderedDict[Any, AbstractElementCacheHandler]" = OrderedDict()
+        self.__generation = 0
+        self.__document_identity: Any = None
+        self.__checked_at: Optional[float] = None
+        self.__is_configured = False
+        self.__lock = threading.RLock()
+
+    @property
+    def generation(self) -> int:
+        """Get number of cache invalidations, which changes when the page is changed."""
+        return self.__generation
+
+    @property
+    def max_size(self) -> int:
+        """Get maximal number of cached elements."""
+        return self.__max_size
+
+    def __len__(self) -> int:
+        """Get number of cached elements."""
+        return len(self.__handlers)
+
+    def configure(self, configuration: AbstractElementCacheConfiguration) -> None:
+        """
+        Apply limits from cache configuration.
+
+        :param configuration: Element cache configuration.
+        """
+        with self.__lock:
+            self.__max_size = configuration.max_size
+            self.__navigation_check_interval = configuration.navigation_check_interval
+            self.__is_configured = True
+            self.__evict()
+
+    def get_handler(
+        self,
+        key: Any,
+        handler_factory: Callable[[], "AbstractElementCacheHandler"],
+        configuration: AbstractElementCacheConfiguration = cast(
+            AbstractElementCacheConfiguration, None
+        ),
+    ) -> "AbstractElementCacheHandler":
+        """
+        Get cache handler of the element, creating it if it is not registered yet.
+
+        :param key: Key of the element, usually the element itself.
+        :param handler_factory: Function creating handler for the element.
+        :param configuration: Cache configuration applied when registry is used for the first time.
+        :return: Cache handler of the element.
+        """
+        if configuration is not None and not self.__is_configured:
+            self.configure(configuration)
+        self.check_navigation()
+        with self.__lock:
+            handler = self.__handlers.get(key)
+            if handler is None:
+                handler = handler_factory()
+                self.__handlers[key] = handler
+                self.__evict()
+            else:
+                self.__handlers.move_to_end(key)
+            return handler
+
+    def check_navigation(self, force: bool = False) -> bool:
+        """
+        Invalidate cache if the current document or its URL differs from the last known ones.
+
+        :param force: Whether to check the page even if check interval has not passed yet.
+        :return: True if cache was invalidated and false otherwise.
+        """
+        now = time.monotonic()
+        if not force and (
+            self.__navigation_check_interval is None
+            or self.__checked_at is not None
+            and now - self.__checked_at
+            < self.__navigation_check_interval.total_seconds()
+        ):
+            return False
+        self.__checked_at = now
+        if not self.__application.is_started:
+            return False
+        try:
+            identity = tuple(
+                self.__application.driver.execute_script(
+                    JavaScript.GET_DOCUMENT_IDENTITY.script
+                )
+            )
+        except WebDriverException:
+            return False
+        with self.__lock:
+            is_changed = (
+                self.__document_identity is not None
+                and identity != self.__document_identity
+            )
+            self.__document_identity = identity
+            if is_changed:
+                self.invalidate_all()
+            return is_changed
+
+    def invalidate_all(self) -> None:
+        """Invalidate all cached elements, e.g. after navigation to another page."""
+        with self.__lock:
+            self.__generation += 1
+            for handler in self.__handlers.values():
+                handler.invalidate()
+            self.__handlers.clear()
+
+    def __evict(self) -> None:
+        while len(self.__handlers) > self.__max_size:
+            self.__handlers.popitem(last=False)
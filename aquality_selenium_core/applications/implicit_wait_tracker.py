@@ -0,0 +1,72 @@
+"""Module defines tracking of implicit wait timeout set to application."""
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any
+from typing import Iterator
+from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aquality_selenium_core.applications.application import AbstractApplication
+
+
+class ImplicitWaitTracker:
+    """
+    Remembers implicit wait timeout set to application and skips redundant WebDriver commands.
+
+    Only changes made through the tracker are known to it, so application should not
+    change implicit wait timeout bypassing the tracker.
+    """
+
+    def __init__(self, application: "AbstractApplication"):
+        """Initialize tracker with application which timeout is tracked."""
+        self.__application = application
+        self.__driver: Any = None
+        self.__current_timeout: Optional[timedelta] = None
+        self.__suspensions_count = 0
+        self.__lock = threading.RLock()
+
+    @property
+    def current_timeout(self) -> Optional[timedelta]:
+        """Get last implicit wait timeout set to the driver or None if it is unknown."""
+        return self.__current_timeout
+
+    def set_implicit_wait_timeout(self, value: timedelta) -> None:
+        """
+        Set implicit wait timeout to application if it differs from the last set one.
+
+        :param value: Timeout value to set.
+        """
+        with self.__lock:
+            driver = self.__application.driver
+            if driver is not self.__driver:
+                self.__driver = driver
+                self.__current_timeout = None
+            if value != self.__current_timeout:
+                self.__application.set_implicit_wait_timeout(value)
+                self.__current_timeout = value
+
+    def reset(self) -> None:
+        """Forget the last set timeout, e.g. when it was changed bypassing the tracker."""
+        self.__current_timeout = None
+
+    @contextmanager
+    def suspend(self, implicit_timeout: timedelta) -> Iterator[None]:
+        """
+        Set zero implicit wait timeout for the scope and restore it when the scope ends.
+
+        Nested scopes share the outer one, so the timeout is restored only once.
+        :param implicit_timeout: Timeout to restore after the scope.
+        """
+        with self.__lock:
+            if self.__suspensions_count == 0:
+                self.set_implicit_wait_timeout(timedelta())
+            self.__suspensions_count += 1
+        try:
+            yield
+        finally:
+            with self.__lock:
+                self.__suspensions_count -= 1
+                if self.__suspensions_count == 0:
+                    self.set_implicit_wait_timeout(implicit_timeout)
@@ -1,10 +1,22 @@
 """Module defines abstraction for element cache configuration."""
 from abc import ABC
 from abc import abstractmethod
+from datetime import timedelta
+from enum import Enum
+from typing import Any
+from typing import NamedTuple
+from typing import Optional
 
 from aquality_selenium_core.utilities.settings_file import AbstractSettingsFile
 
 
+class ElementCacheMode(Enum):
+    """Enumeration with ways to check that cached element is still valid."""
+
+    VALIDATING = "validating"
+    OPTIMISTIC = "optimistic"
+
+
 class AbstractElementCacheConfiguration(ABC):
     """Provides element's cache configuration."""
 
@@ -14,19 +26,120 @@ class AbstractElementCacheConfiguration(ABC):
         """Is element caching allowed or not."""
         pass
 
+    @property
+    def mode(self) -> ElementCacheMode:
+        """
+        Get the way cached element is checked before use.
+
+        Validating mode checks element's state with WebDriver on each use.
+        Optimistic mode uses cached element until it becomes stale or revalidation interval passes.
+        """
+        return ElementCacheMode.VALIDATING
+
+    @property
+    def revalidation_interval(self) -> Optional[timedelta]:
+        """Get interval after which element cached in optimistic mode is checked again or None to not check it."""
+        return None
+
+    @property
+    def max_size(self) -> int:
+        """Get maximal number of elements cached for application."""
+        return 1000
+
+    @property
+    def navigation_check_interval(self) -> Optional[timedelta]:
+        """Get minimal interval between checks that page was changed or None to not check it automatically."""
+        return timedelta(seconds=1)
+
+
+class ElementCacheConfigurationSnapshot(NamedTuple):
+    """Immutable element cache values read from settings file at once."""
+
+    is_enabled: bool
+    mode: ElementCacheMode
+    revalidation_interval: Optional[timedelta]
+    max_size: int
+    navigation_check_interval: Optional[timedelta]
+
 
 class ElementCacheConfiguration(AbstractElementCacheConfiguration):
-    """Provides element's cache configuration."""
+    """
+    Provides element's cache configuration.
+
+    Values are read from settings file once, when configuration is created or reloaded.
+    Configuration is reloaded automatically when reloadable settings file is changed.
+    """
 
     __IS_ENABLED_PATH = "elementCache.isEnabled"
+    __MODE_PATH = "elementCache.mode"
+    __REVALIDATION_INTERVAL_PATH = "elementCache.revalidationInterval"
+    __MAX_SIZE_PATH = "elementCache.maxSize"
+    __NAVIGATION_CHECK_INTERVAL_PATH = "elementCache.navigationCheckInterval"
 
     def __init__(self, settings_file: AbstractSettingsFile):
         """Initialize configuration with settings file."""
         self.__settings_file = settings_file
+        self.__snapshot = self.__read_snapshot()
+        settings_file.subscribe(self.reload)
+
+    @property
+    def snapshot(self) -> ElementCacheConfigurationSnapshot:
+        """Get all element cache values read from settings file."""
+        return self.__snapshot
+
+    def reload(self) -> None:
+        """Read element cache values from settings file again."""
+        self.__snapshot = self.__read_snapshot()
 
     @property
     def is_enabled(self) -> bool:
         """Is element caching allowed or not."""
-        return self.__settings_file.is_value_present(
-            self.__IS_ENABLED_PATH
-        ) and self.__settings_file.get_value(self.__IS_ENABLED_PATH)
+        return self.__snapshot.is_enabled
+
+    @property
+    def mode(self) -> ElementCacheMode:
+        """Get the way cached element is checked before use."""
+        return self.__snapshot.mode
+
+    @property
+    def revalidation_interval(self) -> Optional[timedelta]:
+        """Get interval after which element cached in optimistic mode is checked again or None to not check it."""
+        return self.__snapshot.revalidation_interval
+
+    @property
+    def max_size(self) -> int:
+        """Get maximal number of elements cached for application."""
+        return self.__snapshot.max_size
+
+    @property
+    def navigation_check_interval(self) -> Optional[timedelta]:
+        """Get minimal interval between checks that page was changed or None to not check it automatically."""
+        return self.__snapshot.navigation_check_interval
+
+    def __read_snapshot(self) -> ElementCacheConfigurationSnapshot:
+        revalidation_milliseconds = self.__settings_file.get_value_or_default(
+            self.__REVALIDATION_INTERVAL_PATH, 0
+        )
+        navigation_check_milliseconds = self.__settings_file.get_value_or_default(
+            self.__NAVIGATION_CHECK_INTERVAL_PATH, 1000
+        )
+        return ElementCacheConfigurationSnapshot(
+            is_enabled=bool(
+                self.__settings_file.is_value_present(self.__IS_ENABLED_PATH)
+                and self.__settings_file.get_value(self.__IS_ENABLED_PATH)
+            ),
+            mode=ElementCacheMode(
+                self.__settings_file.get_value_or_default(
+                    self.__MODE_PATH, ElementCacheMode.VALIDATING.value
+                )
+            ),
+            revalidation_interval=self.__to_interval(revalidation_milliseconds),
+            max_size=int(
+                self.__settings_file.get_value_or_default(self.__MAX_SIZE_PATH, 1000)
+            ),
+            navigation_check_interval=self.__to_interval(navigation_check_milliseconds),
+        )
+
+    @staticmethod
+    def __to_interval(milliseconds: Any) -> Optional[timedelta]:
+        return timedelta(milliseconds=int(milliseconds)) if milliseconds else None
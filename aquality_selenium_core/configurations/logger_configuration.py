@@ -1,10 +1,20 @@
 """Module defines logger configuration."""
 from abc import ABC
 from abc import abstractmethod
+from enum import Enum
+from typing import NamedTuple
 
 from aquality_selenium_core.utilities.settings_file import AbstractSettingsFile
 
 
+class QueueOverflowPolicy(Enum):
+    """Enumeration with ways to handle log record when queue of queued logging is full."""
+
+    BLOCK = "block"
+    DROP_NEWEST = "dropNewest"
+    DROP_OLDEST = "dropOldest"
+
+
 class AbstractLoggerConfiguration(ABC):
     """Describes logger configuration."""
 
@@ -20,22 +30,113 @@ class AbstractLoggerConfiguration(ABC):
         """Perform page source logging in case of catastrophic failures or not."""
         pass
 
+    @property
+    def is_queue_enabled(self) -> bool:
+        """Get whether log records are written by background thread through bounded queue."""
+        return False
+
+    @property
+    def queue_size(self) -> int:
+        """Get maximal number of log records waiting to be written."""
+        return 10000
+
+    @property
+    def queue_overflow_policy(self) -> QueueOverflowPolicy:
+        """Get what to do with log record when the queue is full. Caller waits for free space by default."""
+        return QueueOverflowPolicy.BLOCK
+
+    @property
+    def queue_batch_size(self) -> int:
+        """Get maximal number of log records written before handlers are flushed."""
+        return 100
+
+
+class LoggerConfigurationSnapshot(NamedTuple):
+    """Immutable logger values read from settings file at once."""
+
+    language: str
+    log_page_source: bool
+    is_queue_enabled: bool
+    queue_size: int
+    queue_overflow_policy: QueueOverflowPolicy
+    queue_batch_size: int
+
 
 class LoggerConfiguration(AbstractLoggerConfiguration):
-    """Describes logger configuration."""
+    """
+    Describes logger configuration.
+
+    Values are read from settings file once, when configuration is created or reloaded.
+    Configuration is reloaded automatically when reloadable settings file is changed.
+    """
 
     def __init__(self, settings_file: AbstractSettingsFile):
         """Initialize configuration with settings file."""
         self.__settings_file = settings_file
+        self.__snapshot = self.__read_snapshot()
+        settings_file.subscribe(self.reload)
+
+    @property
+    def snapshot(self) -> LoggerConfigurationSnapshot:
+        """Get all logger values read from settings file."""
+        return self.__snapshot
+
+    def reload(self) -> None:
+        """Read logger values from settings file again."""
+        self.__snapshot = self.__read_snapshot()
 
     @property
     def language(self) -> str:
         """Get language of framework."""
-        return str(self.__settings_file.get_value_or_default("logger.language", "en"))
+        return self.__snapshot.language
 
     @property
     def log_page_source(self) -> bool:
         """Perform page source logging in case of catastrophic failures or not."""
-        return bool(
-            self.__settings_file.get_value_or_default("logger.logPageSource", True)
+        return self.__snapshot.log_page_source
+
+    @property
+    def is_queue_enabled(self) -> bool:
+        """Get whether log records are written by background thread through bounded queue."""
+        return self.__snapshot.is_queue_enabled
+
+    @property
+    def queue_size(self) -> int:
+        """Get maximal number of log records waiting to be written."""
+        return self.__snapshot.queue_size
+
+    @property
+    def queue_overflow_policy(self) -> QueueOverflowPolicy:
+        """Get what to do with log record when the queue is full."""
+        return self.__snapshot.queue_overflow_policy
+
+    @property
+    def queue_batch_size(self) -> int:
+        """Get maximal number of log records written before handlers are flushed."""
+        return self.__snapshot.queue_batch_size
+
+    def __read_snapshot(self) -> LoggerConfigurationSnapshot:
+        return LoggerConfigurationSnapshot(
+            language=str(
+                self.__settings_file.get_value_or_default("logger.language", "en")
+            ),
+            log_page_source=bool(
+                self.__settings_file.get_value_or_default("logger.logPageSource", True)
+            ),
+            is_queue_enabled=bool(
+                self.__settings_file.get_value_or_default(
+                    "logger.queue.isEnabled", False
+                )
+            ),
+            queue_size=int(
+                self.__settings_file.get_value_or_default("logger.queue.size", 10000)
+            ),
+            queue_overflow_policy=QueueOverflowPolicy(
+                self.__settings_file.get_value_or_default(
+                    "logger.queue.overflowPolicy", QueueOverflowPolicy.BLOCK.value
+                )
+            ),
+            queue_batch_size=int(
+                self.__settings_file.get_value_or_default("logger.queue.batchSize", 100)
+            ),
         )
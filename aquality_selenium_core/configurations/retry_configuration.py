@@ -2,6 +2,7 @@
 from abc import ABC
 from abc import abstractmethod
 from datetime import timedelta
+from typing import NamedTuple
 
 from aquality_selenium_core.utilities.settings_file import AbstractSettingsFile
 
@@ -22,20 +23,49 @@ class AbstractRetryConfiguration(ABC):
         pass
 
 
+class RetryConfigurationSnapshot(NamedTuple):
+    """Immutable retry values read from settings file at once."""
+
+    number: int
+    polling_interval: timedelta
+
+
 class RetryConfiguration(AbstractRetryConfiguration):
-    """Describes retry configuration."""
+    """
+    Describes retry configuration.
+
+    Values are read from settings file once, when configuration is created or reloaded.
+    Configuration is reloaded automatically when reloadable settings file is changed.
+    """
 
     def __init__(self, settings_file: AbstractSettingsFile):
         """Initialize configuration with settings file."""
         self.__settings_file = settings_file
+        self.__snapshot = self.__read_snapshot()
+        settings_file.subscribe(self.reload)
+
+    @property
+    def snapshot(self) -> RetryConfigurationSnapshot:
+        """Get all retry values read from settings file."""
+        return self.__snapshot
+
+    def reload(self) -> None:
+        """Read retry values from settings file again."""
+        self.__snapshot = self.__read_snapshot()
 
     @property
     def number(self) -> int:
         """Get the number of attempts to retry."""
-        return int(self.__settings_file.get_value("retry.number"))
+        return self.__snapshot.number
 
     @property
     def polling_interval(self) -> timedelta:
         """Get the polling interval used in retry."""
+        return self.__snapshot.polling_interval
+
+    def __read_snapshot(self) -> RetryConfigurationSnapshot:
         config_value: int = self.__settings_file.get_value("retry.pollingInterval")
-        return timedelta(milliseconds=config_value)
+        return RetryConfigurationSnapshot(
+            number=int(self.__settings_file.get_value("retry.number")),
+            polling_interval=timedelta(milliseconds=config_value),
+        )
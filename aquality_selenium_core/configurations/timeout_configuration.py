@@ -2,8 +2,16 @@
 from abc import ABC
 from abc import abstractmethod
 from datetime import timedelta
+from typing import NamedTuple
 
 from aquality_selenium_core.utilities.settings_file import AbstractSettingsFile
+from aquality_selenium_core.waitings.polling_strategy import AbstractPollingStrategy
+from aquality_selenium_core.waitings.polling_strategy import (
+    ExponentialPollingStrategy,
+)
+from aquality_selenium_core.waitings.polling_strategy import FixedPollingStrategy
+from aquality_selenium_core.waitings.polling_strategy import JitteredPollingStrategy
+from aquality_selenium_core.waitings.polling_strategy import PollingStrategyType
 
 
 class AbstractTimeoutConfiguration(ABC):
@@ -33,37 +41,118 @@ class AbstractTimeoutConfiguration(ABC):
         """Get WebDriver Command timeout."""
         pass
 
+    @property
+    def polling_strategy(self) -> AbstractPollingStrategy:
+        """Get ConditionalWait polling strategy. Polling interval is fixed by default."""
+        return FixedPollingStrategy()
+
+
+class TimeoutConfigurationSnapshot(NamedTuple):
+    """Immutable timeout values read from settings file at once."""
+
+    implicit: timedelta
+    condition: timedelta
+    polling_interval: timedelta
+    command: timedelta
+    polling_strategy: AbstractPollingStrategy
+
 
 class TimeoutConfiguration(AbstractTimeoutConfiguration):
-    """Abstraction for timeout configuration."""
+    """
+    Abstraction for timeout configuration.
+
+    Values are read from settings file once, when configuration is created or reloaded.
+    Configuration is reloaded automatically when reloadable settings file is changed.
+    """
 
     def __init__(self, settings_file: AbstractSettingsFile):
         """Initialize configuration with settings file."""
         self.__settings_file = settings_file
+        self.__snapshot = self.__read_snapshot()
+        settings_file.subscribe(self.reload)
+
+    @property
+    def snapshot(self) -> TimeoutConfigurationSnapshot:
+        """Get all timeout values read from settings file."""
+        return self.__snapshot
+
+    def reload(self) -> None:
+        """Read timeout values from settings file again."""
+        self.__snapshot = self.__read_snapshot()
 
     @property
     def implicit(self) -> timedelta:
         """Get WedDriver ImplicitWait timeout."""
-        config_value = self.__get_config_value("timeouts.timeoutImplicit")
-        return timedelta(seconds=config_value)
+        return self.__snapshot.implicit
 
     @property
     def condition(self) -> timedelta:
         """Get default ConditionalWait timeout."""
-        config_value = self.__get_config_value("timeouts.timeoutCondition")
-        return timedelta(seconds=config_value)
+        return self.__snapshot.condition
 
     @property
     def polling_interval(self) -> timedelta:
         """Get ConditionalWait polling interval."""
-        config_value = self.__get_config_value("timeouts.timeoutPollingInterval")
-        return timedelta(milliseconds=config_value)
+        return self.__snapshot.polling_interval
 
     @property
     def command(self) -> timedelta:
         """Get WebDriver Command timeout."""
-        config_value = self.__get_config_value("timeouts.timeoutCommand")
-        return timedelta(seconds=config_value)
+        return self.__snapshot.command
+
+    @property
+    def polling_strategy(self) -> AbstractPollingStrategy:
+        """Get ConditionalWait polling strategy."""
+        return self.__snapshot.polling_strategy
+
+    def __read_snapshot(self) -> TimeoutConfigurationSnapshot:
+        return TimeoutConfigurationSnapshot(
+            implicit=timedelta(
+                seconds=self.__get_config_value("timeouts.timeoutImplicit")
+            ),
+            condition=timedelta(
+                seconds=self.__get_config_value("timeouts.timeoutCondition")
+            ),
+            polling_interval=timedelta(
+                milliseconds=self.__get_config_value("timeouts.timeoutPollingInterval")
+            ),
+            command=timedelta(
+                seconds=self.__get_config_value("timeouts.timeoutCommand")
+            ),
+            polling_strategy=self.__read_polling_strategy(),
+        )
+
+    def __read_polling_strategy(self) -> AbstractPollingStrategy:
+        strategy_type = PollingStrategyType(
+            self.__settings_file.get_value_or_default(
+                "timeouts.pollingStrategy.type", PollingStrategyType.FIXED.value
+            )
+        )
+        if strategy_type == PollingStrategyType.EXPONENTIAL:
+            return ExponentialPollingStrategy(
+                float(
+                    self.__settings_file.get_value_or_default(
+                        "timeouts.pollingStrategy.multiplier", 2
+                    )
+                ),
+                timedelta(
+                    milliseconds=int(
+                        self.__settings_file.get_value_or_default(
+                            "timeouts.pollingStrategy.maxPollingInterval", 5000
+                        )
+                    )
+                ),
+            )
+        if strategy_type == PollingStrategyType.JITTERED:
+            return JitteredPollingStrategy(
+                FixedPollingStrategy(),
+                float(
+                    self.__settings_file.get_value_or_default(
+                        "timeouts.pollingStrategy.jitter", 0.5
+                    )
+                ),
+            )
+        return FixedPollingStrategy()
 
     def __get_config_value(self, key: str) -> int:
         return int(self.__settings_file.get_value(key))
@@ -0,0 +1,180 @@
+"""Module defines abstraction for element finder working in asyncio event loop."""
+from abc import ABC
+from abc import abstractmethod
+from datetime import timedelta
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from aquality_selenium_core.elements.browser_scripts import filter_elements_in_state
+from aquality_selenium_core.elements.child_locator import find_elements_by_locator
+from aquality_selenium_core.elements.desired_state import DesiredState
+from aquality_selenium_core.elements.element_finder import handle_search_timeout
+from aquality_selenium_core.elements.element_state import ExistsInAnyState
+from aquality_selenium_core.elements.locator_compiler import compile_locator
+from aquality_selenium_core.localization.localized_logger import AbstractLocalizedLogger
+from aquality_selenium_core.waitings.async_conditional_wait import (
+    AbstractAsyncConditionalWait,
+)
+
+
+class AbstractAsyncElementFinder(ABC):
+    """Provides ability to find elements by locator and search criteria without blocking event loop."""
+
+    @abstractmethod
+    async def find_element(
+        self,
+        locator: Tuple[By, str],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+        timeout: timedelta = cast(timedelta, None),
+    ) -> WebElement:
+        """
+        Find element in desired state defined by callable object.
+
+        :param locator: element locator.
+        :param desired_state: desired element state as callable object.
+        :param timeout: timeout for search.
+        :return: Found element.
+        :raises: NoSuchElementException if element was not found in time in desired state.
+        """
+        pass
+
+    @abstractmethod
+    async def find_elements(
+        self,
+        locator: Tuple[By, str],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+        timeout: timedelta = cast(timedelta, None),
+    ) -> List[WebElement]:
+        """
+        Find elements in desired state defined by callable object.
+
+        :param locator: element locator.
+        :param desired_state: desired element state as callable object.
+        :param timeout: timeout for search.
+        :return: List of found elements.
+        """
+        pass
+
+    @abstractmethod
+    async def find_elements_in_state(
+        self,
+        locator: Tuple[By, str],
+        desired_state: DesiredState,
+        timeout: timedelta = cast(timedelta, None),
+    ) -> List[WebElement]:
+        """
+        Find elements in desired state defined by DesiredState object.
+
+        :param locator: element locator.
+        :param desired_state: desired element state.
+        :param timeout: timeout for search.
+        :return: List of found elements.
+        """
+        pass
+
+
+class AsyncElementFinder(AbstractAsyncElementFinder):
+    """
+    Provides ability to find elements by locator and search criteria without blocking event loop.
+
+    Each search attempt is run by AsyncConditionalWait in its executor.
+    """
+
+    def __init__(
+        self,
+        logger: AbstractLocalizedLogger,
+        conditional_wait: AbstractAsyncConditionalWait,
+        prefer_fastest_engine: bool = False,
+    ):
+        """
+        Initialize finder with required dependencies.
+
+        :param logger: Localized logger.
+        :param conditional_wait: Utility used to poll elements.
+        :param prefer_fastest_engine: Whether simple XPath locators should be searched as CSS selectors.
+        """
+        self.__logger = logger
+        self.__conditional_wait = conditional_wait
+        self.__prefer_fastest_engine = prefer_fastest_engine
+
+    async def find_element(
+        self,
+        locator: Tuple[By, str],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+        timeout: timedelta = cast(timedelta, None),
+    ) -> WebElement:
+        """
+        Find element in desired state defined by callable object.
+
+        :param locator: element locator.
+        :param desired_state: desired element state as callable object.
+        :param timeout: timeout for search.
+        :return: Found element.
+        :raises: NoSuchElementException if element was not found in time in desired state.
+        """
+        state = DesiredState(
+            desired_state,
+            "desired",
+            catch_timeout_exception=False,
+            raise_no_such_element_exception=True,
+        )
+        return (await self.find_elements_in_state(locator, state, timeout))[0]
+
+    async def find_elements(
+        self,
+        locator: Tuple[By, str],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+        timeout: timedelta = cast(timedelta, None),
+    ) -> List[WebElement]:
+        """
+        Find elements in desired state defined by callable object.
+
+        :param locator: element locator.
+        :param desired_state: desired element state as callable object.
+        :param timeout: timeout for search.
+        :return: List of found elements.
+        """
+        state = DesiredState(desired_state, "desired", catch_timeout_exception=True)
+        return await self.find_elements_in_state(locator, state, timeout)
+
+    async def find_elements_in_state(
+        self,
+        locator: Tuple[By, str],
+        desired_state: DesiredState,
+        timeout: timedelta = cast(timedelta, None),
+    ) -> List[WebElement]:
+        """
+        Find elements in desired state defined by DesiredState object.
+
+        :param locator: element locator.
+        :param desired_state: desired element state.
+        :param timeout: timeout for search.
+        :return: List of found elements.
+        """
+        elements: Dict[str, List] = {"found": [], "result": []}
+        search_locator = compile_locator(locator, self.__prefer_fastest_engine)
+
+        def find_elements_func(driver: WebDriver):
+            elements["found"] = find_elements_by_locator(driver, search_locator)
+            elements["result"] = filter_elements_in_state(
+                driver, elements["found"], desired_state.element_state_condition
+            )
+            return any(elements["result"])
+
+        try:
+            await self.__conditional_wait.wait_for_with_driver(
+                find_elements_func, timeout
+            )
+        except TimeoutException as exception:
+            handle_search_timeout(
+                self.__logger, exception, locator, desired_state, elements["found"]
+            )
+        return elements["result"]
@@ -0,0 +1,156 @@
+"""Module defines conversion of locators and element states to arguments of browser scripts."""
+import re
+import weakref
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import UnknownMethodException
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from aquality_selenium_core.elements.child_locator import ChildLocator
+from aquality_selenium_core.elements.element_state import Clickable
+from aquality_selenium_core.elements.element_state import Displayed
+from aquality_selenium_core.elements.element_state import ExistsInAnyState
+from aquality_selenium_core.elements.fallback_locator import FallbackLocator
+from aquality_selenium_core.elements.locator_compiler import to_css
+from aquality_selenium_core.utilities.java_script import JavaScript
+
+SCRIPT_STATES = {
+    ExistsInAnyState: "exists",
+    Displayed: "displayed",
+    Clickable: "clickable",
+}
+
+_drivers_without_scripts: "weakref.WeakSet[WebDriver]" = weakref.WeakSet()
+_TRANSIENT_ERROR = re.compile(
+    r"time(?:d)? ?out|connection|not reachable|disconnected", re.IGNORECASE
+)
+
+
+def is_script_support_error(exception: WebDriverException) -> bool:
+    """
+    Check that exception means the driver could not execute scripts at all.
+
+    Only generic WebDriverException and UnknownMethodException are treated so,
+    except connection and timeout failures which could pass on the next call.
+    :param exception: Exception raised by script call.
+    :return: True if scripts should not be used with the driver any more.
+    """
+    if isinstance(exception, UnknownMethodException):
+        return True
+    return type(exception) is WebDriverException and not _TRANSIENT_ERROR.search(
+        str(exception.msg)
+    )
+
+
+def get_script_locator(locator: Tuple[By, str]) -> Optional[Tuple[str, str]]:
+    """
+    Convert locator to the strategy supported by element_helpers.js.
+
+    Locators are converted the same way as W3C WebDriver converts them.
+    Child locators are not supported as they are searched inside of the parent element,
+    fallback locators are not supported as they consist of several locators.
+    :param locator: Element locator.
+    :return: Pair of strategy and value or None if locator is not supported.
+    """
+    if isinstance(locator, (ChildLocator, FallbackLocator)):
+        return None
+    strategy, value = locator
+    if strategy in [By.XPATH, By.CSS_SELECTOR, By.LINK_TEXT, By.PARTIAL_LINK_TEXT]:
+        return strategy, value
+    return to_css(locator)
+
+
+def get_script_state(state: Callable[[WebElement], bool]) -> Optional[str]:
+    """
+    Get name of element state supported by element_helpers.js.
+
+    :param state: Element state condition.
+    :return: Name of the state or None if state could be checked only by WebDriver.
+    """
+    return SCRIPT_STATES.get(type(state))
+
+
+def get_script_query(
+    locator: Tuple[By, str], state: Callable[[WebElement], bool]
+) -> Optional[Tuple[str, str, str]]:
+    """
+    Get query of find_many.js for locator and element state.
+
+    :param locator: Element locator.
+    :param state: Element state condition.
+    :return: Strategy, value and state name or None if the search could not be done by script.
+    """
+    script_locator = get_script_locator(locator)
+    script_state = get_script_state(state)
+    if script_locator is None or script_state is None:
+        return None
+    return script_locator[0], script_locator[1], script_state
+
+
+def find_elements_by_queries(
+    driver: WebDriver, queries: List[Tuple[str, str, str]], limit: int = 0
+) -> Optional[List[List[WebElement]]]:
+    """
+    Find elements for several queries with one script call.
+
+    :param driver: Instance of WebDriver.
+    :param queries: Queries built by get_script_query.
+    :param limit: Maximal number of elements returned for each query, zero means no limit.
+    :return: Elements in desired state for each query or None if the script failed.
+    """
+    if not queries:
+        return []
+    if driver in _drivers_without_scripts:
+        return None
+    try:
+        return driver.execute_script(
+            JavaScript.FIND_MANY.script, [list(query) for query in queries], limit
+        )
+    except WebDriverException as exception:
+        if is_script_support_error(exception):
+            _drivers_without_scripts.add(driver)
+        return None
+
+
+def filter_elements_in_state(
+    driver: WebDriver, elements: List[WebElement], state: Callable[[WebElement], bool]
+) -> List[WebElement]:
+    """
+    Filter elements which are in desired state.
+
+    Known states of WebElements are evaluated for the whole list with one script call,
+    other states and elements which are not WebElements, e.g. nodes of DOM snapshot,
+    are checked for each element separately.
+    :param driver: Driver which found the elements.
+    :param elements: Elements to filter.
+    :param state: Element state condition.
+    :return: Elements in desired state.
+    """
+    script_state = get_script_state(state)
+    if script_state == "exists":
+        return list(elements)
+    if (
+        script_state is None
+        or not elements
+        or driver in _drivers_without_scripts
+        or not all(isinstance(element, WebElement) for element in elements)
+    ):
+        return list(filter(state, elements))
+    try:
+        states = driver.execute_script(
+            JavaScript.EVALUATE_STATES.script, elements, script_state
+        )
+    except StaleElementReferenceException:
+        raise
+    except WebDriverException as exception:
+        if is_script_support_error(exception):
+            _drivers_without_scripts.add(driver)
+        return list(filter(state, elements))
+    return [element for element, is_in_state in zip(elements, states) if is_in_state]
@@ -0,0 +1,130 @@
+"""Module defines waiting for elements performed inside the browser."""
+import logging
+import time
+from datetime import timedelta
+from typing import Any
+from typing import Callable
+from typing import cast
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from aquality_selenium_core.applications.application import AbstractApplication
+from aquality_selenium_core.configurations.timeout_configuration import (
+    AbstractTimeoutConfiguration,
+)
+from aquality_selenium_core.elements.browser_scripts import get_script_locator
+from aquality_selenium_core.elements.browser_scripts import get_script_state
+from aquality_selenium_core.elements.browser_scripts import is_script_support_error
+from aquality_selenium_core.utilities.java_script import JavaScript
+
+
+class BrowserWaitEngine:
+    """
+    Waits for elements inside the browser instead of polling them by WebDriver commands.
+
+    Condition is checked by the script on each DOM mutation (at most once per animation frame)
+    and with configured polling interval, so the waiting costs one command which is resolved
+    as soon as the DOM matches. Only locators and states which could be compiled to JavaScript
+    are supported, other searches should be performed by polling.
+    """
+
+    def __init__(
+        self,
+        application: AbstractApplication,
+        timeout_configuration: AbstractTimeoutConfiguration,
+        script_timeout: timedelta = timedelta(seconds=30),
+    ):
+        """
+        Initialize engine with required dependencies.
+
+        :param application: Application controlled by WebDriver.
+        :param timeout_configuration: Timeout configuration.
+        :param script_timeout: Asynchronous script timeout of the driver. Longer waitings are split into several calls.
+        """
+        self.__application = application
+        self.__timeout_configuration = timeout_configuration
+        script_timeout_seconds = script_timeout.total_seconds()
+        self.__call_budget = script_timeout_seconds - min(
+            1.0, script_timeout_seconds / 2
+        )
+        self.__unsupported_driver: Any = None
+
+    @property
+    def default_timeout(self) -> timedelta:
+        """Get timeout of waiting which is used when timeout is not passed."""
+        return self.__timeout_configuration.condition
+
+    def is_supported(
+        self, locator: Tuple[By, str], state: Callable[[WebElement], bool]
+    ) -> bool:
+        """
+        Check that waiting for elements could be performed in the browser.
+
+        :param locator: Element locator.
+        :param state: Element state condition.
+        :return: True if locator, state and current driver are supported.
+        """
+        return (
+            get_script_locator(locator) is not None
+            and get_script_state(state) is not None
+            and self.__application.driver is not self.__unsupported_driver
+        )
+
+    def wait_for_elements(
+        self,
+        locator: Tuple[By, str],
+        state: Callable[[WebElement], bool],
+        timeout: timedelta = cast(timedelta, None),
+    ) -> Optional[Tuple[List[WebElement], List[WebElement]]]:
+        """
+        Wait for elements in desired state inside the browser.
+
+        :param locator: Element locator.
+        :param state: Element state condition.
+        :param timeout: Timeout for waiting. Default value is taken from TimeoutConfiguration.
+        :return: Elements found by locator and elements in desired state (empty if timeout exceeded),
+        or None if the waiting could not be performed in the browser. The driver is not used by the engine
+        any more only if it does not support scripts; after other errors the search could be continued
+        by polling within the rest of timeout.
+        """
+        strategy, value = cast(Tuple[str, str], get_script_locator(locator))
+        state_name = get_script_state(state)
+        wait_timeout = (
+            timeout if timeout is not None else self.__timeout_configuration.condition
+        ).total_seconds()
+        polling_interval = self.__timeout_configuration.polling_interval
+        end_time = time.monotonic() + wait_timeout
+        driver = self.__application.driver
+
+        while True:
+            call_timeout = min(max(end_time - time.monotonic(), 0), self.__call_budget)
+            try:
+                found, matched = driver.execute_async_script(
+                    JavaScript.WAIT_FOR_ELEMENTS.script,
+                    strategy,
+                    value,
+                    state_name,
+                    int(call_timeout * 1000),
+                    int(polling_interval.total_seconds() * 1000),
+                )
+            except TimeoutException:
+                found, matched = [], []
+            except WebDriverException as exception:
+                if is_script_support_error(exception):
+                    return self.__mark_unsupported(driver)
+                return None
+            if matched or time.monotonic() >= end_time:
+                return found, matched
+
+    def __mark_unsupported(self, driver: Any) -> None:
+        logging.debug(
+            "Browser-side waiting is not supported by the driver, elements will be polled"
+        )
+        self.__unsupported_driver = driver
+        return None
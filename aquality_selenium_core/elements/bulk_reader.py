@@ -0,0 +1,125 @@
+"""Module defines reading of texts and attributes of several elements at once."""
+from typing import Any
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from aquality_selenium_core.utilities.java_script import JavaScript
+
+ReadTarget = Union[WebElement, Tuple[str, str, str]]
+
+
+def read_texts(
+    driver: Optional[WebDriver],
+    elements: Sequence[ReadTarget],
+    resolve_element: Callable[[int], WebElement] = cast(Callable, None),
+) -> List[str]:
+    """
+    Read visible texts of elements.
+
+    Texts are read with one script call if driver is given, otherwise with separate WebDriver commands.
+    Elements could be given by queries built by get_script_query, then they are found by the same script.
+    :param driver: Driver used to execute script or None.
+    :param elements: Elements or queries of elements to read.
+    :param resolve_element: Function which finds element by its index when its query matches nothing
+    or when script could not be executed. Required only if queries are passed.
+    :return: Texts in order of elements.
+    :raises: StaleElementReferenceException if any of elements is stale.
+    """
+    result, web_elements = _read(driver, elements, [], True, resolve_element)
+    if result is not None:
+        return [str(text) for text in result["texts"]]
+    return [str(element.text) for element in web_elements]
+
+
+def read_attributes(
+    driver: Optional[WebDriver],
+    elements: Sequence[ReadTarget],
+    names: Iterable[str],
+    resolve_element: Callable[[int], WebElement] = cast(Callable, None),
+) -> Dict[str, List[Optional[str]]]:
+    """
+    Read attributes of elements.
+
+    Attributes are read with one script call if driver is given, otherwise with separate WebDriver commands.
+    Elements could be given by queries built by get_script_query, then they are found by the same script.
+    Result is columnar: one list of values per attribute, so it could be passed to e.g. pandas.DataFrame.
+    :param driver: Driver used to execute script or None.
+    :param elements: Elements or queries of elements to read.
+    :param names: Names of attributes to read.
+    :param resolve_element: Function which finds element by its index when its query matches nothing
+    or when script could not be executed. Required only if queries are passed.
+    :return: Dictionary of attribute names and values in order of elements, None for absent attributes.
+    :raises: StaleElementReferenceException if any of elements is stale.
+    """
+    attribute_names = list(names)
+    result, web_elements = _read(
+        driver, elements, attribute_names, False, resolve_element
+    )
+    if result is not None:
+        return {name: list(result["attributes"][name]) for name in attribute_names}
+    return {
+        name: [element.get_attribute(name) for element in web_elements]
+        for name in attribute_names
+    }
+
+
+def _read(
+    driver: Optional[WebDriver],
+    elements: Sequence[ReadTarget],
+    names: List[str],
+    read_texts: bool,
+    resolve_element: Callable[[int], WebElement],
+) -> Tuple[Optional[Dict[str, Any]], List[WebElement]]:
+    targets = list(elements)
+    result = _read_with_script(driver, targets, names, read_texts)
+    if result is not None and result.get("missing"):
+        for index in result["missing"]:
+            targets[index] = resolve_element(index)
+        result = _read_with_script(driver, targets, names, read_texts)
+    if result is not None:
+        return result, []
+    return (
+        None,
+        [
+            resolve_element(index) if isinstance(target, tuple) else target
+            for index, target in enumerate(targets)
+        ],
+    )
+
+
+def _read_with_script(
+    driver: Optional[WebDriver],
+    targets: List[ReadTarget],
+    names: List[str],
+    read_texts: bool,
+) -> Optional[Dict[str, Any]]:
+    if driver is None:
+        return None
+    if not targets:
+        return {"texts": [], "attributes": {name: [] for name in names}}
+    try:
+        return driver.execute_script(
+            JavaScript.READ_ELEMENTS.script,
+            [
+                list(target) if isinstance(target, tuple) else target
+                for target in targets
+            ],
+            names,
+            read_texts,
+        )
+    except StaleElementReferenceException:
+        raise
+    except WebDriverException:
+        return None
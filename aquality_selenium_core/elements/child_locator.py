@@ -0,0 +1,181 @@
+"""Module defines locator of child element searched relative to its parent element."""
+from datetime import timedelta
+from typing import Any
+from typing import cast
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from aquality_selenium_core.elements.fallback_locator import FallbackLocator
+
+if TYPE_CHECKING:
+    from aquality_selenium_core.elements.element import AbstractElement
+
+
+class ChildLocator(tuple):
+    """
+    Locator of child element which is searched inside of the parent's WebElement.
+
+    It is still a pair of locator strategy and value, so it could be logged and used as plain locator.
+    The pair is absolute XPath of the child when it could be built, otherwise it is the relative locator.
+    Child locators are equal only if they belong to the same parent element, so children of different
+    parents could be used as separate keys.
+    """
+
+    def __new__(
+        cls,
+        parent: "AbstractElement",
+        relative_locator: Tuple[By, str],
+        index: Optional[int] = None,
+        absolute_locator: Optional[Tuple[By, str]] = None,
+    ):
+        """
+        Create locator of child element.
+
+        :param parent: Parent element.
+        :param relative_locator: Locator of child element relative to its parent.
+        :param index: One-based position of the child among elements found by relative locator.
+        If not set, all found elements are matched.
+        :param absolute_locator: Locator of the same child from the document root if it could be built.
+        """
+        instance = super().__new__(
+            cls, absolute_locator if absolute_locator is not None else relative_locator
+        )
+        instance.__parent = parent
+        instance.__relative_locator = relative_locator
+        instance.__index = index
+        instance.__absolute_locator = absolute_locator
+        instance.__search_locator = _get_search_locator(relative_locator)
+        return instance
+
+    def __getnewargs__(self):
+        """Get arguments used to recreate locator when it is copied or pickled."""
+        return (
+            self.__parent,
+            self.__relative_locator,
+            self.__index,
+            self.__absolute_locator,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Check that other locator is the same child locator of the same parent element."""
+        return (
+            isinstance(other, ChildLocator)
+            and self.__parent is other.__parent
+            and self.__relative_locator == other.__relative_locator
+            and self.__index == other.__index
+            and tuple(self) == tuple(other)
+        )
+
+    def __ne__(self, other: object) -> bool:
+        """Check that other locator is not the same child locator of the same parent element."""
+        return not self == other
+
+    def __hash__(self) -> int:
+        """Get hash of locator which depends on identity of the parent element."""
+        return hash((tuple(self), id(self.__parent), self.__index))
+
+    @property
+    def parent(self) -> "AbstractElement":
+        """Get parent element."""
+        return self.__parent
+
+    @property
+    def relative_locator(self) -> Tuple[By, str]:
+        """Get locator of child element relative to its parent."""
+        return self.__relative_locator
+
+    @property
+    def index(self) -> Optional[int]:
+        """Get one-based position of the child or None if all found elements are matched."""
+        return self.__index
+
+    @property
+    def absolute_locator(self) -> Optional[Tuple[By, str]]:
+        """Get locator of the child from the document root or None if it could not be built."""
+        return self.__absolute_locator
+
+    def with_index(
+        self, index: int, absolute_locator: Optional[Tuple[By, str]] = None
+    ) -> "ChildLocator":
+        """
+        Create locator of the child at given position.
+
+        :param index: One-based position of the child among elements found by relative locator.
+        :param absolute_locator: Locator of the positioned child from the document root if it could be built.
+        :return: Locator of the positioned child.
+        """
+        return ChildLocator(
+            self.__parent, self.__relative_locator, index, absolute_locator
+        )
+
+    def find_elements(self) -> List[WebElement]:
+        """
+        Find child elements inside of the parent's WebElement.
+
+        XPath starting with "/" is searched relative to the parent, e.g. "//td" is searched as ".//td".
+        If parent has active DOM snapshot, children are searched in the snapshot without browser calls.
+        If parent's WebElement became stale, parent is searched again and its cache is refreshed.
+        :return: List of found child elements.
+        """
+        parent = self.__parent
+        snapshot = parent._dom_snapshot
+        try:
+            if snapshot is not None:
+                parent_element = snapshot.root
+            elif parent._cache_configuration.is_enabled:
+                parent_element = parent._cache.get_element(timedelta())
+            else:
+                parent_element = self.__find_parent_element()
+            elements = self.__find_in(parent_element)
+        except StaleElementReferenceException:
+            parent_element = self.__find_parent_element()
+            parent._seed_cache(parent_element)
+            elements = self.__find_in(parent_element)
+        if self.__index is None:
+            return elements
+        return [elements[self.__index - 1]] if len(elements) >= self.__index else []
+
+    def __find_in(self, parent_element: Any) -> List[WebElement]:
+        if isinstance(self.__search_locator, FallbackLocator):
+            return self.__search_locator.find_elements(parent_element).elements
+        return parent_element.find_elements(*self.__search_locator)
+
+    def __find_parent_element(self) -> WebElement:
+        return self.__parent._element_finder.find_element(
+            self.__parent.locator, self.__parent._element_state, timedelta()
+        )
+
+
+def _get_search_locator(relative_locator: Tuple[By, str]) -> Tuple[By, str]:
+    if isinstance(relative_locator, FallbackLocator):
+        return FallbackLocator(
+            [_get_search_locator(locator) for locator in relative_locator.locators]
+        )
+    strategy, value = relative_locator
+    if strategy == By.XPATH and value.startswith("/"):
+        return strategy, f".{value}"
+    return relative_locator
+
+
+def find_elements_by_locator(
+    driver: WebDriver, locator: Tuple[By, str]
+) -> List[WebElement]:
+    """
+    Find elements by locator, searching child elements inside of their parent and trying fallback locators in order.
+
+    :param driver: Instance of WebDriver.
+    :param locator: Element locator.
+    :return: List of found elements.
+    """
+    if isinstance(locator, ChildLocator):
+        return cast(ChildLocator, locator).find_elements()
+    if isinstance(locator, FallbackLocator):
+        return cast(FallbackLocator, locator).find_elements(driver).elements
+    return driver.find_elements(*locator)
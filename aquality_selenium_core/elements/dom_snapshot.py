@@ -0,0 +1,512 @@
+"""Module defines read-only copy of element subtree used to check elements without browser calls."""
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.locator_compiler import LOCATOR_CACHE_SIZE
+from aquality_selenium_core.elements.locator_compiler import to_xpath
+
+_IDENTIFIER = r"[A-Za-z_][\w-]*"
+_VOID_TAGS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+}
+_HIDDEN_TAGS = {
+    "base",
+    "head",
+    "link",
+    "meta",
+    "noscript",
+    "script",
+    "style",
+    "template",
+    "title",
+}
+_BLOCK_TAGS = {
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "caption",
+    "dd",
+    "details",
+    "dialog",
+    "div",
+    "dl",
+    "dt",
+    "fieldset",
+    "figcaption",
+    "figure",
+    "footer",
+    "form",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "hr",
+    "legend",
+    "li",
+    "main",
+    "nav",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "summary",
+    "table",
+    "tbody",
+    "tfoot",
+    "thead",
+    "tr",
+    "ul",
+}
+_TEXT_SEPARATORS = {
+    **{tag: "\n" for tag in _BLOCK_TAGS},
+    "td": " ",
+    "th": " ",
+}
+_COLLAPSIBLE_SPACE = re.compile(r"[ \t\n\r\f]+")
+_HIDDEN_STYLE = re.compile(
+    r"(?:^|;)\s*(?:display\s*:\s*none|visibility\s*:\s*hidden)\s*(?:!important\s*)?(?:;|$)",
+    re.IGNORECASE,
+)
+_POSITIONED_PATH = re.compile(r"\((?P<path>.+)\)\[(?P<index>\d+)\]$")
+_PATH_STEP = re.compile(
+    rf"(?P<axis>//|/)(?P<tag>{_IDENTIFIER}|\*)(?P<predicates>(?:\[[^\[\]]*\])*)"
+)
+_PREDICATE = re.compile(r"\[([^\[\]]*)\]")
+_INDEX_PREDICATE = re.compile(r"\s*(?P<index>\d+)\s*$")
+_ATTRIBUTE_PREDICATE = re.compile(
+    rf"\s*@(?P<attribute>{_IDENTIFIER})"
+    rf"(?:\s*=\s*(?:\"(?P<double>[^\"]*)\"|'(?P<single>[^']*)'))?\s*$"
+)
+_CLASS_PREDICATE = re.compile(
+    r"\s*contains\(concat\(' ', normalize-space\(@class\), ' '\), ' (?P<class>[^' ]+) '\)\s*$"
+)
+
+_Predicate = Tuple[str, Optional[str], Optional[str]]
+_Step = Tuple[str, str, Tuple[_Predicate, ...]]
+
+
+class DomSnapshotNode:
+    """
+    Read-only element of DOM snapshot.
+
+    It could be used instead of WebElement for reading and for element state checks.
+    Visibility is judged only by tags, attributes and inline styles, because computed styles
+    are not available offline. Any call to the node of released snapshot raises StaleElementReferenceException.
+    """
+
+    def __init__(
+        self,
+        snapshot: "DomSnapshot",
+        tag_name: str,
+        attributes: Dict[str, Optional[str]],
+        parent: Optional["DomSnapshotNode"],
+        order: int,
+    ):
+        """
+        Initialize node of snapshot.
+
+        :param snapshot: Snapshot which owns the node.
+        :param tag_name: Lower-case tag name.
+        :param attributes: Attributes of element, None for attributes without value.
+        :param parent: Parent node or None for the document node.
+        :param order: Position of the node in the document order.
+        """
+        self.__snapshot = snapshot
+        self.__tag_name = tag_name
+        self.__attributes = attributes
+        self.__parent = parent
+        self.__order = order
+        self.__contents: List[Union[str, "DomSnapshotNode"]] = []
+
+    @property
+    def tag_name(self) -> str:
+        """Get lower-case tag name of element."""
+        self.__check_not_stale()
+        return self.__tag_name
+
+    @property
+    def text(self) -> str:
+        """
+        Get visible text of element the way the browser renders it.
+
+        Whitespaces are collapsed, block elements and <br> start new lines, table cells are separated by spaces.
+        """
+        self.__check_not_stale()
+        if not self.__is_displayed():
+            return ""
+        lines = [
+            _COLLAPSIBLE_SPACE.sub(" ", line).strip(" ")
+            for line in self.__visible_text().split("\n")
+        ]
+        return "\n".join(line for line in lines if line).replace("\xa0", " ")
+
+    @property
+    def parent(self) -> Optional["DomSnapshotNode"]:
+        """Get parent node or None for the root of snapshot."""
+        self.__check_not_stale()
+        if self.__parent is None or self.__parent.__parent is None:
+            return None
+        return self.__parent
+
+    @property
+    def children(self) -> List["DomSnapshotNode"]:
+        """Get child elements."""
+        self.__check_not_stale()
+        return self.__children()
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Get attribute value of the element.
+
+        :param name: Attribute name.
+        :return: Attribute value, "true" for attributes without value and None for absent attributes.
+        """
+        self.__check_not_stale()
+        if name not in self.__attributes:
+            return None
+        value = self.__attributes[name]
+        return "true" if value is None else value
+
+    def is_displayed(self) -> bool:
+        """Get whether element and all its ancestors are not hidden by tag, attributes or inline style."""
+        self.__check_not_stale()
+        return self.__is_displayed()
+
+    def is_enabled(self) -> bool:
+        """Get whether element and its ancestor fieldsets do not have disabled attribute."""
+        self.__check_not_stale()
+        if "disabled" in self.__attributes:
+            return False
+        node = self.__parent
+        while node is not None:
+            if node.__tag_name == "fieldset" and "disabled" in node.__attributes:
+                return False
+            node = node.__parent
+        return True
+
+    def find_element(self, by: str = By.ID, value: str = "") -> "DomSnapshotNode":
+        """
+        Find the first descendant element by locator.
+
+        :param by: Locator strategy.
+        :param value: Locator value.
+        :return: Found node.
+        :raises: NoSuchElementException if element is not found.
+        """
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(
+                f"Element with locator {(by, value)} was not found in DOM snapshot"
+            )
+        return elements[0]
+
+    def find_elements(
+        self, by: str = By.ID, value: str = ""
+    ) -> List["DomSnapshotNode"]:
+        """
+        Find descendant elements by locator.
+
+        Locators are supported if they could be translated to XPath of tags with attribute, class and position
+        predicates. Absolute XPath is evaluated from the root of snapshot, not from the root of the document.
+        :param by: Locator strategy.
+        :param value: Locator value.
+        :return: List of found nodes in document order.
+        :raises: InvalidSelectorException if locator is not supported.
+        """
+        self.__check_not_stale()
+        is_absolute, steps, index = _parse_locator((by, value))
+        context = self.__snapshot._document if is_absolute else self
+        elements = context.__evaluate(steps)
+        if index is None:
+            return elements
+        return [elements[index - 1]] if len(elements) >= index else []
+
+    def click(self) -> None:
+        """Raise error, because elements of snapshot could not be interacted with."""
+        raise WebDriverException("Element of DOM snapshot is read-only")
+
+    def send_keys(self, *value) -> None:
+        """Raise error, because elements of snapshot could not be interacted with."""
+        raise WebDriverException("Element of DOM snapshot is read-only")
+
+    def __repr__(self) -> str:
+        """Get string representation of node."""
+        return f"DomSnapshotNode(tag_name={self.__tag_name!r}, attributes={self.__attributes})"
+
+    def _append(self, content: Union[str, "DomSnapshotNode"]) -> None:
+        self.__contents.append(content)
+
+    def __check_not_stale(self) -> None:
+        if self.__snapshot.is_released:
+            raise StaleElementReferenceException("DOM snapshot was released")
+
+    def __children(self) -> List["DomSnapshotNode"]:
+        return [
+            content
+            for content in self.__contents
+            if isinstance(content, DomSnapshotNode)
+        ]
+
+    def __descendants_or_self(self) -> List["DomSnapshotNode"]:
+        nodes = [self]
+        for child in self.__children():
+            nodes.extend(child.__descendants_or_self())
+        return nodes
+
+    def __is_hidden(self) -> bool:
+        return (
+            self.__tag_name in _HIDDEN_TAGS
+            or "hidden" in self.__attributes
+            or self.__tag_name == "input"
+            and (self.__attributes.get("type") or "").lower() == "hidden"
+            or _HIDDEN_STYLE.search(self.__attributes.get("style") or "") is not None
+        )
+
+    def __is_displayed(self) -> bool:
+        node: Optional[DomSnapshotNode] = self
+        while node is not None and node.__parent is not None:
+            if node.__is_hidden():
+                return False
+            node = node.__parent
+        return True
+
+    def __visible_text(self) -> str:
+        parts = []
+        for content in self.__contents:
+            if not isinstance(content, DomSnapshotNode):
+                parts.append(_COLLAPSIBLE_SPACE.sub(" ", content))
+            elif content.__tag_name == "br":
+                parts.append("\n")
+            elif not content.__is_hidden():
+                separator = _TEXT_SEPARATORS.get(content.__tag_name, "")
+                parts.extend([separator, content.__visible_text(), separator])
+        return "".join(parts)
+
+    def __evaluate(self, steps: Tuple[_Step, ...]) -> List["DomSnapshotNode"]:
+        nodes = [self]
+        for axis, tag, predicates in steps:
+            found: Dict[int, DomSnapshotNode] = {}
+            for node in nodes:
+                parents = node.__descendants_or_self() if axis == "//" else [node]
+                for parent in parents:
+                    candidates = [
+                        child
+                        for child in parent.__children()
+                        if tag == "*" or child.__tag_name == tag
+                    ]
+                    for predicate in predicates:
+                        candidates = _apply_predicate(candidates, predicate)
+                    found.update((child.__order, child) for child in candidates)
+            nodes = [found[order] for order in sorted(found)]
+        return nodes
+
+    def _has_attribute(self, name: str, value: Optional[str]) -> bool:
+        if name not in self.__attributes:
+            return False
+        return value is None or (self.__attributes[name] or "") == value
+
+
+class DomSnapshot:
+    """
+    Read-only copy of element subtree captured at one moment.
+
+    Staleness contract: snapshot reflects the DOM at the moment of capture and is never updated.
+    Snapshot is valid until it is released; after that its nodes behave as stale elements,
+    so elements which cached them are searched in the browser again.
+    Snapshot could be used as context manager which releases it on exit.
+    """
+
+    def __init__(self, html: str):
+        """
+        Parse subtree.
+
+        :param html: Outer HTML of the captured element.
+        """
+        self.__is_released = False
+        self.__document = DomSnapshotNode(self, "#document", {}, None, 0)
+        _SnapshotParser(self, self.__document).feed(html)
+        children = self.__document.children
+        if not children:
+            raise ValueError("DOM snapshot should contain at least one element")
+        self.__root = children[0]
+
+    @property
+    def root(self) -> DomSnapshotNode:
+        """Get node of the captured element."""
+        return self.__root
+
+    @property
+    def is_released(self) -> bool:
+        """Get whether snapshot was released and its nodes are stale."""
+        return self.__is_released
+
+    @property
+    def _document(self) -> DomSnapshotNode:
+        return self.__document
+
+    def find_elements(self, locator: Tuple[By, str]) -> List[DomSnapshotNode]:
+        """
+        Find elements inside of the captured element.
+
+        :param locator: Locator relative to the captured element.
+        :return: List of found nodes in document order.
+        """
+        return self.__root.find_elements(*locator)
+
+    def release(self) -> None:
+        """Release snapshot, so its nodes become stale."""
+        self.__is_released = True
+
+    def __enter__(self) -> "DomSnapshot":
+        """Get snapshot used inside of the context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release snapshot on exit from the context."""
+        self.release()
+
+
+class _SnapshotParser(HTMLParser):
+    def __init__(self, snapshot: DomSnapshot, document: DomSnapshotNode):
+        super().__init__(convert_charrefs=True)
+        self.__snapshot = snapshot
+        self.__stack = [document]
+        self.__tags: List[str] = []
+        self.__count = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        node = self.__create_node(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.__stack.append(node)
+            self.__tags.append(tag)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        self.__create_node(tag, attrs)
+
+    def handle_endtag(self, tag: str):
+        if tag in self.__tags:
+            while self.__tags.pop() != tag:
+                self.__stack.pop()
+            self.__stack.pop()
+
+    def handle_data(self, data: str):
+        self.__stack[-1]._append(data)
+
+    def __create_node(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]]
+    ) -> DomSnapshotNode:
+        self.__count += 1
+        node = DomSnapshotNode(
+            self.__snapshot, tag, dict(attrs), self.__stack[-1], self.__count
+        )
+        self.__stack[-1]._append(node)
+        return node
+
+
+def _apply_predicate(
+    nodes: List[DomSnapshotNode], predicate: _Predicate
+) -> List[DomSnapshotNode]:
+    kind, name, value = predicate
+    if kind == "index":
+        index = int(str(name))
+        return [nodes[index - 1]] if len(nodes) >= index > 0 else []
+    if kind == "class":
+        return [
+            node
+            for node in nodes
+            if str(name) in (node.get_attribute("class") or "").split()
+        ]
+    return [node for node in nodes if node._has_attribute(str(name), value)]
+
+
+def _parse_locator(
+    locator: Tuple[By, str]
+) -> Tuple[bool, Tuple[_Step, ...], Optional[int]]:
+    strategy, value = locator
+    xpath_locator = to_xpath((strategy, value))
+    if xpath_locator is None:
+        raise InvalidSelectorException(
+            f"Locator {locator} is not supported by DOM snapshot"
+        )
+    xpath = xpath_locator[1] if strategy == By.XPATH else f".{xpath_locator[1]}"
+    parsed = _parse_xpath(xpath.strip())
+    if parsed is None:
+        raise InvalidSelectorException(
+            f"Locator {locator} is not supported by DOM snapshot"
+        )
+    return parsed
+
+
+@lru_cache(maxsize=LOCATOR_CACHE_SIZE)
+def _parse_xpath(xpath: str) -> Optional[Tuple[bool, Tuple[_Step, ...], Optional[int]]]:
+    match = _POSITIONED_PATH.match(xpath)
+    if match is not None:
+        parsed = _parse_xpath(match.group("path").strip())
+        if parsed is None or parsed[2] is not None:
+            return None
+        return parsed[0], parsed[1], int(match.group("index"))
+    is_absolute = xpath.startswith("/")
+    path = xpath[1:] if xpath.startswith(".") else xpath
+    if not path.startswith("/"):
+        path = f"/{path}"
+    steps = []
+    position = 0
+    while position < len(path):
+        step = _PATH_STEP.match(path, position)
+        if step is None:
+            return None
+        predicates = []
+        for predicate in _PREDICATE.findall(step.group("predicates")):
+            parsed_predicate = _parse_predicate(predicate)
+            if parsed_predicate is None:
+                return None
+            predicates.append(parsed_predicate)
+        steps.append((step.group("axis"), step.group("tag"), tuple(predicates)))
+        position = step.end()
+    return is_absolute, tuple(steps), None
+
+
+def _parse_predicate(predicate: str) -> Optional[_Predicate]:
+    match = _INDEX_PREDICATE.match(predicate)
+    if match is not None:
+        return "index", match.group("index"), None
+    match = _CLASS_PREDICATE.match(predicate)
+    if match is not None:
+        return "class", match.group("class"), None
+    match = _ATTRIBUTE_PREDICATE.match(predicate)
+    if match is not None:
+        value = (
+            match.group("double")
+            if match.group("double") is not None
+            else match.group("single")
+        )
+        return "attribute", match.group("attribute"), value
+    return None
@@ -6,9 +6,12 @@ from datetime import timedelta
 from typing import Callable
 from typing import cast
 from typing import List
+from typing import Optional
 from typing import Tuple
+from typing import TYPE_CHECKING
 
 from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
@@ -20,11 +23,11 @@ from aquality_selenium_core.configurations.element_cache_configuration import (
 from aquality_selenium_core.configurations.logger_configuration import (
     AbstractLoggerConfiguration,
 )
+from aquality_selenium_core.elements.dom_snapshot import DomSnapshot
 from aquality_selenium_core.elements.element_cache_handler import (
     AbstractElementCacheHandler,
 )
 from aquality_selenium_core.elements.element_cache_handler import ElementCacheHandler
-from aquality_selenium_core.elements.element_factory import AbstractElementFactory
 from aquality_selenium_core.elements.element_finder import AbstractElementFinder
 from aquality_selenium_core.elements.element_state import Displayed
 from aquality_selenium_core.elements.element_state_provider import (
@@ -47,6 +50,9 @@ from aquality_selenium_core.utilities.element_action_retrier import (
 )
 from aquality_selenium_core.waitings.conditional_wait import AbstractConditionalWait
 
+if TYPE_CHECKING:
+    from aquality_selenium_core.elements.element_factory import AbstractElementFactory
+
 
 class AbstractElement(AbstractParent, ABC):
     """Base class for any custom element."""
@@ -59,6 +65,7 @@ class AbstractElement(AbstractParent, ABC):
         self.__name = name
         self.__element_state = state
         self.__element_cache_handler = cast(AbstractElementCacheHandler, None)
+        self.__dom_snapshot = cast(DomSnapshot, None)
 
     @property
     def locator(self) -> Tuple[By, str]:
@@ -92,11 +99,14 @@ class AbstractElement(AbstractParent, ABC):
         """
         if self._cache_configuration.is_enabled:
             return CachedElementStateProvider(
-                self.locator, self._conditional_wait, self._cache
+                self.locator, self._conditional_wait, self._cache, self._application
             )
         else:
             return ElementStateProvider(
-                self.locator, self._conditional_wait, self._element_finder
+                self.locator,
+                self._conditional_wait,
+                self._element_finder,
+                self._application,
             )
 
     @property
@@ -168,9 +178,28 @@ class AbstractElement(AbstractParent, ABC):
                 self.__log_page_source()
             raise
 
+    def capture_dom_snapshot(self) -> DomSnapshot:
+        """
+        Capture subtree of the element for read-only checks without browser calls.
+
+        Until the snapshot is released, child elements of this element are searched in the snapshot,
+        so their texts, attributes and states are read locally and reflect the DOM at the moment of capture.
+        Child elements could not be interacted with while snapshot is active.
+        :return: Snapshot of the element, which could be used as context manager releasing it on exit.
+        """
+        html = self._do_with_retry(
+            lambda: str(self.get_element().get_attribute("outerHTML"))
+        )
+        if self.__dom_snapshot is not None:
+            self.__dom_snapshot.release()
+        self.__dom_snapshot = DomSnapshot(html)
+        return self.__dom_snapshot
+
     def __log_page_source(self) -> None:
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
         try:
-            logging.debug(f"Page source:\n{self._application.driver.page_source}")
+            logging.debug("Page source:\n%s", self._application.driver.page_source)
         except WebDriverException:
             logging.error("An exception occurred while tried to save the page source")
 
@@ -181,7 +210,7 @@ class AbstractElement(AbstractParent, ABC):
 
     @property
     @abstractmethod
-    def _element_factory(self) -> AbstractElementFactory:
+    def _element_factory(self) -> "AbstractElementFactory":
         pass
 
     @property
@@ -225,21 +254,55 @@ class AbstractElement(AbstractParent, ABC):
 
     @property
     def _cache(self) -> AbstractElementCacheHandler:
-        if self.__element_cache_handler is None:
-            self.__element_cache_handler = ElementCacheHandler(
-                self.__locator, self.__element_state, self._element_finder
-            )
-        return self.__element_cache_handler
+        application = self._application
+        if application is None or not self._cache_configuration.is_enabled:
+            if self.__element_cache_handler is None:
+                self.__element_cache_handler = self.__create_cache_handler()
+            return self.__element_cache_handler
+        registry = application.element_cache_registry
+        return registry.get_handler(
+            self,
+            lambda: self.__create_cache_handler(lambda: registry.generation),
+            self._cache_configuration,
+        )
+
+    def __create_cache_handler(
+        self, generation_supplier: Callable[[], int] = cast(Callable, None)
+    ) -> AbstractElementCacheHandler:
+        return ElementCacheHandler(
+            self.__locator,
+            self.__element_state,
+            self._element_finder,
+            self._cache_configuration,
+            generation_supplier,
+        )
+
+    def _seed_cache(self, element: WebElement) -> None:
+        if self._cache_configuration.is_enabled:
+            self._cache.seed_element(element)
+
+    @property
+    def _dom_snapshot(self) -> Optional[DomSnapshot]:
+        snapshot = self.__dom_snapshot
+        return snapshot if snapshot is not None and not snapshot.is_released else None
 
     def _log_element_action(
         self, message_key: str, *message_args, **logger_kwargs
     ) -> None:
         self._localized_logger.info_element_action(
-            self._element_type, self.name, message_key, message_args, logger_kwargs
+            self._element_type, self.name, message_key, *message_args, **logger_kwargs
         )
 
     def _do_with_retry(self, expression: Callable[..., TReturn]) -> TReturn:
-        return self._element_action_retrier.do_with_retry(expression)
+        def invalidating_expression() -> TReturn:
+            try:
+                return expression()
+            except StaleElementReferenceException:
+                if self._cache_configuration.is_enabled:
+                    self._cache.invalidate()
+                raise
+
+        return self._element_action_retrier.do_with_retry(invalidating_expression)
 
     def find_child_element(
         self,
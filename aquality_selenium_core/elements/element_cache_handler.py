@@ -1,14 +1,23 @@
 """Module defines abstraction for cached element handler."""
+import time
 from abc import ABC
 from abc import abstractmethod
 from datetime import timedelta
+from typing import Any
 from typing import Callable
 from typing import cast
 from typing import Tuple
 
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+from aquality_selenium_core.configurations.element_cache_configuration import (
+    AbstractElementCacheConfiguration,
+)
+from aquality_selenium_core.configurations.element_cache_configuration import (
+    ElementCacheMode,
+)
 from aquality_selenium_core.elements.element_finder import AbstractElementFinder
 from aquality_selenium_core.elements.element_state import Displayed
 
@@ -49,27 +58,94 @@ class AbstractElementCacheHandler(ABC):
         """
         pass
 
+    @abstractmethod
+    def seed_element(self, element: WebElement) -> None:
+        """
+        Put already found element to the cache, so it is not searched again on first use.
+
+        :param element: Element found by locator of the handler.
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Forget cached element, so it is searched again on next use."""
+        pass
+
+    @property
+    @abstractmethod
+    def hits_count(self) -> int:
+        """Get number of times cached element was used without search."""
+        pass
+
+    @property
+    @abstractmethod
+    def misses_count(self) -> int:
+        """Get number of times element was searched because cache was empty or invalid."""
+        pass
+
 
 class ElementCacheHandler(AbstractElementCacheHandler):
-    """Allows to use cached element."""
+    """
+    Allows to use cached element.
+
+    In validating mode element's state is checked with WebDriver before each use.
+    In optimistic mode cached element is used as is until it is invalidated after StaleElementReferenceException,
+    document generation changes or revalidation interval passes.
+    """
 
     def __init__(
         self,
         locator: Tuple[By, str],
         state: Callable[[WebElement], bool],
         finder: AbstractElementFinder,
+        configuration: AbstractElementCacheConfiguration = cast(
+            AbstractElementCacheConfiguration, None
+        ),
+        generation_supplier: Callable[[], Any] = cast(Callable, None),
     ):
-        """Initialize handler with default state and finder."""
+        """
+        Initialize handler with default state and finder.
+
+        :param locator: Element locator.
+        :param state: Element state.
+        :param finder: Finder used to search the element.
+        :param configuration: Cache configuration. Validating mode is used if not set.
+        :param generation_supplier: Optional function which result changes when the document changes.
+        Element cached for another document generation is searched again.
+        """
         self.__locator = locator
         self.__state = state
         self.__element_finder = finder
+        self.__is_optimistic = (
+            configuration is not None
+            and configuration.mode == ElementCacheMode.OPTIMISTIC
+        )
+        self.__revalidation_interval = (
+            configuration.revalidation_interval if self.__is_optimistic else None
+        )
+        self.__generation_supplier = generation_supplier
         self.__remote_element = None
+        self.__generation: Any = None
+        self.__validated_at = 0.0
+        self.__hits_count = 0
+        self.__misses_count = 0
 
     @property
     def is_stale(self) -> bool:
         """Determine whether the element stale or not."""
         return self.__remote_element is not None and self.is_refresh_needed()
 
+    @property
+    def hits_count(self) -> int:
+        """Get number of times cached element was used without search."""
+        return self.__hits_count
+
+    @property
+    def misses_count(self) -> int:
+        """Get number of times element was searched because cache was empty or invalid."""
+        return self.__misses_count
+
     def is_refresh_needed(
         self, custom_state: Callable[[WebElement], bool] = cast(Callable, None)
     ) -> bool:
@@ -79,11 +155,15 @@ class ElementCacheHandler(AbstractElementCacheHandler):
         :param custom_state: Element custom state.
         :return: true if needed and false otherwise.
         """
-        if self.__remote_element is None:
+        if self.__remote_element is None or self.__is_generation_changed():
             return True
 
         state = self.__state if custom_state is None else custom_state
-        is_displayed = self.__remote_element.is_displayed()
+        try:
+            is_displayed = self.__remote_element.is_displayed()
+        except StaleElementReferenceException:
+            return True
+        self.__validated_at = time.monotonic()
         return isinstance(state, Displayed) and not is_displayed
 
     def get_element(
@@ -98,8 +178,58 @@ class ElementCacheHandler(AbstractElementCacheHandler):
         :param custom_state: Element custom state.
         :return: Cached element.
         """
-        if self.is_refresh_needed(custom_state):
-            self.__remote_element = self.__element_finder.find_element(
-                self.__locator, self.__state, timeout
+        if self.__is_cached_element_trusted(custom_state):
+            self.__hits_count += 1
+        elif self.is_refresh_needed(custom_state):
+            self.__misses_count += 1
+            self.seed_element(
+                self.__element_finder.find_element(
+                    self.__locator, self.__state, timeout
+                )
             )
+        else:
+            self.__hits_count += 1
         return self.__remote_element
+
+    def seed_element(self, element: WebElement) -> None:
+        """
+        Put already found element to the cache, so it is not searched again on first use.
+
+        :param element: Element found by locator of the handler.
+        """
+        self.__remote_element = element
+        self.__generation = self.__get_generation()
+        self.__validated_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Forget cached element, so it is searched again on next use."""
+        self.__remote_element = None
+
+    def __is_cached_element_trusted(
+        self, custom_state: Callable[[WebElement], bool]
+    ) -> bool:
+        if (
+            not self.__is_optimistic
+            or custom_state is not None
+            or self.__remote_element is None
+            or self.__is_generation_changed()
+        ):
+            return False
+        return (
+            self.__revalidation_interval is None
+            or time.monotonic() - self.__validated_at
+            < self.__revalidation_interval.total_seconds()
+        )
+
+    def __is_generation_changed(self) -> bool:
+        return (
+            self.__generation_supplier is not None
+            and self.__get_generation() != self.__generation
+        )
+
+    def __get_generation(self) -> Any:
+        return (
+            self.__generation_supplier()
+            if self.__generation_supplier is not None
+            else None
+        )
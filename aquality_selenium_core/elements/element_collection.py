@@ -0,0 +1,122 @@
+"""Module defines lazy collection of elements."""
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import Generic
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import overload
+from typing import Tuple
+from typing import Union
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from aquality_selenium_core.elements.parent import TElement
+
+DEFAULT_CHUNK_SIZE = 50
+
+
+class ElementCollection(Generic[TElement]):
+    """
+    Lazy list of elements which are resolved in chunks on demand.
+
+    Number of elements is fixed when the first chunk is loaded.
+    Each next chunk reflects the DOM at the moment of its loading.
+    """
+
+    def __init__(
+        self,
+        chunk_loader: Callable[[int, int], Tuple[int, List[WebElement]]],
+        element_builder: Callable[[int, WebElement], TElement],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Initialize collection with chunk loader and element builder.
+
+        :param chunk_loader: Function which gets start and end indexes and returns total number of elements
+        and elements found in this range.
+        :param element_builder: Function which creates element by its zero-based index and found WebElement.
+        :param chunk_size: Number of elements loaded at once.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size should be positive, got {chunk_size}")
+        self.__chunk_loader = chunk_loader
+        self.__element_builder = element_builder
+        self.__chunk_size = chunk_size
+        self.__length: Optional[int] = None
+        self.__elements: Dict[int, TElement] = {}
+
+    def __len__(self) -> int:
+        """Get number of elements."""
+        if self.__length is None:
+            self.__load_chunk(0)
+        return cast(int, self.__length)
+
+    @overload
+    def __getitem__(self, index: int) -> TElement:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[TElement]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TElement, List[TElement]]:
+        """
+        Get element by index or list of elements by slice.
+
+        Only chunks containing requested elements are loaded.
+        """
+        if isinstance(index, slice):
+            return [self[item] for item in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index not in self.__elements and 0 <= index < self.__known_length(index):
+            self.__load_chunk(index - index % self.__chunk_size)
+        if index not in self.__elements:
+            if not 0 <= index < len(self):
+                raise IndexError("Element collection index out of range")
+            raise IndexError(
+                f"Element with index {index} is not found anymore, the page has changed"
+            )
+        return self.__elements[index]
+
+    def __iter__(self) -> Iterator[TElement]:
+        """Iterate over elements loading chunks one by one."""
+        index = 0
+        while index < len(self):
+            yield self[index]
+            index += 1
+
+    def first(
+        self, predicate: Callable[[TElement], bool] = lambda element: True
+    ) -> Optional[TElement]:
+        """
+        Get first element which satisfies predicate.
+
+        Chunks after the found element are not loaded.
+        :param predicate: Condition for element.
+        :return: First suitable element or None if there are no such elements.
+        """
+        return next(self.filter(predicate), None)
+
+    def filter(self, predicate: Callable[[TElement], bool]) -> Iterator[TElement]:
+        """
+        Lazily filter elements.
+
+        :param predicate: Condition for element.
+        :return: Iterator over suitable elements.
+        """
+        return (element for element in self if predicate(element))
+
+    def __known_length(self, index: int) -> int:
+        return self.__length if self.__length is not None else index + 1
+
+    def __load_chunk(self, start: int) -> None:
+        total, web_elements = self.__chunk_loader(start, start + self.__chunk_size)
+        if self.__length is None:
+            self.__length = total
+        for offset, web_element in enumerate(web_elements):
+            index = start + offset
+            if index < self.__length:
+                self.__elements[index] = self.__element_builder(index, web_element)
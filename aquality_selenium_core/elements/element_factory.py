@@ -3,22 +3,46 @@ from abc import ABC
 from abc import abstractmethod
 from datetime import timedelta
 from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Optional
 from typing import Tuple
+from typing import TypeVar
 
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+from aquality_selenium_core.applications.application import AbstractApplication
+from aquality_selenium_core.elements.browser_scripts import filter_elements_in_state
+from aquality_selenium_core.elements.browser_scripts import find_elements_by_queries
+from aquality_selenium_core.elements.browser_scripts import get_script_locator
+from aquality_selenium_core.elements.browser_scripts import get_script_query
+from aquality_selenium_core.elements.browser_scripts import get_script_state
+from aquality_selenium_core.elements.bulk_reader import read_attributes
+from aquality_selenium_core.elements.bulk_reader import read_texts
+from aquality_selenium_core.elements.bulk_reader import ReadTarget
+from aquality_selenium_core.elements.child_locator import ChildLocator
 from aquality_selenium_core.elements.element import AbstractElement
+from aquality_selenium_core.elements.element_collection import DEFAULT_CHUNK_SIZE
+from aquality_selenium_core.elements.element_collection import ElementCollection
 from aquality_selenium_core.elements.element_finder import AbstractElementFinder
 from aquality_selenium_core.elements.element_state import Displayed
+from aquality_selenium_core.elements.element_state import ExistsInAnyState
 from aquality_selenium_core.elements.elements_count import ElementsCount
+from aquality_selenium_core.elements.fallback_locator import FallbackLocator
+from aquality_selenium_core.elements.locator_compiler import to_xpath
 from aquality_selenium_core.elements.parent import TElement
 from aquality_selenium_core.localization.localization_manager import (
     AbstractLocalizationManager,
 )
+from aquality_selenium_core.utilities.java_script import JavaScript
 from aquality_selenium_core.waitings.conditional_wait import AbstractConditionalWait
 
+TResult = TypeVar("TResult")
+
 
 class AbstractElementFactory(ABC):
     """Defines the interface used to create the elements."""
@@ -115,6 +139,65 @@ class AbstractElementFactory(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_element_collection(
+        self,
+        element_supplier: Callable[
+            [Tuple[By, str], str, Callable[[WebElement], bool]], TElement
+        ],
+        locator: Tuple[By, str],
+        name: str = "",
+        state: Callable[[WebElement], bool] = Displayed(),
+        expected_count: ElementsCount = ElementsCount.ANY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ElementCollection[TElement]:
+        """
+        Find lazy collection of elements by base locator.
+
+        Elements are resolved in chunks when they are accessed.
+        :param element_supplier: Callable object that defines constructor of element in case of custom element.
+        :param locator: Base elements locator.
+        :param name: Elements name.
+        :param state: Elements state.
+        :param expected_count: Expected number of elements that have to be found (zero, more than zero, any).
+        :param chunk_size: Number of elements resolved at once.
+        :return: Lazy collection of elements that found by locator.
+        """
+        pass
+
+    @abstractmethod
+    def prefetch(self, elements: List[AbstractElement]) -> int:
+        """
+        Find several elements at once and put them to their caches.
+
+        :param elements: Elements to find, e.g. elements declared in a page object.
+        :return: Number of elements put to cache.
+        """
+        pass
+
+    @abstractmethod
+    def texts(self, elements: Iterable[AbstractElement]) -> List[str]:
+        """
+        Get visible texts of several elements at once.
+
+        :param elements: Elements to read, e.g. elements of a list or collection.
+        :return: Texts in order of elements.
+        """
+        pass
+
+    @abstractmethod
+    def attributes(
+        self, elements: Iterable[AbstractElement], names: Iterable[str]
+    ) -> Dict[str, List[Optional[str]]]:
+        """
+        Get attributes of several elements at once.
+
+        :param elements: Elements to read, e.g. elements of a list or collection.
+        :param names: Names of attributes to read.
+        :return: Dictionary of attribute names and values in order of elements, None for absent attributes.
+        """
+        pass
+
 
 class ElementFactory(AbstractElementFactory):
     """Factory that creates elements."""
@@ -124,11 +207,21 @@ class ElementFactory(AbstractElementFactory):
         conditional_wait: AbstractConditionalWait,
         element_finder: AbstractElementFinder,
         localization_manager: AbstractLocalizationManager,
+        application: AbstractApplication = cast(AbstractApplication, None),
     ):
-        """Initialize factory with required dependencies."""
+        """
+        Initialize factory with required dependencies.
+
+        :param conditional_wait: Utility used to wait for elements count.
+        :param element_finder: Finder of elements.
+        :param localization_manager: Localization manager.
+        :param application: Optional application used to resolve element collections in chunks by scripts.
+        Without it element collections are found at once.
+        """
         self._conditional_wait = conditional_wait
         self._element_finder = element_finder
         self._localization_manager = localization_manager
+        self._application = application
 
     def get_custom_element(
         self,
@@ -171,9 +264,7 @@ class ElementFactory(AbstractElementFactory):
         :return: Instance of child element.
         """
         element_name = name if name else f"Child element of {parent_element.name}"
-        locator = self._generate_absolute_child_locator(
-            parent_element.locator, child_locator
-        )
+        locator = self._generate_child_locator(parent_element, child_locator)
         return element_supplier(locator, element_name, state)
 
     def find_child_elements(
@@ -199,9 +290,7 @@ class ElementFactory(AbstractElementFactory):
         :return: Instance of child element.
         """
         elements_name = name if name else f"Child element of {parent_element.name}"
-        locator = self._generate_absolute_child_locator(
-            parent_element.locator, child_locator
-        )
+        locator = self._generate_child_locator(parent_element, child_locator)
         return self.find_elements(
             element_supplier, locator, elements_name, state, expected_count
         )
@@ -226,51 +315,328 @@ class ElementFactory(AbstractElementFactory):
         :param expected_count: Expected number of elements that have to be found (zero, more than zero, any).
         :return: List of elements that found by locator.
         """
-        self.__check_elements_count(locator, state, expected_count)
+        web_elements = self.__find_elements_with_expected_count(
+            locator, state, expected_count
+        )
+
+        return [
+            self.__create_list_element(
+                element_supplier, locator, name, state, element_index, web_element
+            )
+            for element_index, web_element in web_elements
+        ]
+
+    def find_element_collection(
+        self,
+        element_supplier: Callable[
+            [Tuple[By, str], str, Callable[[WebElement], bool]], TElement
+        ],
+        locator: Tuple[By, str],
+        name: str = "",
+        state: Callable[[WebElement], bool] = Displayed(),
+        expected_count: ElementsCount = ElementsCount.ANY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ElementCollection[TElement]:
+        """
+        Find lazy collection of elements by base locator.
+
+        Elements are resolved in chunks when they are accessed.
+        :param element_supplier: Callable object that defines constructor of element in case of custom element.
+        :param locator: Base elements locator.
+        :param name: Elements name.
+        :param state: Elements state.
+        :param expected_count: Expected number of elements that have to be found (zero, more than zero, any).
+        :param chunk_size: Number of elements resolved at once.
+        :return: Lazy collection of elements that found by locator.
+        """
+        script_locator = get_script_locator(locator)
+        script_state = get_script_state(state)
+        positions: Dict[int, int] = {}
+        if self._application is None or script_locator is None or script_state is None:
+            found_elements = self.__find_elements_with_expected_count(
+                locator, state, expected_count
+            )
+            web_elements = [web_element for _, web_element in found_elements]
+            positions.update(
+                (index, position) for index, (position, _) in enumerate(found_elements)
+            )
+
+            def chunk_loader(start: int, end: int) -> Tuple[int, List[WebElement]]:
+                return len(web_elements), web_elements[start:end]
+
+        else:
+            known_total: Dict[str, int] = {}
+
+            def load_range(
+                start: int, end: int, count_all: bool
+            ) -> Tuple[int, List[WebElement]]:
+                total, web_elements, found_positions = self.__driver.execute_script(
+                    JavaScript.FIND_ELEMENTS_RANGE.script,
+                    *script_locator,
+                    script_state,
+                    start,
+                    end,
+                    count_all,
+                )
+                positions.update(
+                    (start + offset, position)
+                    for offset, position in enumerate(found_positions)
+                )
+                if count_all:
+                    known_total["value"] = total
+                return known_total["value"], web_elements
+
+            def chunk_loader(start: int, end: int) -> Tuple[int, List[WebElement]]:
+                return load_range(start, end, "value" not in known_total)
+
+            self.__wait_for_elements_count(
+                locator, lambda: load_range(0, 0, True)[0] > 0, expected_count
+            )
+
+        return ElementCollection(
+            chunk_loader,
+            lambda index, web_element: self.__create_list_element(
+                element_supplier,
+                locator,
+                name,
+                state,
+                positions.get(index, index + 1),
+                web_element,
+            ),
+            chunk_size,
+        )
+
+    def prefetch(self, elements: List[AbstractElement]) -> int:
+        """
+        Find several elements at once and put them to their caches.
+
+        Elements are searched with one script call. Elements with disabled cache, elements which locator
+        or state could not be evaluated by script and elements which are not found are skipped,
+        so they are searched as usual when used. Nothing is prefetched if factory has no application.
+        :param elements: Elements to find, e.g. elements declared in a page object.
+        :return: Number of elements put to cache.
+        """
+        if self._application is None:
+            return 0
+        prefetched_elements = []
+        queries = []
+        for element in elements:
+            query = get_script_query(element.locator, element._element_state)
+            if query is not None and element._cache_configuration.is_enabled:
+                prefetched_elements.append(element)
+                queries.append(query)
+        found_elements = find_elements_by_queries(
+            self._application.driver, queries, limit=1
+        )
+        if not found_elements:
+            return 0
+        seeded_count = 0
+        for element, web_elements in zip(prefetched_elements, found_elements):
+            if web_elements:
+                element._seed_cache(web_elements[0])
+                seeded_count += 1
+        return seeded_count
+
+    def texts(self, elements: Iterable[AbstractElement]) -> List[str]:
+        """
+        Get visible texts of several elements at once.
+
+        Texts are read with one script call. Elements with enabled cache are taken from their caches,
+        other elements are found by their locators inside of the same script when it is possible.
+        Without application texts are read with separate WebDriver commands.
+        :param elements: Elements to read, e.g. elements of a list or collection.
+        :return: Texts in order of elements.
+        """
+        return self.__read_elements(
+            list(elements),
+            lambda targets, resolve_element: read_texts(
+                self.__driver, targets, resolve_element
+            ),
+        )
+
+    def attributes(
+        self, elements: Iterable[AbstractElement], names: Iterable[str]
+    ) -> Dict[str, List[Optional[str]]]:
+        """
+        Get attributes of several elements at once.
+
+        Attributes are read with one script call. Elements with enabled cache are taken from their caches,
+        other elements are found by their locators inside of the same script when it is possible.
+        Without application attributes are read with separate WebDriver commands.
+        Result is columnar, so it could be passed to e.g. pandas.DataFrame.
+        :param elements: Elements to read, e.g. elements of a list or collection.
+        :param names: Names of attributes to read.
+        :return: Dictionary of attribute names and values in order of elements, None for absent attributes.
+        """
+        attribute_names = list(names)
+        return self.__read_elements(
+            list(elements),
+            lambda targets, resolve_element: read_attributes(
+                self.__driver, targets, attribute_names, resolve_element
+            ),
+        )
+
+    @property
+    def __driver(self):
+        return self._application.driver if self._application is not None else None
 
-        web_elements = self._element_finder.find_elements(locator, state, timedelta())
+    def __read_elements(
+        self,
+        elements: List[AbstractElement],
+        reader: Callable[[List[ReadTarget], Callable[[int], WebElement]], TResult],
+    ) -> TResult:
+        def resolve_element(index: int) -> WebElement:
+            return elements[index].get_element()
 
-        found_elements: List[TElement] = []
-        for element_index in range(1, len(web_elements) + 1):
-            element_locator = self._generate_xpath_locator(locator, element_index)
-            element_name = f"{name if name else 'element'} {element_index}"
-            found_elements.append(
-                element_supplier(element_locator, element_name, state)
+        try:
+            return reader(
+                [self.__get_read_target(element) for element in elements],
+                resolve_element,
+            )
+        except StaleElementReferenceException:
+            for element in elements:
+                if element._cache_configuration.is_enabled:
+                    element._cache.invalidate()
+            return reader(
+                [element.get_element() for element in elements], resolve_element
             )
-        return found_elements
 
-    def __check_elements_count(
+    def __get_read_target(self, element: AbstractElement) -> ReadTarget:
+        if (
+            self._application is not None
+            and not element._cache_configuration.is_enabled
+        ):
+            query = get_script_query(element.locator, element._element_state)
+            if query is not None:
+                return query
+        return element.get_element()
+
+    def __create_list_element(
+        self,
+        element_supplier: Callable[
+            [Tuple[By, str], str, Callable[[WebElement], bool]], TElement
+        ],
+        locator: Tuple[By, str],
+        name: str,
+        state: Callable[[WebElement], bool],
+        element_index: int,
+        web_element: WebElement,
+    ) -> TElement:
+        element_locator = self._generate_list_element_locator(locator, element_index)
+        element_name = f"{name if name else 'element'} {element_index}"
+        element = element_supplier(element_locator, element_name, state)
+        if isinstance(element, AbstractElement):
+            element._seed_cache(web_element)
+        return element
+
+    def __find_elements_with_expected_count(
         self,
         locator: Tuple[By, str],
         state: Callable[[WebElement], bool] = Displayed(),
         expected_count: ElementsCount = ElementsCount.ANY,
+    ) -> List[Tuple[int, WebElement]]:
+        elements: Dict[str, List[Tuple[int, WebElement]]] = {"found": []}
+
+        def find_elements_func() -> List[Tuple[int, WebElement]]:
+            found_elements = self._element_finder.find_elements(
+                locator, ExistsInAnyState(), timedelta()
+            )
+            elements_in_state = {
+                id(web_element)
+                for web_element in self.__filter_elements_in_state(
+                    found_elements, state
+                )
+            }
+            elements["found"] = [
+                (element_index, web_element)
+                for element_index, web_element in enumerate(found_elements, start=1)
+                if id(web_element) in elements_in_state
+            ]
+            return elements["found"]
+
+        self.__wait_for_elements_count(
+            locator, lambda: any(find_elements_func()), expected_count
+        )
+        return elements["found"]
+
+    def __filter_elements_in_state(
+        self, web_elements: List[WebElement], state: Callable[[WebElement], bool]
+    ) -> List[WebElement]:
+        if self._application is None:
+            return list(filter(state, web_elements))
+        return filter_elements_in_state(self._application.driver, web_elements, state)
+
+    def __wait_for_elements_count(
+        self,
+        locator: Tuple[By, str],
+        are_elements_found: Callable[[], bool],
+        expected_count: ElementsCount,
     ) -> None:
         if expected_count == ElementsCount.ZERO:
             self._conditional_wait.wait_for_true(
-                lambda: not any(
-                    self._element_finder.find_elements(locator, state, timedelta())
-                ),
+                lambda: not are_elements_found(),
                 message=self._localization_manager.get_localized_message(
                     "loc.elements.found.but.should.not", locator, "desired"
                 ),
             )
         elif expected_count == ElementsCount.MORE_THAN_ZERO:
             self._conditional_wait.wait_for_true(
-                lambda: any(
-                    self._element_finder.find_elements(locator, state, timedelta())
-                ),
+                are_elements_found,
                 message=self._localization_manager.get_localized_message(
                     "loc.no.elements.found.by.locator", locator
                 ),
             )
         elif expected_count == ElementsCount.ANY:
-            self._conditional_wait.wait_for(
-                lambda: self._element_finder.find_elements(locator, state, timedelta())
-                is not None
-            )
+            are_elements_found()
         else:
             raise ValueError(f"No such expected value: {expected_count}")
 
+    def _generate_child_locator(
+        self, parent_element: AbstractElement, child_locator: Tuple[By, str]
+    ) -> ChildLocator:
+        absolute_locator = None
+        parent_locator = parent_element.locator
+        if isinstance(parent_locator, ChildLocator):
+            parent_locator = parent_locator.absolute_locator
+        if (
+            parent_locator is not None
+            and not isinstance(parent_locator, FallbackLocator)
+            and not isinstance(child_locator, FallbackLocator)
+            and self._is_locator_supported_for_xpath_extraction(parent_locator)
+            and self._is_locator_supported_for_xpath_extraction(child_locator)
+        ):
+            absolute_locator = self._generate_absolute_child_locator(
+                parent_locator, child_locator
+            )
+        return ChildLocator(
+            parent_element, child_locator, absolute_locator=absolute_locator
+        )
+
+    def _generate_list_element_locator(
+        self, base_locator: Tuple[By, str], element_index: int
+    ) -> Tuple[By, str]:
+        if isinstance(base_locator, ChildLocator):
+            absolute_locator = (
+                self._generate_xpath_locator(
+                    base_locator.absolute_locator, element_index
+                )
+                if base_locator.absolute_locator is not None
+                else None
+            )
+            return base_locator.with_index(element_index, absolute_locator)
+        if isinstance(base_locator, FallbackLocator):
+            locators = [
+                self._generate_xpath_locator(locator, element_index)
+                for locator in base_locator.locators
+                if self._is_locator_supported_for_xpath_extraction(locator)
+            ]
+            if not locators:
+                raise ValueError(
+                    f"Multiple elements' base_locator type {base_locator} is not supported yet"
+                )
+            return FallbackLocator(locators)
+        return self._generate_xpath_locator(base_locator, element_index)
+
     def _generate_absolute_child_locator(
         self, parent_locator: Tuple[By, str], child_locator: Tuple[By, str]
     ) -> Tuple[By, str]:
@@ -305,15 +671,13 @@ class ElementFactory(AbstractElementFactory):
 
     @staticmethod
     def _is_locator_supported_for_xpath_extraction(locator: Tuple[By, str]) -> bool:
-        return locator[0] in [By.XPATH, By.TAG_NAME]
+        return to_xpath(locator) is not None
 
     @staticmethod
     def _extract_xpath_from_locator(locator: Tuple[By, str]) -> str:
-        locator_type = locator[0]
-        locator_value = locator[1]
-        locators_map = {By.XPATH: locator_value, By.TAG_NAME: f"//{locator_value}"}
-        if locator_type not in locators_map:
-            ValueError(
-                f"Cannot define xpath from locator {locator_value}. Locator type {locator_type} is not supported yet."
+        xpath_locator = to_xpath(locator)
+        if xpath_locator is None:
+            raise ValueError(
+                f"Cannot define xpath from locator {locator[1]}. Locator type {locator[0]} is not supported yet."
             )
-        return locators_map[locator_type]
+        return xpath_locator[1]
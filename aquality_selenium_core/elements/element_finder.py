@@ -1,4 +1,5 @@
 """Module defines abstraction for element finder."""
+import time
 from abc import ABC
 from abc import abstractmethod
 from datetime import timedelta
@@ -14,8 +15,16 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
+from aquality_selenium_core.elements.browser_scripts import filter_elements_in_state
+from aquality_selenium_core.elements.browser_scripts import find_elements_by_queries
+from aquality_selenium_core.elements.browser_scripts import get_script_query
+from aquality_selenium_core.elements.browser_wait_engine import BrowserWaitEngine
+from aquality_selenium_core.elements.child_locator import find_elements_by_locator
 from aquality_selenium_core.elements.desired_state import DesiredState
 from aquality_selenium_core.elements.element_state import ExistsInAnyState
+from aquality_selenium_core.elements.fallback_locator import FallbackLocator
+from aquality_selenium_core.elements.fallback_locator import FallbackMatch
+from aquality_selenium_core.elements.locator_compiler import compile_locator
 from aquality_selenium_core.localization.localized_logger import AbstractLocalizedLogger
 from aquality_selenium_core.waitings.conditional_wait import AbstractConditionalWait
 
@@ -75,16 +84,62 @@ class AbstractElementFinder(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_many(
+        self,
+        locators: List[Tuple[By, str]],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+    ) -> Dict[Tuple[By, str], List[WebElement]]:
+        """
+        Find elements by several locators at once without waiting.
+
+        :param locators: Element locators.
+        :param desired_state: desired elements state as callable object.
+        :return: Elements in desired state found by each locator.
+        """
+        pass
+
+    @abstractmethod
+    def wait_for_many(
+        self,
+        locators: List[Tuple[By, str]],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+        timeout: timedelta = cast(timedelta, None),
+    ) -> Dict[Tuple[By, str], List[WebElement]]:
+        """
+        Wait for elements found by each of several locators, polling all locators together.
+
+        :param locators: Element locators.
+        :param desired_state: desired elements state as callable object.
+        :param timeout: timeout for search.
+        :return: Elements in desired state found by each locator, empty lists for locators not found in time.
+        """
+        pass
+
 
 class ElementFinder(AbstractElementFinder):
     """Provides ability to find elements by locator and search criteria."""
 
     def __init__(
-        self, logger: AbstractLocalizedLogger, conditional_wait: AbstractConditionalWait
+        self,
+        logger: AbstractLocalizedLogger,
+        conditional_wait: AbstractConditionalWait,
+        wait_engine: BrowserWaitEngine = cast(BrowserWaitEngine, None),
+        prefer_fastest_engine: bool = False,
     ):
-        """Initialize finder with required dependencies."""
+        """
+        Initialize finder with required dependencies.
+
+        :param logger: Localized logger.
+        :param conditional_wait: Utility used to poll elements.
+        :param wait_engine: Optional engine which waits for elements inside the browser.
+        Elements are polled by WebDriver commands if engine is not set or does not support the search.
+        :param prefer_fastest_engine: Whether simple XPath locators should be searched as CSS selectors.
+        """
         self.__logger = logger
         self.__conditional_wait = conditional_wait
+        self.__wait_engine = wait_engine
+        self.__prefer_fastest_engine = prefer_fastest_engine
 
     def find_element(
         self,
@@ -140,15 +195,49 @@ class ElementFinder(AbstractElementFinder):
         :param timeout: timeout for search.
         :return: List of found elements.
         """
+        search_locator = compile_locator(locator, self.__prefer_fastest_engine)
+        if self.__wait_engine is not None and self.__wait_engine.is_supported(
+            search_locator, desired_state.element_state_condition
+        ):
+            wait_timeout = (
+                timeout if timeout is not None else self.__wait_engine.default_timeout
+            )
+            start_time = time.monotonic()
+            search_result = self.__wait_engine.wait_for_elements(
+                search_locator, desired_state.element_state_condition, wait_timeout
+            )
+            if search_result is not None:
+                found_elements, result = search_result
+                if not result:
+                    self._handle_timeout_exception(
+                        TimeoutException("Browser-side waiting timed out"),
+                        locator,
+                        desired_state,
+                        found_elements,
+                    )
+                return result
+            timeout = max(
+                wait_timeout - timedelta(seconds=time.monotonic() - start_time),
+                timedelta(),
+            )
+
         elements: Dict[str, List] = {"found": [], "result": []}
+        match: Dict[str, FallbackMatch] = {}
 
         try:
 
             def find_elements_func(driver: WebDriver):
-                elements["found"] = driver.find_elements(*locator)
-                elements["result"] = list(
-                    filter(desired_state.element_state_condition, elements["found"])
-                )
+                if isinstance(search_locator, FallbackLocator):
+                    fallback_result = self.__find_by_fallback_locator(
+                        driver, search_locator, desired_state.element_state_condition
+                    )
+                    match["result"], elements["found"] = fallback_result
+                    elements["result"] = match["result"].elements
+                else:
+                    elements["found"] = find_elements_by_locator(driver, search_locator)
+                    elements["result"] = filter_elements_in_state(
+                        driver, elements["found"], desired_state.element_state_condition
+                    )
                 return any(elements["result"])
 
             self.__conditional_wait.wait_for_with_driver(find_elements_func, timeout)
@@ -156,8 +245,127 @@ class ElementFinder(AbstractElementFinder):
             self._handle_timeout_exception(
                 exception, locator, desired_state, elements["found"]
             )
+        if isinstance(locator, FallbackLocator) and elements["result"]:
+            self.__report_fallback_match(locator, match["result"])
         return elements["result"]
 
+    def find_many(
+        self,
+        locators: List[Tuple[By, str]],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+    ) -> Dict[Tuple[By, str], List[WebElement]]:
+        """
+        Find elements by several locators at once without waiting.
+
+        Locators which could be evaluated in the browser are searched with one script call.
+        :param locators: Element locators.
+        :param desired_state: desired elements state as callable object.
+        :return: Elements in desired state found by each locator.
+        """
+        return self.wait_for_many(locators, desired_state, timedelta())
+
+    def wait_for_many(
+        self,
+        locators: List[Tuple[By, str]],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+        timeout: timedelta = cast(timedelta, None),
+    ) -> Dict[Tuple[By, str], List[WebElement]]:
+        """
+        Wait for elements found by each of several locators, polling all locators together.
+
+        Locators which could be evaluated in the browser are searched with one script call per poll.
+        :param locators: Element locators.
+        :param desired_state: desired elements state as callable object.
+        :param timeout: timeout for search.
+        :return: Elements in desired state found by each locator, empty lists for locators not found in time.
+        """
+        result: Dict[Tuple[By, str], List[WebElement]] = {
+            locator: [] for locator in locators
+        }
+
+        def find_many_func(driver: WebDriver) -> bool:
+            result.update(self.__find_many_once(driver, locators, desired_state))
+            return all(result.values())
+
+        try:
+            self.__conditional_wait.wait_for_with_driver(find_many_func, timeout)
+        except TimeoutException:
+            self.__logger.debug(
+                "loc.no.elements.found.in.state",
+                [locator for locator, elements in result.items() if not elements],
+                "desired",
+            )
+        return result
+
+    def __find_by_fallback_locator(
+        self,
+        driver: WebDriver,
+        locator: FallbackLocator,
+        desired_state: Callable[[WebElement], bool],
+    ) -> Tuple[FallbackMatch, List[WebElement]]:
+        found_elements = self.__find_many_once(
+            driver, locator.locators, ExistsInAnyState()
+        )
+        matched_elements: List[WebElement] = []
+        for alternative in locator.locators:
+            if not found_elements[alternative]:
+                continue
+            elements_in_state = filter_elements_in_state(
+                driver, found_elements[alternative], desired_state
+            )
+            if elements_in_state:
+                return (
+                    FallbackMatch(alternative, elements_in_state),
+                    found_elements[alternative],
+                )
+            if not matched_elements:
+                matched_elements = found_elements[alternative]
+        return FallbackMatch(None, []), matched_elements
+
+    def __report_fallback_match(
+        self, locator: FallbackLocator, match: FallbackMatch
+    ) -> None:
+        if match.locator != locator.locators[0]:
+            self.__logger.debug(
+                "loc.elements.found.by.fallback.locator",
+                match.locator,
+                locator.locators[0],
+            )
+
+    def __find_many_once(
+        self,
+        driver: WebDriver,
+        locators: List[Tuple[By, str]],
+        desired_state: Callable[[WebElement], bool],
+    ) -> Dict[Tuple[By, str], List[WebElement]]:
+        search_locators = [
+            compile_locator(locator, self.__prefer_fastest_engine)
+            for locator in locators
+        ]
+        queries = [
+            get_script_query(search_locator, desired_state)
+            for search_locator in search_locators
+        ]
+        script_locators = [
+            locator for locator, query in zip(locators, queries) if query is not None
+        ]
+        found_by_script = find_elements_by_queries(
+            driver, [query for query in queries if query is not None]
+        )
+        result = (
+            dict(zip(script_locators, found_by_script))
+            if found_by_script is not None
+            else {}
+        )
+        for locator, search_locator in zip(locators, search_locators):
+            if locator not in result:
+                result[locator] = filter_elements_in_state(
+                    driver,
+                    find_elements_by_locator(driver, search_locator),
+                    desired_state,
+                )
+        return result
+
     def _handle_timeout_exception(
         self,
         exception: TimeoutException,
@@ -165,28 +373,46 @@ class ElementFinder(AbstractElementFinder):
         desired_state: DesiredState,
         found_elements: List[WebElement],
     ) -> None:
-        message = f"No elements with locator '{locator}'' were found in {desired_state.state_name} state"
-        if desired_state.catch_timeout_exception:
-            if not any(found_elements):
-                if desired_state.raise_no_such_element_exception:
-                    raise NoSuchElementException(message)
-                self.__logger.debug(
-                    "loc.no.elements.found.in.state",
-                    "",
-                    locator,
-                    desired_state.state_name,
-                )
-            else:
-                self.__logger.debug(
-                    "loc.elements.were.found.but.not.in.state",
-                    "",
-                    locator,
-                    desired_state.state_name,
-                )
-        else:
-            message = f"{exception.msg}: {message}"
-            if desired_state.raise_no_such_element_exception and not any(
-                found_elements
-            ):
+        handle_search_timeout(
+            self.__logger, exception, locator, desired_state, found_elements
+        )
+
+
+def handle_search_timeout(
+    logger: AbstractLocalizedLogger,
+    exception: TimeoutException,
+    locator: Tuple[By, str],
+    desired_state: DesiredState,
+    found_elements: List[WebElement],
+) -> None:
+    """
+    Raise or log failure of elements search according to desired state.
+
+    :param logger: Logger for the case when the failure is not raised.
+    :param exception: Timeout exception of the search.
+    :param locator: Element locator.
+    :param desired_state: Desired element state.
+    :param found_elements: Elements found by locator in any state.
+    :raises: NoSuchElementException or TimeoutException according to desired state.
+    """
+    message = f"No elements with locator '{locator}'' were found in {desired_state.state_name} state"
+    if desired_state.catch_timeout_exception:
+        if not any(found_elements):
+            if desired_state.raise_no_such_element_exception:
                 raise NoSuchElementException(message)
-            raise TimeoutException(message)
+            logger.debug(
+                "loc.no.elements.found.in.state",
+                locator,
+                desired_state.state_name,
+            )
+        else:
+            logger.debug(
+                "loc.elements.were.found.but.not.in.state",
+                locator,
+                desired_state.state_name,
+            )
+    else:
+        message = f"{exception.msg}: {message}"
+        if desired_state.raise_no_such_element_exception and not any(found_elements):
+            raise NoSuchElementException(message)
+        raise TimeoutException(message)
@@ -16,3 +16,11 @@ class Displayed:
     def __call__(self, element: WebElement):
         """Return true if elements is displayed and false otherwise."""
         return element.is_displayed()
+
+
+class Clickable:
+    """Determines element's clickable state."""
+
+    def __call__(self, element: WebElement):
+        """Return true if element is displayed and enabled and false otherwise."""
+        return bool(element.is_displayed()) and bool(element.is_enabled())
@@ -4,6 +4,7 @@ from abc import abstractmethod
 from datetime import timedelta
 from typing import Callable
 from typing import cast
+from typing import Iterable
 from typing import List
 from typing import Tuple
 from typing import Type
@@ -13,13 +14,19 @@ from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+from aquality_selenium_core.applications.application import AbstractApplication
 from aquality_selenium_core.elements.desired_state import DesiredState
 from aquality_selenium_core.elements.element_cache_handler import (
     AbstractElementCacheHandler,
 )
 from aquality_selenium_core.elements.element_finder import AbstractElementFinder
+from aquality_selenium_core.elements.element_state import Clickable
 from aquality_selenium_core.elements.element_state import Displayed
 from aquality_selenium_core.elements.element_state import ExistsInAnyState
+from aquality_selenium_core.elements.element_state_snapshot import ElementStateSnapshot
+from aquality_selenium_core.elements.element_state_snapshot import (
+    take_element_snapshot,
+)
 from aquality_selenium_core.waitings.conditional_wait import AbstractConditionalWait
 
 
@@ -144,6 +151,16 @@ class AbstractElementStateProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def snapshot(self, attributes: Iterable[str] = ()) -> ElementStateSnapshot:
+        """
+        Capture element's state at once without waiting.
+
+        :param attributes: Names of attributes to capture.
+        :return: Immutable snapshot with existence, visibility, enabled state, rect, text and attributes.
+        """
+        pass
+
 
 class ElementStateProvider(AbstractElementStateProvider):
     """
@@ -157,11 +174,20 @@ class ElementStateProvider(AbstractElementStateProvider):
         element_locator: Tuple[By, str],
         conditional_wait: AbstractConditionalWait,
         element_finder: AbstractElementFinder,
+        application: AbstractApplication = cast(AbstractApplication, None),
     ):
-        """Initialize provider with required dependencies."""
+        """
+        Initialize provider with required dependencies.
+
+        :param element_locator: Element locator.
+        :param conditional_wait: Utility used to wait for states.
+        :param element_finder: Finder of elements.
+        :param application: Optional application used to capture snapshot with one script call.
+        """
         self.__element_locator = element_locator
         self.__conditional_wait = conditional_wait
         self.__element_finder = element_finder
+        self.__application = application
 
     @property
     def is_displayed(self) -> bool:
@@ -270,6 +296,22 @@ class ElementStateProvider(AbstractElementStateProvider):
         """
         self.__is_element_clickable(timeout, False)
 
+    def snapshot(self, attributes: Iterable[str] = ()) -> ElementStateSnapshot:
+        """
+        Capture element's state at once without waiting.
+
+        :param attributes: Names of attributes to capture.
+        :return: Immutable snapshot with existence, visibility, enabled state, rect, text and attributes.
+        """
+        found_elements = self.__element_finder.find_elements(
+            self.__element_locator, ExistsInAnyState(), timedelta()
+        )
+        return take_element_snapshot(
+            self.__application.driver if self.__application is not None else None,
+            found_elements[0] if found_elements else None,
+            attributes,
+        )
+
     def __is_any_element_found(
         self, timeout: timedelta, state: Callable[[WebElement], bool]
     ) -> bool:
@@ -281,11 +323,7 @@ class ElementStateProvider(AbstractElementStateProvider):
     def __is_element_clickable(
         self, timeout: timedelta, catch_timeout_exception: bool
     ) -> bool:
-        desired_state = DesiredState(
-            lambda element: bool(element.is_displayed()) and bool(element.is_enabled()),
-            "CLICKABLE",
-            catch_timeout_exception,
-        )
+        desired_state = DesiredState(Clickable(), "CLICKABLE", catch_timeout_exception)
         return self.__is_element_in_desired_state(timeout, desired_state)
 
     def __is_element_in_desired_condition(
@@ -319,11 +357,20 @@ class CachedElementStateProvider(AbstractElementStateProvider):
         locator: Tuple[By, str],
         conditional_wait: AbstractConditionalWait,
         element_cache_handler: AbstractElementCacheHandler,
+        application: AbstractApplication = cast(AbstractApplication, None),
     ):
-        """Initialize provider with required dependencies."""
+        """
+        Initialize provider with required dependencies.
+
+        :param locator: Element locator.
+        :param conditional_wait: Utility used to wait for states.
+        :param element_cache_handler: Handler of cached element.
+        :param application: Optional application used to capture snapshot with one script call.
+        """
         self.__locator = locator
         self.__conditional_wait = conditional_wait
         self.__element_cache_handler = element_cache_handler
+        self.__application = application
 
     @property
     def is_displayed(self) -> bool:
@@ -365,9 +412,7 @@ class CachedElementStateProvider(AbstractElementStateProvider):
 
         :return: true if element is clickable, false otherwise.
         """
-        return self._try_invoke_function(
-            lambda element: bool(element.is_displayed()) and bool(element.is_enabled())
-        )
+        return self._try_invoke_function(Clickable())
 
     def wait_for_displayed(self, timeout: timedelta = cast(timedelta, None)) -> bool:
         """
@@ -443,6 +488,25 @@ class CachedElementStateProvider(AbstractElementStateProvider):
         """
         return self.__conditional_wait.wait_for_true(lambda: self.is_clickable, timeout)
 
+    def snapshot(self, attributes: Iterable[str] = ()) -> ElementStateSnapshot:
+        """
+        Capture element's state at once without waiting.
+
+        :param attributes: Names of attributes to capture.
+        :return: Immutable snapshot with existence, visibility, enabled state, rect, text and attributes.
+        """
+        try:
+            element = self.__element_cache_handler.get_element(
+                timedelta(), ExistsInAnyState()
+            )
+        except NoSuchElementException:
+            element = None
+        return take_element_snapshot(
+            self.__application.driver if self.__application is not None else None,
+            element,
+            attributes,
+        )
+
     def _try_invoke_function(
         self,
         func: Callable[[WebElement], bool],
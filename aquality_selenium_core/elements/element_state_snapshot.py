@@ -0,0 +1,157 @@
+"""Module defines immutable snapshot of element state."""
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Mapping
+from typing import Optional
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from aquality_selenium_core.utilities.java_script import JavaScript
+
+
+class ElementStateSnapshot:
+    """State of element captured at one moment."""
+
+    __slots__ = (
+        "__is_exist",
+        "__is_displayed",
+        "__is_enabled",
+        "__rect",
+        "__text",
+        "__attributes",
+    )
+
+    def __init__(
+        self,
+        is_exist: bool,
+        is_displayed: bool = False,
+        is_enabled: bool = False,
+        rect: Optional[Mapping[str, float]] = None,
+        text: str = "",
+        attributes: Optional[Mapping[str, Optional[str]]] = None,
+    ):
+        """
+        Initialize snapshot with captured values.
+
+        :param is_exist: Whether element exists in DOM.
+        :param is_displayed: Whether element is displayed.
+        :param is_enabled: Whether element is enabled.
+        :param rect: Location and size of element: x, y, width and height.
+        :param text: Visible text of element.
+        :param attributes: Values of requested attributes, None for absent ones.
+        """
+        self.__is_exist = is_exist
+        self.__is_displayed = is_displayed
+        self.__is_enabled = is_enabled
+        self.__rect = dict(rect) if rect is not None else None
+        self.__text = text
+        self.__attributes = dict(attributes) if attributes is not None else {}
+
+    @property
+    def is_exist(self) -> bool:
+        """Get whether element exists in DOM."""
+        return self.__is_exist
+
+    @property
+    def is_displayed(self) -> bool:
+        """Get whether element is displayed."""
+        return self.__is_displayed
+
+    @property
+    def is_enabled(self) -> bool:
+        """Get whether element is enabled."""
+        return self.__is_enabled
+
+    @property
+    def is_clickable(self) -> bool:
+        """Get whether element is displayed and enabled."""
+        return self.__is_displayed and self.__is_enabled
+
+    @property
+    def rect(self) -> Optional[Dict[str, float]]:
+        """Get location and size of element or None if element does not exist."""
+        return dict(self.__rect) if self.__rect is not None else None
+
+    @property
+    def text(self) -> str:
+        """Get visible text of element."""
+        return self.__text
+
+    @property
+    def attributes(self) -> Dict[str, Optional[str]]:
+        """Get values of requested attributes."""
+        return dict(self.__attributes)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Get value of requested attribute.
+
+        :param name: Attribute name.
+        :return: Attribute value or None if the attribute is absent.
+        :raises: KeyError if attribute was not requested when snapshot was taken.
+        """
+        return self.__attributes[name]
+
+    def __repr__(self) -> str:
+        """Get string representation of snapshot."""
+        return (
+            f"ElementStateSnapshot(is_exist={self.__is_exist}, is_displayed={self.__is_displayed}, "
+            f"is_enabled={self.__is_enabled}, rect={self.__rect}, text={self.__text!r}, "
+            f"attributes={self.__attributes})"
+        )
+
+
+def take_element_snapshot(
+    driver: Optional[WebDriver],
+    element: Optional[WebElement],
+    attributes: Iterable[str] = (),
+) -> ElementStateSnapshot:
+    """
+    Capture state of element.
+
+    State is read with one script call if driver is given, otherwise with separate WebDriver commands.
+    :param driver: Driver used to execute script or None.
+    :param element: Element to capture or None if it is not found.
+    :param attributes: Names of attributes to capture.
+    :return: Snapshot of element state, not existing one if element is None or stale.
+    """
+    if element is None:
+        return ElementStateSnapshot(False)
+    attribute_names = list(attributes)
+    try:
+        if driver is not None:
+            try:
+                return _snapshot_from_script(
+                    driver.execute_script(
+                        JavaScript.GET_ELEMENT_SNAPSHOT.script, element, attribute_names
+                    )
+                )
+            except StaleElementReferenceException:
+                raise
+            except WebDriverException:
+                pass
+        return ElementStateSnapshot(
+            True,
+            bool(element.is_displayed()),
+            bool(element.is_enabled()),
+            element.rect,
+            str(element.text),
+            {name: element.get_attribute(name) for name in attribute_names},
+        )
+    except StaleElementReferenceException:
+        return ElementStateSnapshot(False)
+
+
+def _snapshot_from_script(result: Dict[str, Any]) -> ElementStateSnapshot:
+    return ElementStateSnapshot(
+        True,
+        bool(result["displayed"]),
+        bool(result["enabled"]),
+        result["rect"],
+        result["text"],
+        result["attributes"],
+    )
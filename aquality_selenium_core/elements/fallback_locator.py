@@ -0,0 +1,77 @@
+"""Module defines locator with ordered alternatives used when the primary locator does not match."""
+from typing import Any
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+
+class FallbackMatch(NamedTuple):
+    """Elements found by fallback locator and the alternative which matched them."""
+
+    locator: Optional[Tuple[By, str]]
+    elements: List[WebElement]
+
+
+class FallbackLocator(tuple):
+    """
+    Ordered chain of locators of the same element.
+
+    The first locator which matches elements is used, so one waiting covers all alternatives.
+    It is still a pair of locator strategy and value equal to the primary locator,
+    so it could be logged and used as plain locator. Locator is immutable and could be shared
+    between elements and threads, the matched alternative is returned with found elements.
+    Fallback locators are equal only if all their alternatives are equal, so they could be used as keys
+    together with their primary locators.
+    """
+
+    def __new__(cls, locators: List[Tuple[By, str]]):
+        """
+        Create locator chain.
+
+        :param locators: Plain locators ordered by priority, the first one is primary.
+        """
+        if not locators:
+            raise ValueError("Fallback locator should contain at least one locator")
+        instance = super().__new__(cls, locators[0])
+        instance.__locators = [tuple(locator) for locator in locators]
+        return instance
+
+    def __getnewargs__(self):
+        """Get arguments used to recreate locator when it is copied or pickled."""
+        return (self.__locators,)
+
+    def __eq__(self, other: object) -> bool:
+        """Check that other locator is fallback locator with the same alternatives."""
+        return (
+            isinstance(other, FallbackLocator) and self.__locators == other.__locators
+        )
+
+    def __ne__(self, other: object) -> bool:
+        """Check that other locator is not fallback locator with the same alternatives."""
+        return not self == other
+
+    def __hash__(self) -> int:
+        """Get hash of locator which depends on all alternatives."""
+        return hash((FallbackLocator, tuple(self.__locators)))
+
+    @property
+    def locators(self) -> List[Tuple[By, str]]:
+        """Get locators ordered by priority."""
+        return list(self.__locators)
+
+    def find_elements(self, search_context: Any) -> FallbackMatch:
+        """
+        Find elements by the first matching locator of the chain.
+
+        :param search_context: WebDriver or WebElement used to search elements.
+        :return: Matched locator and elements found by it, or None and empty list if no locator matched.
+        """
+        for locator in self.__locators:
+            elements = search_context.find_elements(*locator)
+            if elements:
+                return FallbackMatch(locator, elements)
+        return FallbackMatch(None, [])
@@ -0,0 +1,232 @@
+"""Module defines translation of locators between XPath and CSS selector strategies."""
+import re
+from functools import lru_cache
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.child_locator import ChildLocator
+from aquality_selenium_core.elements.fallback_locator import FallbackLocator
+
+LOCATOR_CACHE_SIZE = 1024
+
+_IDENTIFIER = r"[A-Za-z_][\w-]*"
+_CSS_STRING = r"\"[^\"]*\"|'[^']*'"
+_CSS_COMPOUND = re.compile(
+    rf"(?P<tag>{_IDENTIFIER}|\*)?"
+    rf"(?P<selectors>(?:#{_IDENTIFIER}|\.{_IDENTIFIER}"
+    rf"|\[\s*{_IDENTIFIER}\s*(?:=\s*(?:{_CSS_STRING}|{_IDENTIFIER})\s*)?\])*)$"
+)
+_CSS_SIMPLE_SELECTOR = re.compile(
+    rf"#(?P<id>{_IDENTIFIER})|\.(?P<class>{_IDENTIFIER})"
+    rf"|\[\s*(?P<attribute>{_IDENTIFIER})\s*"
+    rf"(?:=\s*(?:\"(?P<double>[^\"]*)\"|'(?P<single>[^']*)'|(?P<bare>{_IDENTIFIER}))\s*)?\]"
+)
+_CSS_COMBINATOR = re.compile(r"\s*>\s*|\s+")
+_XPATH_STEP = re.compile(
+    rf"(?P<axis>//|/)(?P<tag>{_IDENTIFIER}|\*)"
+    rf"(?P<predicates>(?:\[@{_IDENTIFIER}(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'))?\])*)"
+)
+_XPATH_PREDICATE = re.compile(
+    rf"\[@(?P<attribute>{_IDENTIFIER})(?:\s*=\s*(?:\"(?P<double>[^\"]*)\"|'(?P<single>[^']*)'))?\]"
+)
+
+
+def to_css(locator: Tuple[By, str]) -> Optional[Tuple[By, str]]:
+    """
+    Translate locator to CSS selector.
+
+    XPath is translated only if it is a simple path of tags with attribute predicates, e.g. //div[@id='main']/a.
+    Results are memoized by locator strategy and value.
+    :param locator: Element locator.
+    :return: Equivalent CSS selector locator or None if locator could not be translated.
+    """
+    return _to_css(tuple(locator))
+
+
+def to_xpath(locator: Tuple[By, str]) -> Optional[Tuple[By, str]]:
+    """
+    Translate locator to XPath.
+
+    CSS selector is translated only if it consists of tags, ids, classes and attributes
+    joined by descendant or child combinators. Results are memoized by locator strategy and value.
+    :param locator: Element locator.
+    :return: Equivalent XPath locator or None if locator could not be translated.
+    """
+    return _to_xpath(tuple(locator))
+
+
+def compile_locator(
+    locator: Tuple[By, str], prefer_fastest_engine: bool = False
+) -> Tuple[By, str]:
+    """
+    Get locator which is sent to WebDriver.
+
+    :param locator: Element locator.
+    :param prefer_fastest_engine: Whether simple XPath should be evaluated by faster CSS engine of the browser.
+    :return: Locator to search elements with.
+    """
+    if not prefer_fastest_engine or isinstance(
+        locator, (ChildLocator, FallbackLocator)
+    ):
+        return locator
+    return _compile_for_fastest_engine(tuple(locator))
+
+
+def clear_cache() -> None:
+    """Clear memoized translations of locators."""
+    _to_css.cache_clear()
+    _to_xpath.cache_clear()
+    _compile_for_fastest_engine.cache_clear()
+
+
+@lru_cache(maxsize=LOCATOR_CACHE_SIZE)
+def _to_css(locator: Tuple[By, str]) -> Optional[Tuple[By, str]]:
+    strategy, value = locator
+    if strategy == By.CSS_SELECTOR:
+        return By.CSS_SELECTOR, value
+    if strategy == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    if strategy == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if strategy in [By.ID, By.NAME]:
+        attribute = _css_attribute(strategy, value)
+        return (By.CSS_SELECTOR, attribute) if attribute is not None else None
+    if strategy == By.XPATH:
+        return _xpath_to_css(value)
+    return None
+
+
+@lru_cache(maxsize=LOCATOR_CACHE_SIZE)
+def _to_xpath(locator: Tuple[By, str]) -> Optional[Tuple[By, str]]:
+    strategy, value = locator
+    if strategy == By.XPATH:
+        return By.XPATH, value
+    if strategy == By.TAG_NAME:
+        return By.XPATH, f"//{value}"
+    if strategy == By.ID:
+        return _xpath_with_predicate("id", value)
+    if strategy == By.NAME:
+        return _xpath_with_predicate("name", value)
+    if strategy == By.CLASS_NAME:
+        return By.XPATH, f"//*[{_xpath_class_predicate(value)}]"
+    if strategy == By.CSS_SELECTOR:
+        return _css_to_xpath(value)
+    return None
+
+
+@lru_cache(maxsize=LOCATOR_CACHE_SIZE)
+def _compile_for_fastest_engine(locator: Tuple[By, str]) -> Tuple[By, str]:
+    if locator[0] == By.XPATH:
+        css_locator = _to_css(locator)
+        if css_locator is not None:
+            return css_locator
+    return locator
+
+
+def _css_attribute(strategy: str, value: str) -> Optional[str]:
+    if '"' not in value:
+        return f'[{strategy}="{value}"]'
+    if "'" not in value:
+        return f"[{strategy}='{value}']"
+    return None
+
+
+def _xpath_literal(value: str) -> Optional[str]:
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    return None
+
+
+def _xpath_with_predicate(attribute: str, value: str) -> Optional[Tuple[By, str]]:
+    literal = _xpath_literal(value)
+    return (By.XPATH, f"//*[@{attribute}={literal}]") if literal is not None else None
+
+
+def _xpath_class_predicate(class_name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def _css_to_xpath(selector: str) -> Optional[Tuple[By, str]]:
+    selector = selector.strip()
+    if not selector:
+        return None
+    compounds = _CSS_COMBINATOR.split(selector)
+    combinators = ["//"] + [
+        "/" if ">" in combinator else "//"
+        for combinator in _CSS_COMBINATOR.findall(selector)
+    ]
+    steps = []
+    for axis, compound in zip(combinators, compounds):
+        match = _CSS_COMPOUND.match(compound)
+        if not compound or match is None:
+            return None
+        predicates = _css_compound_predicates(match.group("selectors"))
+        if predicates is None:
+            return None
+        steps.append(f"{axis}{match.group('tag') or '*'}{''.join(predicates)}")
+    return By.XPATH, "".join(steps)
+
+
+def _css_compound_predicates(selectors: str) -> Optional[List[str]]:
+    predicates = []
+    for match in _CSS_SIMPLE_SELECTOR.finditer(selectors):
+        if match.group("id") is not None:
+            predicates.append(f"[@id='{match.group('id')}']")
+        elif match.group("class") is not None:
+            predicates.append(f"[{_xpath_class_predicate(match.group('class'))}]")
+        else:
+            value = next(
+                (
+                    match.group(group)
+                    for group in ["double", "single", "bare"]
+                    if match.group(group) is not None
+                ),
+                None,
+            )
+            if value is None:
+                predicates.append(f"[@{match.group('attribute')}]")
+                continue
+            literal = _xpath_literal(value)
+            if literal is None:
+                return None
+            predicates.append(f"[@{match.group('attribute')}={literal}]")
+    return predicates
+
+
+def _xpath_to_css(xpath: str) -> Optional[Tuple[By, str]]:
+    path = xpath.strip()
+    if path.startswith(".//"):
+        path = path[1:]
+    if not path.startswith("//"):
+        return None
+    position = 0
+    selector = ""
+    while position < len(path):
+        match = _XPATH_STEP.match(path, position)
+        if match is None:
+            return None
+        if selector:
+            selector += " " if match.group("axis") == "//" else " > "
+        tag = match.group("tag")
+        attributes = []
+        for predicate in _XPATH_PREDICATE.finditer(match.group("predicates")):
+            value = (
+                predicate.group("double")
+                if predicate.group("double") is not None
+                else predicate.group("single")
+            )
+            if value is None:
+                attributes.append(f"[{predicate.group('attribute')}]")
+            else:
+                attribute = _css_attribute(predicate.group("attribute"), value)
+                if attribute is None:
+                    return None
+                attributes.append(attribute)
+        selector += ("" if tag == "*" and attributes else tag) + "".join(attributes)
+        position = match.end()
+    return By.CSS_SELECTOR, selector
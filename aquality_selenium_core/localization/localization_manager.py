@@ -1,16 +1,20 @@
 """Module defines localization manager."""
+import json
 import logging
 import os
+import re
 from abc import ABC
 from abc import abstractmethod
-from typing import cast
+from typing import Dict
 
 from aquality_selenium_core.configurations.logger_configuration import (
     AbstractLoggerConfiguration,
 )
 from aquality_selenium_core.utilities.resource_file import ResourceFile
-from aquality_selenium_core.utilities.settings_file import AbstractSettingsFile
-from aquality_selenium_core.utilities.settings_file import JsonSettingsFile
+
+_TEMPLATE_SPECIFIER = re.compile(
+    r"%%|%(?:\([^)]*\))?[#0 +-]*(?:\*|\d+)?(?:\.(?:\*|\d+))?[diouxXeEfFgGcrsa]"
+)
 
 
 class AbstractLocalizationManager(ABC):
@@ -29,24 +33,35 @@ class AbstractLocalizationManager(ABC):
 
 
 class LocalizationManager(AbstractLocalizationManager):
-    """Get messages translated to different languages based on configuration."""
+    """
+    Get messages translated to different languages based on configuration.
+
+    Core and user catalogs of the language are merged into one dictionary at creation,
+    user messages take precedence over core ones.
+    """
 
     def __init__(self, logger_configuration: AbstractLoggerConfiguration):
         """Initialize manager with configuration."""
         language = logger_configuration.language
-        self.__core_localization_file = self.__get_localization_file(
-            f"core.{language}.json"
-        )
-        self.__localization_file = self.__get_localization_file(f"{language}.json")
+        self.__catalog: Dict[str, str] = {}
+        for file_name in [f"core.{language}.json", f"{language}.json"]:
+            self.__catalog.update(self.__read_catalog(file_name))
 
     @staticmethod
-    def __get_localization_file(file_name: str) -> AbstractSettingsFile:
-        path = os.path.join("localization", file_name)
-        return (
-            JsonSettingsFile(path)
-            if ResourceFile(path).exists
-            else cast(AbstractSettingsFile, None)
-        )
+    def __read_catalog(file_name: str) -> Dict[str, str]:
+        resource_file = ResourceFile(os.path.join("localization", file_name))
+        if not resource_file.exists:
+            return {}
+        catalog = {
+            str(key): str(value)
+            for key, value in json.loads(resource_file.file_content).items()
+        }
+        for key, template in catalog.items():
+            if "%" in _TEMPLATE_SPECIFIER.sub("", template):
+                logging.warning(
+                    f"Localized message '{key}' in {file_name} is not a valid template: {template}"
+                )
+        return catalog
 
     def get_localized_message(self, message_key: str, *message_args) -> str:
         """
@@ -56,14 +71,8 @@ class LocalizationManager(AbstractLocalizationManager):
         :param message_args: Arguments, which will be provided to template of localized message.
         :return: Localized message.
         """
-        json_path = f'"{message_key}"'
-        localized_message = message_key
-        if self.__localization_file and self.__localization_file.is_value_present(
-            json_path
-        ):
-            localized_message = self.__localization_file.get_value(json_path)
-        elif self.__core_localization_file.is_value_present(json_path):
-            localized_message = self.__core_localization_file.get_value(json_path)
-        else:
+        localized_message = self.__catalog.get(message_key)
+        if localized_message is None:
             logging.warning(f"Cannot find localized message by key '{message_key}'.")
+            localized_message = message_key
         return localized_message % message_args
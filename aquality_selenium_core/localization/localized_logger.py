@@ -2,6 +2,10 @@
 import logging
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
 
 from aquality_selenium_core.configurations.logger_configuration import (
     AbstractLoggerConfiguration,
@@ -97,7 +101,11 @@ class AbstractLocalizedLogger(ABC):
 
 
 class LocalizedLogger(AbstractLocalizedLogger):
-    """This logger is used to log messages translated into language from configuration."""
+    """
+    This logger is used to log messages translated into language from configuration.
+
+    Messages are localized only if their level is enabled and they are actually emitted by logging.
+    """
 
     def __init__(
         self,
@@ -108,6 +116,7 @@ class LocalizedLogger(AbstractLocalizedLogger):
         self.__localization_manager = localization_manager
         self.__configuration = configuration
 
+    @property
     def configuration(self) -> AbstractLoggerConfiguration:
         """Get logger configuration."""
         return self.__configuration
@@ -129,8 +138,13 @@ class LocalizedLogger(AbstractLocalizedLogger):
         :param message_args: Arguments, which will be provided to template of localized message.
         :param logger_kwargs: Arguments for logger.
         """
-        message = f"{element_type} '{element_name}' :: {self.__localize_message(message_key, *message_args)}"
-        logging.info(message, **logger_kwargs)
+        self.__log(
+            logging.INFO,
+            message_key,
+            message_args,
+            logger_kwargs,
+            f"{element_type} '{element_name}' :: ",
+        )
 
     def info(self, message_key: str, *message_args, **logger_kwargs) -> None:
         """
@@ -140,9 +154,7 @@ class LocalizedLogger(AbstractLocalizedLogger):
         :param message_args: Arguments, which will be provided to template of localized message.
         :param logger_kwargs: Arguments for logger.
         """
-        logging.info(
-            self.__localize_message(message_key, *message_args), **logger_kwargs
-        )
+        self.__log(logging.INFO, message_key, message_args, logger_kwargs)
 
     def debug(self, message_key: str, *message_args, **logger_kwargs) -> None:
         """
@@ -152,9 +164,7 @@ class LocalizedLogger(AbstractLocalizedLogger):
         :param message_args: Arguments, which will be provided to template of localized message.
         :param logger_kwargs: Arguments for logger.
         """
-        logging.debug(
-            self.__localize_message(message_key, *message_args), **logger_kwargs
-        )
+        self.__log(logging.DEBUG, message_key, message_args, logger_kwargs)
 
     def warning(self, message_key: str, *message_args, **logger_kwargs) -> None:
         """
@@ -164,9 +174,7 @@ class LocalizedLogger(AbstractLocalizedLogger):
         :param message_args: Arguments, which will be provided to template of localized message.
         :param logger_kwargs: Arguments for logger.
         """
-        logging.warning(
-            self.__localize_message(message_key, *message_args), **logger_kwargs
-        )
+        self.__log(logging.WARNING, message_key, message_args, logger_kwargs)
 
     def error(self, message_key: str, *message_args, **logger_kwargs) -> None:
         """
@@ -176,9 +184,7 @@ class LocalizedLogger(AbstractLocalizedLogger):
         :param message_args: Arguments, which will be provided to template of localized message.
         :param logger_kwargs: Arguments for logger.
         """
-        logging.error(
-            self.__localize_message(message_key, *message_args), **logger_kwargs
-        )
+        self.__log(logging.ERROR, message_key, message_args, logger_kwargs)
 
     def fatal(self, message_key: str, *message_args, **logger_kwargs) -> None:
         """
@@ -188,11 +194,57 @@ class LocalizedLogger(AbstractLocalizedLogger):
         :param message_args: Arguments, which will be provided to template of localized message.
         :param logger_kwargs: Arguments for logger.
         """
-        logging.fatal(
-            self.__localize_message(message_key, *message_args), **logger_kwargs
-        )
+        self.__log(logging.CRITICAL, message_key, message_args, logger_kwargs)
 
-    def __localize_message(self, message_key: str, *message_args) -> str:
-        return self.__localization_manager.get_localized_message(
-            message_key, *message_args
-        )
+    def __log(
+        self,
+        level: int,
+        message_key: str,
+        message_args: Tuple[Any, ...],
+        logger_kwargs: Dict[str, Any],
+        prefix: str = "",
+    ) -> None:
+        if logging.getLogger().isEnabledFor(level):
+            logging.log(
+                level,
+                _LocalizedMessage(
+                    self.__localization_manager, message_key, message_args, prefix
+                ),
+                **logger_kwargs,
+            )
+
+
+class _LocalizedMessage:
+    """Message which is localized when logging renders it for the first time."""
+
+    __slots__ = (
+        "__localization_manager",
+        "__message_key",
+        "__message_args",
+        "__prefix",
+        "__message",
+    )
+
+    def __init__(
+        self,
+        localization_manager: AbstractLocalizationManager,
+        message_key: str,
+        message_args: Tuple[Any, ...],
+        prefix: str,
+    ):
+        self.__localization_manager = localization_manager
+        self.__message_key = message_key
+        self.__message_args = message_args
+        self.__prefix = prefix
+        self.__message: Optional[str] = None
+
+    def __str__(self) -> str:
+        """Get localized message."""
+        if self.__message is None:
+            self.__message = (
+                self.__prefix
+                + self.__localization_manager.get_localized_message(
+                    self.__message_key, *self.__message_args
+                )
+            )
+        return self.__message
@@ -0,0 +1,47 @@
+function findElements(strategy, value, root) {
+    root = root || document;
+    var elements = [];
+    switch (strategy) {
+        case 'xpath':
+            var ownerDocument = root.ownerDocument || root;
+            var snapshot = ownerDocument.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                var node = snapshot.snapshotItem(i);
+                if (node.nodeType === Node.ELEMENT_NODE) {
+                    elements.push(node);
+                }
+            }
+            return elements;
+        case 'css selector':
+            return Array.prototype.slice.call(root.querySelectorAll(value));
+        case 'link text':
+        case 'partial link text':
+            var links = root.querySelectorAll('a');
+            for (var j = 0; j < links.length; j++) {
+                var text = (links[j].innerText || links[j].textContent || '').trim();
+                if (strategy === 'link text' ? text === value : text.indexOf(value) !== -1) {
+                    elements.push(links[j]);
+                }
+            }
+            return elements;
+    }
+    throw new Error('Locator strategy ' + strategy + ' is not supported');
+}
+
+function isElementInState(element, state) {
+    switch (state) {
+        case 'exists':
+            return true;
+        case 'displayed':
+            return isDisplayed(element);
+        case 'clickable':
+            return isDisplayed(element) && !element.matches(':disabled');
+    }
+    throw new Error('Element state ' + state + ' is not supported');
+}
+
+function filterElementsInState(elements, state) {
+    return elements.filter(function (element) {
+        return isElementInState(element, state);
+    });
+}
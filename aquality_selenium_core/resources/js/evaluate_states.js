@@ -0,0 +1,5 @@
+var elements = arguments[0];
+var state = arguments[1];
+return elements.map(function (element) {
+    return isElementInState(element, state);
+});
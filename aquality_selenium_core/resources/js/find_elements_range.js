@@ -0,0 +1,13 @@
+var elements = findElements(arguments[0], arguments[1], document);
+var state = arguments[2], start = arguments[3], end = arguments[4], countAll = arguments[5];
+var total = 0, range = [], positions = [];
+for (var i = 0; i < elements.length && (countAll || total < end); i++) {
+    if (isElementInState(elements[i], state)) {
+        if (total >= start && total < end) {
+            range.push(elements[i]);
+            positions.push(i + 1);
+        }
+        total++;
+    }
+}
+return [countAll ? total : null, range, positions];
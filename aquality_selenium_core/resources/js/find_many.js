@@ -0,0 +1,5 @@
+var queries = arguments[0];
+var limit = arguments[1] || undefined;
+return queries.map(function (query) {
+    return filterElementsInState(findElements(query[0], query[1], document), query[2]).slice(0, limit);
+});
@@ -0,0 +1,4 @@
+if (!document.aqualityDocumentId) {
+    document.aqualityDocumentId = Date.now().toString(36) + Math.random().toString(36).slice(2);
+}
+return [document.aqualityDocumentId, location.href];
@@ -0,0 +1,20 @@
+var element = arguments[0];
+var attributeNames = arguments[1];
+var rect = element.getBoundingClientRect();
+var displayed = isElementInState(element, 'displayed');
+var attributes = {};
+attributeNames.forEach(function (name) {
+    attributes[name] = getAttribute(element, name);
+});
+return {
+    displayed: displayed,
+    enabled: !element.matches(':disabled'),
+    rect: {
+        x: rect.left + window.pageXOffset,
+        y: rect.top + window.pageYOffset,
+        width: rect.width,
+        height: rect.height
+    },
+    text: displayed ? (element.innerText || '').trim() : '',
+    attributes: attributes
+};
@@ -0,0 +1,40 @@
+var attributeNames = arguments[1];
+var readTexts = arguments[2];
+
+function resolveElement(target) {
+    if (!Array.isArray(target)) {
+        return target;
+    }
+    var candidates = findElements(target[0], target[1], document);
+    for (var i = 0; i < candidates.length; i++) {
+        if (isElementInState(candidates[i], target[2])) {
+            return candidates[i];
+        }
+    }
+    return null;
+}
+
+var elements = arguments[0].map(resolveElement);
+var missing = [];
+elements.forEach(function (element, index) {
+    if (element === null) {
+        missing.push(index);
+    }
+});
+if (missing.length) {
+    return {texts: [], attributes: {}, missing: missing};
+}
+
+var attributes = {};
+attributeNames.forEach(function (name) {
+    attributes[name] = elements.map(function (element) {
+        return getAttribute(element, name);
+    });
+});
+return {
+    texts: readTexts ? elements.map(function (element) {
+        return isElementInState(element, 'displayed') ? (element.innerText || '').trim() : '';
+    }) : [],
+    attributes: attributes,
+    missing: []
+};
@@ -0,0 +1,64 @@
+var strategy = arguments[0];
+var value = arguments[1];
+var state = arguments[2];
+var timeout = arguments[3];
+var pollingInterval = arguments[4];
+var done = arguments[arguments.length - 1];
+var finished = false;
+var checkScheduled = false;
+var observer = null;
+var pollingTimer = null;
+var timeoutTimer = null;
+
+function check() {
+    var found = findElements(strategy, value, document);
+    return [found, filterElementsInState(found, state)];
+}
+
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    clearInterval(pollingTimer);
+    clearTimeout(timeoutTimer);
+    done(result);
+}
+
+function checkAndFinishIfMatched() {
+    checkScheduled = false;
+    if (finished) {
+        return;
+    }
+    var result = check();
+    if (result[1].length > 0) {
+        finish(result);
+    }
+}
+
+function scheduleCheck() {
+    if (checkScheduled) {
+        return;
+    }
+    checkScheduled = true;
+    if (document.hidden || typeof requestAnimationFrame !== 'function') {
+        setTimeout(checkAndFinishIfMatched, 0);
+    } else {
+        requestAnimationFrame(checkAndFinishIfMatched);
+    }
+}
+
+var initialResult = check();
+if (initialResult[1].length > 0 || timeout <= 0) {
+    finish(initialResult);
+} else {
+    observer = new MutationObserver(scheduleCheck);
+    observer.observe(document, {attributes: true, characterData: true, childList: true, subtree: true});
+    pollingTimer = setInterval(scheduleCheck, Math.max(pollingInterval, 16));
+    timeoutTimer = setTimeout(function () {
+        finish(check());
+    }, timeout);
+}
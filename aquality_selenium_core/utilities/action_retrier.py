@@ -65,7 +65,9 @@ class ActionRetrier(AbstractActionRetrier):
                     self.__is_exception_handled(exception, handled_exceptions)
                     and retry_attempts_left != 0
                 ):
-                    time.sleep(self.__retry_configuration.polling_interval.seconds)
+                    time.sleep(
+                        self.__retry_configuration.polling_interval.total_seconds()
+                    )
                     retry_attempts_left -= 1
                 else:
                     raise
@@ -0,0 +1,53 @@
+"""Module defines JavaScript files executed in the browser."""
+import os
+import pkgutil
+from enum import Enum
+from functools import lru_cache
+from typing import cast
+
+from aquality_selenium_core.utilities.resource_file import ResourceFile
+
+
+class JavaScript(Enum):
+    """
+    Enumeration of scripts stored in resources/js folder.
+
+    Element scripts are prepended with functions from element_helpers.js and with Selenium's
+    isDisplayed and getAttribute atoms, so visibility checks and attribute reads have the same semantics
+    as WebElement.is_displayed and WebElement.get_attribute.
+    """
+
+    WAIT_FOR_ELEMENTS = "wait_for_elements.js"
+    EVALUATE_STATES = "evaluate_states.js"
+    FIND_ELEMENTS_RANGE = "find_elements_range.js"
+    FIND_MANY = "find_many.js"
+    GET_ELEMENT_SNAPSHOT = "get_element_snapshot.js"
+    READ_ELEMENTS = "read_elements.js"
+    GET_DOCUMENT_IDENTITY = "get_document_identity.js"
+
+    @property
+    def script(self) -> str:
+        """Get script ready to be executed by WebDriver."""
+        return _load_script(self.value, self not in _SCRIPTS_WITHOUT_HELPERS)
+
+
+_SCRIPTS_WITHOUT_HELPERS = {JavaScript.GET_DOCUMENT_IDENTITY}
+
+
+@lru_cache(maxsize=None)
+def _load_script(file_name: str, with_helpers: bool) -> str:
+    script = ResourceFile(os.path.join("js", file_name)).file_content
+    if not with_helpers:
+        return script
+    is_displayed_atom = _load_atom("isDisplayed.js")
+    get_attribute_atom = _load_atom("getAttribute.js")
+    helpers = ResourceFile(os.path.join("js", "element_helpers.js")).file_content
+    return (
+        f"var isDisplayed = {is_displayed_atom};\n"
+        f"var getAttribute = {get_attribute_atom};\n{helpers}\n{script}"
+    )
+
+
+def _load_atom(file_name: str) -> str:
+    atom = pkgutil.get_data("selenium.webdriver.remote", file_name)
+    return cast(bytes, atom).decode("utf8")
@@ -0,0 +1,250 @@
+"""Module defines logging pipeline which moves writing of log records to background thread."""
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from typing import cast
+from typing import List
+from typing import Optional
+
+from aquality_selenium_core.configurations.logger_configuration import (
+    AbstractLoggerConfiguration,
+)
+from aquality_selenium_core.configurations.logger_configuration import (
+    QueueOverflowPolicy,
+)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Handler which puts records to bounded queue and applies overflow policy when the queue is full."""
+
+    def __init__(
+        self, records_queue: "queue.Queue", overflow_policy: QueueOverflowPolicy
+    ):
+        """
+        Initialize handler with queue and overflow policy.
+
+        :param records_queue: Bounded queue of records.
+        :param overflow_policy: What to do with record when the queue is full.
+        """
+        super().__init__(records_queue)
+        self.__overflow_policy = overflow_policy
+        self.__dropped_count = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def dropped_count(self) -> int:
+        """Get number of records dropped because the queue was full."""
+        return self.__dropped_count
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Put record to the queue according to overflow policy.
+
+        Stop signal of the listener is never dropped, the new record is dropped instead.
+        :param record: Prepared log record.
+        """
+        records_queue = cast(queue.Queue, self.queue)
+        if self.__overflow_policy == QueueOverflowPolicy.BLOCK:
+            records_queue.put(record)
+            return
+        while True:
+            try:
+                records_queue.put_nowait(record)
+                return
+            except queue.Full:
+                with self.__lock:
+                    self.__dropped_count += 1
+                if self.__overflow_policy == QueueOverflowPolicy.DROP_NEWEST:
+                    return
+            try:
+                oldest_record = records_queue.get_nowait()
+            except queue.Empty:
+                continue
+            if oldest_record is BatchingQueueListener._sentinel:
+                records_queue.put(oldest_record)
+                return
+
+
+class BatchingQueueListener(QueueListener):
+    """Listener which handles all records available in the queue at once and flushes handlers after each batch."""
+
+    def __init__(
+        self,
+        records_queue: "queue.Queue",
+        handlers: List[logging.Handler],
+        batch_size: int,
+    ):
+        """
+        Initialize listener with queue and handlers.
+
+        :param records_queue: Queue of records.
+        :param handlers: Handlers which records are passed to.
+        :param batch_size: Maximal number of records handled before handlers are flushed.
+        """
+        super().__init__(records_queue, *handlers, respect_handler_level=True)
+        self.__batch_size = max(batch_size, 1)
+
+    def enqueue_sentinel(self) -> None:
+        """Put stop signal to the queue, waiting for free space if the queue is full."""
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        """Handle records in batches until sentinel is received."""
+        is_stopped = False
+        while not is_stopped:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.__batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            for record in batch:
+                if record is self._sentinel:
+                    is_stopped = True
+                else:
+                    self.handle(record)
+            for handler in self.handlers:
+                handler.flush()
+
+
+class QueuedLoggingPipeline:
+    """
+    Logging mode in which records are put to bounded queue on the caller's thread and written by background thread.
+
+    Handlers of the logger are moved behind the queue when pipeline is started and returned back when it is stopped.
+    Handlers are swapped at once, so records logged by other threads meanwhile are not lost.
+    Capture handlers of pytest stay on the logger. If there are no other handlers which would write records,
+    they are written by logging.lastResort as they would be without the pipeline.
+    Pipeline is stopped and remaining records are written on interpreter shutdown.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 10000,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+        batch_size: int = 100,
+        logger: logging.Logger = cast(logging.Logger, None),
+    ):
+        """
+        Initialize pipeline.
+
+        :param queue_size: Maximal number of records waiting to be written.
+        :param overflow_policy: What to do with record when the queue is full.
+        :param batch_size: Maximal number of records written before handlers are flushed.
+        :param logger: Logger which handlers are moved behind the queue, root logger by default.
+        """
+        self.__queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.__overflow_policy = overflow_policy
+        self.__batch_size = batch_size
+        self.__logger = logger if logger is not None else logging.getLogger()
+        self.__handler: Optional[BoundedQueueHandler] = None
+        self.__listener: Optional[BatchingQueueListener] = None
+        self.__handlers: List[logging.Handler] = []
+        self.__lock = threading.Lock()
+
+    @property
+    def is_started(self) -> bool:
+        """Get whether records are written by background thread."""
+        return self.__listener is not None
+
+    @property
+    def dropped_count(self) -> int:
+        """Get number of records dropped because the queue was full since the pipeline was started."""
+        return self.__handler.dropped_count if self.__handler is not None else 0
+
+    def start(self) -> None:
+        """Move handlers of the logger behind the queue and start background thread."""
+        with self.__lock:
+            if self.__listener is not None:
+                return
+            self.__handlers = [
+                handler
+                for handler in self.__logger.handlers
+                if not _is_capture_handler(handler)
+            ]
+            listener_handlers = list(self.__handlers)
+            if not listener_handlers and not _has_parent_handlers(self.__logger):
+                listener_handlers.append(
+                    logging.lastResort
+                    if logging.lastResort is not None
+                    else logging.StreamHandler()
+                )
+            self.__handler = BoundedQueueHandler(self.__queue, self.__overflow_policy)
+            self.__listener = BatchingQueueListener(
+                self.__queue, listener_handlers, self.__batch_size
+            )
+            self.__listener.start()
+            _replace_handlers(self.__logger, self.__handlers, [self.__handler])
+            atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Write remaining records, stop background thread and return handlers to the logger."""
+        with self.__lock:
+            if self.__listener is None:
+                return
+            _replace_handlers(
+                self.__logger,
+                [cast(BoundedQueueHandler, self.__handler)],
+                self.__handlers,
+            )
+            self.__listener.stop()
+            self.__listener = None
+            self.__handler = None
+            atexit.unregister(self.stop)
+
+
+def _is_capture_handler(handler: logging.Handler) -> bool:
+    return type(handler).__module__.startswith("_pytest.")
+
+
+def _has_parent_handlers(logger: logging.Logger) -> bool:
+    current: Optional[logging.Logger] = logger
+    while current is not None and current.propagate:
+        current = current.parent
+        if current is not None and any(
+            not _is_capture_handler(handler) for handler in current.handlers
+        ):
+            return True
+    return False
+
+
+def _replace_handlers(
+    logger: logging.Logger,
+    old_handlers: List[logging.Handler],
+    new_handlers: List[logging.Handler],
+) -> None:
+    logger.handlers = [
+        handler for handler in logger.handlers if handler not in old_handlers
+    ] + new_handlers
+
+
+_pipeline: Optional[QueuedLoggingPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def start_queued_logging(
+    configuration: AbstractLoggerConfiguration,
+) -> Optional[QueuedLoggingPipeline]:
+    """
+    Start queued logging of the root logger if it is enabled in configuration.
+
+    Pipeline is started once per process, subsequent calls return the same pipeline.
+    It should be called at startup after logging is configured, e.g. in a session fixture.
+    :param configuration: Logger configuration.
+    :return: Started pipeline or None if queued logging is disabled.
+    """
+    global _pipeline
+    if not configuration.is_queue_enabled:
+        return None
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = QueuedLoggingPipeline(
+                configuration.queue_size,
+                configuration.queue_overflow_policy,
+                configuration.queue_batch_size,
+            )
+        _pipeline.start()
+        return _pipeline
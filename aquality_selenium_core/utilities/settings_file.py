@@ -1,20 +1,36 @@
 """Module defines work with settings file."""
+import inspect
 import json
 import logging
 import os
+import re
+import threading
 from abc import ABC
 from abc import abstractmethod
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any
+from typing import Callable
 from typing import cast
 from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Set
+from typing import Tuple
+from weakref import WeakMethod
 
-from jsonpath_ng import DatumInContext
+from jsonpath_ng import JSONPath
 from jsonpath_ng import parse
 
 from aquality_selenium_core.utilities.resource_file import ResourceFile
 
+JSON_PATH_CACHE_SIZE = 256
+
+_KEY = r"[A-Za-z_@][A-Za-z0-9_@-]*"
+_INDEXED_KEY = re.compile(rf"{_KEY}$")
+_SIMPLE_PATH = re.compile(rf"{_KEY}(?:\[\d+\])*(?:\.{_KEY}(?:\[\d+\])*)*$")
+
 
 class AbstractSettingsFile(ABC):
     """Abstract class which defines work with settings file."""
@@ -69,14 +85,79 @@ class AbstractSettingsFile(ABC):
         """
         pass
 
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        """
+        Subscribe to changes of settings.
+
+        Settings file which is never reloaded does not call subscribers.
+        :param callback: Function called after settings are changed, e.g. reload method of configuration.
+        """
+        pass
+
 
 class JsonSettingsFile(AbstractSettingsFile):
     """Class which defines work with .json settings file."""
 
     def __init__(self, resource_name: str, root_dir: str = cast(str, None)):
-        """Initialize work with .json setting file by provided path."""
+        """
+        Initialize work with .json setting file by provided path.
+
+        Values are indexed by their dotted paths once, so lookups by simple paths like "timeouts.timeoutImplicit"
+        or "arguments.start[0]" do not evaluate JSONPath. Other paths are evaluated by compiled JSONPath expressions.
+        Environment variables overriding settings are captured once too, see refresh_environment.
+        """
         self.__resource_file = ResourceFile(resource_name, root_dir)
-        self.__content = json.loads(self.__resource_file.file_content)
+        self.__content = _index_content(self._read_content())
+        self.__environment: Dict[str, str] = {}
+        self.__logged_env_keys: Set[str] = set()
+        self.refresh_environment()
+
+    @property
+    def resource_file(self) -> ResourceFile:
+        """Get file which settings are read from."""
+        return self.__resource_file
+
+    def reload(self) -> None:
+        """
+        Read settings file again.
+
+        Parsed and indexed content replaces the previous one at once, so concurrent reads get either old or new values.
+        :raises: ValueError if file content is not a valid JSON, previous content is kept in this case.
+        """
+        self.__content = _index_content(self._read_content())
+
+    def _read_content(self) -> Any:
+        """
+        Read and parse content of settings.
+
+        :return: Parsed JSON content.
+        """
+        return json.loads(self.__resource_file.file_content)
+
+    def refresh_environment(self) -> None:
+        """
+        Capture environment variables which override values of settings file.
+
+        Variable overrides the setting if its name is equal to the setting path, e.g. "timeouts.timeoutImplicit".
+        Otherwise names are compared ignoring case and treating underscores as dots, e.g. "TIMEOUTS_TIMEOUTIMPLICIT".
+        If several variables match the same setting this way, a warning is logged and the first variable
+        in alphabetical order is used. Variables changed after capture are not used until the next refresh.
+        """
+        environment: Dict[str, str] = {}
+        variable_names: Dict[str, str] = {}
+        for name in sorted(os.environ):
+            key = _normalize_env_key(name)
+            if key in variable_names:
+                logging.warning(
+                    f"Environment variables {variable_names[key]} and {name} override the same setting "
+                    f"{key}, value of {variable_names[key]} is used"
+                )
+                continue
+            variable_names[key] = name
+            environment[key] = os.environ[name]
+        environment.update(os.environ)
+        self.__environment = environment
+        self.__logged_env_keys = set()
 
     def get_value(self, path: str) -> Any:
         """
@@ -100,7 +181,7 @@ class JsonSettingsFile(AbstractSettingsFile):
         data = (
             env_var.split(",")
             if env_var
-            else self.__get_json_node(path, throw_if_empty=True)[0].value
+            else self.__get_json_node(path, throw_if_empty=True)[0]
         )
         return [value.strip() for value in data]
 
@@ -113,7 +194,7 @@ class JsonSettingsFile(AbstractSettingsFile):
         :raises: ValueError if nothing is found.
         """
         node = self.__get_json_node(path, throw_if_empty=True)
-        return {key: self.get_value(f"{path}.{key}") for key in node[0].value}
+        return {key: self.get_value(f"{path}.{key}") for key in node[0]}
 
     def is_value_present(self, path: str) -> bool:
         """
@@ -127,6 +208,22 @@ class JsonSettingsFile(AbstractSettingsFile):
             or len(self.__get_json_node(path, throw_if_empty=False)) > 0
         )
 
+    def get_value_or_default(self, path: str, default: Any) -> Any:
+        """
+        Get single value by specified path from environment variables or settings file or default if not present.
+
+        :param path: Path to value.
+        :param default: Default value.
+        :return: Value by specified path or default if not present.
+        """
+        env_var = self.__get_env_value(path)
+        node = self.__get_json_node(
+            path, throw_if_empty=env_var is not None and not env_var
+        )
+        if not node and env_var is None:
+            return default
+        return self.__use_env_value_or_default(node, env_var) if node else env_var
+
     def __get_env_value_or_default(
         self, json_path: str, throw_if_empty: bool = False
     ) -> Any:
@@ -135,25 +232,233 @@ class JsonSettingsFile(AbstractSettingsFile):
         return self.__use_env_value_or_default(node, env_var) if node else env_var
 
     @staticmethod
-    def __use_env_value_or_default(node: List[DatumInContext], env_value: Any) -> Any:
-        node_value: Any = node[0].value
+    def __use_env_value_or_default(node: List[Any], env_value: Any) -> Any:
+        node_value: Any = node[0]
         return env_value if env_value else node_value
 
-    def __get_json_node(
-        self, json_path: str, throw_if_empty: bool
-    ) -> List[DatumInContext]:
-        node: List[DatumInContext] = parse(f"$.{json_path}").find(self.__content)
+    def __get_json_node(self, json_path: str, throw_if_empty: bool) -> List[Any]:
+        if _SIMPLE_PATH.match(json_path):
+            index = self.__content.index
+            node = [index[json_path]] if json_path in index else []
+        else:
+            node = [
+                match.value
+                for match in _compile_json_path(json_path).find(self.__content.content)
+            ]
         if not node and throw_if_empty:
             raise ValueError(
-                f"Json field by json-path {json_path} was not found in the file {self.__content}"
+                f"Json field by json-path {json_path} was not found in the file {self.__content.content}"
             )
         return node
 
-    @staticmethod
-    def __get_env_value(json_path: str) -> Optional[str]:
-        env_var = os.getenv(json_path)
-        if env_var:
+    def __get_env_value(self, json_path: str) -> Optional[str]:
+        env_var = self.__environment.get(json_path)
+        if env_var is None:
+            env_var = self.__environment.get(_normalize_env_key(json_path))
+        if env_var and json_path not in self.__logged_env_keys:
+            self.__logged_env_keys.add(json_path)
             logging.debug(
                 f"***** Using variable passed from environment {json_path}={env_var}"
             )
         return env_var
+
+
+class LayeredSettingsFile(JsonSettingsFile):
+    """
+    Settings merged from several .json files.
+
+    Files are deep-merged in order at load time: objects are merged key by key, other values of the later file
+    replace values of the previous one. Merged content is indexed once, so lookups do not depend on number of layers.
+    """
+
+    def __init__(
+        self,
+        resource_names: List[str],
+        root_dir: str = cast(str, None),
+    ):
+        """
+        Initialize work with layered settings files.
+
+        :param resource_names: Names of settings files from base one to local override, e.g.
+        ["settings.json", "settings.ci.json", "settings.local.json"]. All files except the base one are optional.
+        :param root_dir: Directory containing "resources" directory with settings files.
+        """
+        if not resource_names:
+            raise ValueError("Layered settings should contain at least base file")
+        self.__resource_files = [
+            ResourceFile(resource_name, root_dir) for resource_name in resource_names
+        ]
+        super().__init__(resource_names[0], root_dir)
+
+    @property
+    def resource_files(self) -> List[ResourceFile]:
+        """Get settings files from base one to local override."""
+        return list(self.__resource_files)
+
+    def _read_content(self) -> Any:
+        """
+        Read and merge content of all existing layers.
+
+        :return: Merged JSON content.
+        """
+        base_file, *layer_files = self.__resource_files
+        content = json.loads(base_file.file_content)
+        for layer_file in layer_files:
+            if layer_file.exists:
+                content = _merge(content, json.loads(layer_file.file_content))
+        return content
+
+
+class ReloadableJsonSettingsFile(JsonSettingsFile):
+    """
+    Settings file which is read again when it is changed.
+
+    Changes are detected by modification time and size of the file, either on explicit check
+    or by background watcher. Subscribers are notified after new content is applied.
+    """
+
+    def __init__(
+        self,
+        resource_name: str,
+        root_dir: str = cast(str, None),
+        check_interval: timedelta = timedelta(seconds=1),
+    ):
+        """
+        Initialize work with .json setting file by provided path.
+
+        :param resource_name: Name of settings file.
+        :param root_dir: Directory containing "resources" directory with settings file.
+        :param check_interval: Interval between checks of the file made by background watcher.
+        """
+        super().__init__(resource_name, root_dir)
+        self.__check_interval = check_interval
+        self.__file_stamp = self.__get_file_stamp()
+        self.__subscribers: List[Callable[[], Optional[Callable[[], None]]]] = []
+        self.__lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__watcher: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        """
+        Subscribe to changes of settings.
+
+        Bound methods are referenced weakly, so subscribed configuration could be garbage collected.
+        :param callback: Function called after settings are changed, e.g. reload method of configuration.
+        """
+        reference: Callable[[], Optional[Callable[[], None]]] = (
+            WeakMethod(callback) if inspect.ismethod(callback) else lambda: callback
+        )
+        with self.__lock:
+            self.__subscribers.append(reference)
+
+    def check_for_changes(self) -> bool:
+        """
+        Read settings file again if it was changed and notify subscribers.
+
+        Exceptions raised by subscribers are logged, so other subscribers and the watcher keep working.
+        :return: True if new settings were applied and false otherwise.
+        """
+        with self.__lock:
+            file_stamp = self.__get_file_stamp()
+            if file_stamp == self.__file_stamp:
+                return False
+            try:
+                self.reload()
+            except (OSError, ValueError) as exception:
+                logging.warning(
+                    f"Settings file {self.resource_file.file_canonical_path} was not reloaded: {exception}"
+                )
+                return False
+            self.__file_stamp = file_stamp
+            self.__subscribers = [
+                reference for reference in self.__subscribers if reference() is not None
+            ]
+            subscribers = list(self.__subscribers)
+        for reference in subscribers:
+            callback = reference()
+            if callback is None:
+                continue
+            try:
+                callback()
+            except Exception as exception:
+                logging.warning(
+                    f"Subscriber of settings file {self.resource_file.file_canonical_path} failed: {exception}"
+                )
+        return True
+
+    def start_watching(self) -> None:
+        """Start background thread which checks the file for changes."""
+        with self.__lock:
+            if self.__watcher is not None and self.__watcher.is_alive():
+                return
+            self.__stop_event.clear()
+            self.__watcher = threading.Thread(
+                target=self.__watch, name="SettingsFileWatcher", daemon=True
+            )
+            self.__watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop background thread which checks the file for changes."""
+        with self.__lock:
+            watcher = self.__watcher
+            self.__watcher = None
+        if watcher is not None:
+            self.__stop_event.set()
+            watcher.join()
+
+    def __watch(self) -> None:
+        while not self.__stop_event.wait(self.__check_interval.total_seconds()):
+            self.check_for_changes()
+
+    def __get_file_stamp(self) -> Tuple[int, int]:
+        try:
+            stat = os.stat(self.resource_file.file_canonical_path)
+        except OSError:
+            return 0, 0
+        return stat.st_mtime_ns, stat.st_size
+
+
+class _SettingsContent(NamedTuple):
+    content: Any
+    index: Dict[str, Any]
+
+
+def _index_content(content: Any) -> _SettingsContent:
+    return _SettingsContent(content, _build_index(content))
+
+
+def _merge(base: Any, override: Any) -> Any:
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return override
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = _merge(merged[key], value) if key in merged else value
+    return merged
+
+
+def _build_index(content: Any) -> Dict[str, Any]:
+    index: Dict[str, Any] = {}
+
+    def add(path: str, value: Any) -> None:
+        index[path] = value
+        if isinstance(value, dict):
+            for key, child in value.items():
+                if _INDEXED_KEY.match(key):
+                    add(f"{path}.{key}" if path else key, child)
+        elif isinstance(value, list) and path:
+            for position, child in enumerate(value):
+                add(f"{path}[{position}]", child)
+
+    add("", content)
+    del index[""]
+    return index
+
+
+@lru_cache(maxsize=JSON_PATH_CACHE_SIZE)
+def _compile_json_path(json_path: str) -> JSONPath:
+    return parse(f"$.{json_path}")
+
+
+@lru_cache(maxsize=JSON_PATH_CACHE_SIZE)
+def _normalize_env_key(key: str) -> str:
+    return key.lower().replace("_", ".")
@@ -0,0 +1,307 @@
+"""Module defines waiting functionality for asyncio event loop."""
+import asyncio
+import functools
+import inspect
+import time
+from abc import ABC
+from abc import abstractmethod
+from concurrent.futures import Executor
+from datetime import timedelta
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import cast
+from typing import List
+from typing import Optional
+from typing import Type
+from typing import TypeVar
+from typing import Union
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from aquality_selenium_core.applications.application import AbstractApplication
+from aquality_selenium_core.configurations.timeout_configuration import (
+    AbstractTimeoutConfiguration,
+)
+from aquality_selenium_core.waitings.polling_strategy import AbstractPollingStrategy
+
+T = TypeVar("T")
+
+
+class AbstractAsyncConditionalWait(ABC):
+    """Utility used to wait for some condition without blocking event loop."""
+
+    @abstractmethod
+    async def wait_for_with_driver(
+        self,
+        condition: Callable[[WebDriver], Union[T, Awaitable[T]]],
+        timeout: timedelta = cast(timedelta, None),
+        polling_interval: timedelta = cast(timedelta, None),
+        message: str = "",
+        exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
+    ) -> T:
+        """
+        Wait for some condition using WebDriver within timeout.
+
+        :param condition: Function or coroutine function for waiting.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
+        :param message: Part of error message in case of TimeoutException.
+        :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
+        :return: Result of condition.
+        :raises: TimeoutException when timeout exceeded and condition not satisfied.
+        """
+        pass
+
+    @abstractmethod
+    async def wait_for(
+        self,
+        condition: Callable[..., Union[bool, Awaitable[bool]]],
+        timeout: timedelta = cast(timedelta, None),
+        polling_interval: timedelta = cast(timedelta, None),
+        exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
+    ) -> bool:
+        """
+        Wait for some condition within timeout.
+
+        :param condition: Function or coroutine function for waiting.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
+        :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
+        :return: True if condition satisfied and false otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def wait_for_true(
+        self,
+        condition: Callable[..., Union[bool, Awaitable[bool]]],
+        timeout: timedelta = cast(timedelta, None),
+        polling_interval: timedelta = cast(timedelta, None),
+        message: str = "",
+        exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
+    ) -> None:
+        """
+        Wait for some condition within timeout.
+
+        :param condition: Predicate or coroutine function for waiting.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
+        :param message: Part of error message in case of Timeout exception.
+        :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
+        """
+        pass
+
+
+class AsyncConditionalWait(AbstractAsyncConditionalWait):
+    """
+    This class is used for waiting any conditions in asyncio event loop.
+
+    Coroutine functions and conditions returning awaitable objects are awaited in the loop.
+    Other conditions are treated as blocking WebDriver calls and run in executor.
+    """
+
+    def __init__(
+        self,
+        timeout_configuration: AbstractTimeoutConfiguration,
+        application: AbstractApplication,
+        executor: Executor = cast(Executor, None),
+    ):
+        """
+        Initialize with configuration.
+
+        :param timeout_configuration: Timeout configuration.
+        :param application: Application controlled by WebDriver.
+        :param executor: Executor for blocking calls. Default executor of event loop is used if not set.
+        """
+        self.__timeout_configuration = timeout_configuration
+        self.__application = application
+        self.__executor = executor
+
+    async def wait_for_with_driver(
+        self,
+        condition: Callable[[WebDriver], Union[T, Awaitable[T]]],
+        timeout: timedelta = cast(timedelta, None),
+        polling_interval: timedelta = cast(timedelta, None),
+        message: str = "",
+        exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
+    ) -> T:
+        """
+        Wait for some condition using WebDriver within timeout.
+
+        :param condition: Function or coroutine function for waiting.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
+        :param message: Part of error message in case of TimeoutException.
+        :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
+        :return: Result of condition.
+        :raises: TimeoutException when timeout exceeded and condition not satisfied.
+        """
+        ignored_exceptions = [NoSuchElementException] + (
+            exceptions_to_ignore
+            if exceptions_to_ignore
+            else [StaleElementReferenceException]
+        )
+        scope = self.__application.implicit_wait_tracker.suspend(
+            self.__timeout_configuration.implicit
+        )
+        await self.run_blocking(scope.__enter__)
+        try:
+            driver = self.__application.driver
+            result = await self.__poll(
+                functools.partial(condition, driver),
+                ignored_exceptions,
+                timeout,
+                polling_interval,
+                polling_strategy,
+            )
+        finally:
+            await self.run_blocking(scope.__exit__, None, None, None)
+        if result is None:
+            raise TimeoutException(message)
+        return result
+
+    async def wait_for(
+        self,
+        condition: Callable[..., Union[bool, Awaitable[bool]]],
+        timeout: timedelta = cast(timedelta, None),
+        polling_interval: timedelta = cast(timedelta, None),
+        exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
+    ) -> bool:
+        """
+        Wait for some condition within timeout.
+
+        :param condition: Function or coroutine function for waiting.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
+        :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
+        :return: True if condition satisfied and false otherwise.
+        """
+        try:
+            await self.wait_for_true(
+                condition,
+                timeout,
+                polling_interval,
+                exceptions_to_ignore=exceptions_to_ignore,
+                polling_strategy=polling_strategy,
+            )
+            return True
+        except TimeoutError:
+            return False
+
+    async def wait_for_true(
+        self,
+        condition: Callable[..., Union[bool, Awaitable[bool]]],
+        timeout: timedelta = cast(timedelta, None),
+        polling_interval: timedelta = cast(timedelta, None),
+        message: str = "",
+        exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
+    ) -> None:
+        """
+        Wait for some condition within timeout.
+
+        :param condition: Predicate or coroutine function for waiting.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
+        :param message: Part of error message in case of Timeout exception.
+        :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
+        """
+        result = await self.__poll(
+            condition, exceptions_to_ignore, timeout, polling_interval, polling_strategy
+        )
+        if result is None:
+            raise TimeoutError(
+                f"Timed out after {self.__resolve_condition_timeout(timeout)} seconds "
+                f"during wait for condition '{message}'"
+            )
+
+    async def run_blocking(self, function: Callable[..., T], *args: Any) -> T:
+        """
+        Run blocking function in executor without blocking event loop.
+
+        :param function: Blocking function, e.g. WebDriver call.
+        :param args: Arguments of the function.
+        :return: Result of the function.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.__executor, function, *args)
+
+    async def __poll(
+        self,
+        condition: Callable[[], Any],
+        exceptions_to_ignore: List[Type[Exception]],
+        timeout: timedelta,
+        polling_interval: timedelta,
+        polling_strategy: AbstractPollingStrategy,
+    ) -> Optional[Any]:
+        wait_timeout = self.__resolve_condition_timeout(timeout)
+        check_interval = (
+            polling_interval
+            if polling_interval is not None
+            else self.__timeout_configuration.polling_interval
+        )
+        strategy = (
+            polling_strategy
+            if polling_strategy is not None
+            else self.__timeout_configuration.polling_strategy
+        )
+        end_time = time.monotonic() + wait_timeout
+        attempt = 0
+
+        while True:
+            result = await self.__check_condition(condition, exceptions_to_ignore)
+            if result:
+                return result
+
+            time_left = end_time - time.monotonic()
+            if time_left <= 0:
+                return None
+
+            delay = strategy.get_interval(check_interval, attempt).total_seconds()
+            await asyncio.sleep(min(delay, time_left))
+            attempt += 1
+
+    async def __check_condition(
+        self,
+        condition: Callable[[], Any],
+        exceptions_to_ignore: List[Type[Exception]],
+    ) -> Any:
+        try:
+            if self.__is_coroutine_function(condition):
+                return await condition()
+            result = await self.run_blocking(condition)
+            return await result if inspect.isawaitable(result) else result
+        except Exception as exception:
+            if any(
+                isinstance(exception, ignored_exception)
+                for ignored_exception in exceptions_to_ignore
+            ):
+                return False
+            raise
+
+    @staticmethod
+    def __is_coroutine_function(function: Callable) -> bool:
+        while isinstance(function, functools.partial):
+            function = function.func
+        return asyncio.iscoroutinefunction(function)
+
+    def __resolve_condition_timeout(self, timeout: timedelta) -> float:
+        condition_timeout = (
+            timeout if timeout is not None else self.__timeout_configuration.condition
+        )
+        return condition_timeout.total_seconds()
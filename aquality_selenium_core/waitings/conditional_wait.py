@@ -6,17 +6,20 @@ from datetime import timedelta
 from typing import Callable
 from typing import cast
 from typing import List
+from typing import Optional
 from typing import Type
 from typing import TypeVar
 
+from selenium.common.exceptions import NoSuchElementException
 from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.wait import WebDriverWait
 
 from aquality_selenium_core.applications.application import AbstractApplication
 from aquality_selenium_core.configurations.timeout_configuration import (
     AbstractTimeoutConfiguration,
 )
+from aquality_selenium_core.waitings.polling_strategy import AbstractPollingStrategy
 
 T = TypeVar("T")
 
@@ -32,15 +35,17 @@ class AbstractConditionalWait(ABC):
         polling_interval: timedelta = cast(timedelta, None),
         message: str = "",
         exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
     ) -> T:
         """
         Wait for some condition using WebDriver within timeout.
 
         :param condition: Function for waiting
-        :param timeout: Condition timeout (in seconds). Default value is taken from configuration.
-        :param polling_interval: Condition check interval (in milliseconds). Default value is taken from configuration.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
         :param message: Part of error message in case of TimeoutException.
         :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
         :return: Result of condition.
         :raises: TimeoutException when timeout exceeded and condition not satisfied.
         """
@@ -53,14 +58,16 @@ class AbstractConditionalWait(ABC):
         timeout: timedelta = cast(timedelta, None),
         polling_interval: timedelta = cast(timedelta, None),
         exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
     ) -> bool:
         """
         Wait for some condition within timeout.
 
         :param condition: Function for waiting
-        :param timeout: Condition timeout (in seconds). Default value is taken from configuration.
-        :param polling_interval: Condition check interval (in milliseconds). Default value is taken from configuration.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
         :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
         :return: True if condition satisfied and false otherwise.
         """
         pass
@@ -73,15 +80,17 @@ class AbstractConditionalWait(ABC):
         polling_interval: timedelta = cast(timedelta, None),
         message: str = "",
         exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
     ) -> None:
         """
         Wait for some condition within timeout.
 
         :param condition: Predicate for waiting.
-        :param timeout: Condition timeout (in seconds). Default value is taken from configuration.
-        :param polling_interval: Condition check interval (in milliseconds). Default value is taken from configuration.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
         :param message: Part of error message in case of Timeout exception.
         :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
         """
         pass
 
@@ -105,35 +114,40 @@ class ConditionalWait(AbstractConditionalWait):
         polling_interval: timedelta = cast(timedelta, None),
         message: str = "",
         exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
     ) -> T:
         """
         Wait for some condition using WebDriver within timeout.
 
         :param condition: Function for waiting
-        :param timeout: Condition timeout (in seconds). Default value is taken from configuration.
-        :param polling_interval: Condition check interval (in milliseconds). Default value is taken from configuration.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
         :param message: Part of error message in case of TimeoutException.
         :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
         :return: Result of condition.
         :raises: TimeoutException when timeout exceeded and condition not satisfied.
         """
-        wait_timeout = self.__resolve_condition_timeout(timeout)
-        check_interval = self.__resolve_polling_interval(polling_interval)
-        ignored_exceptions = (
+        ignored_exceptions = [NoSuchElementException] + (
             exceptions_to_ignore
             if exceptions_to_ignore
             else [StaleElementReferenceException]
         )
-        self.__application.set_implicit_wait_timeout(timedelta())
-        wait = WebDriverWait(
-            self.__application.driver, wait_timeout, check_interval, ignored_exceptions
-        )
-        try:
-            return cast(T, wait.until(condition, message))
-        finally:
-            self.__application.set_implicit_wait_timeout(
-                self.__timeout_configuration.implicit
+        with self.__application.implicit_wait_tracker.suspend(
+            self.__timeout_configuration.implicit
+        ):
+            driver = self.__application.driver
+            result = self.__poll(
+                lambda: self.__is_condition_satisfied(
+                    lambda: condition(driver), ignored_exceptions
+                ),
+                timeout,
+                polling_interval,
+                polling_strategy,
             )
+        if result is None:
+            raise TimeoutException(message)
+        return result
 
     def wait_for(
         self,
@@ -141,14 +155,16 @@ class ConditionalWait(AbstractConditionalWait):
         timeout: timedelta = cast(timedelta, None),
         polling_interval: timedelta = cast(timedelta, None),
         exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
     ) -> bool:
         """
         Wait for some condition within timeout.
 
         :param condition: Function for waiting
-        :param timeout: Condition timeout (in seconds). Default value is taken from configuration.
-        :param polling_interval: Condition check interval (in milliseconds). Default value is taken from configuration.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
         :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
         :return: True if condition satisfied and false otherwise.
         """
 
@@ -158,6 +174,7 @@ class ConditionalWait(AbstractConditionalWait):
                 timeout,
                 polling_interval,
                 exceptions_to_ignore=exceptions_to_ignore,
+                polling_strategy=polling_strategy,
             )
             return True
 
@@ -170,36 +187,60 @@ class ConditionalWait(AbstractConditionalWait):
         polling_interval: timedelta = cast(timedelta, None),
         message: str = "",
         exceptions_to_ignore: List[Type[Exception]] = [],
+        polling_strategy: AbstractPollingStrategy = cast(AbstractPollingStrategy, None),
     ) -> None:
         """
         Wait for some condition within timeout.
 
         :param condition: Predicate for waiting.
-        :param timeout: Condition timeout (in seconds). Default value is taken from configuration.
-        :param polling_interval: Condition check interval (in milliseconds). Default value is taken from configuration.
+        :param timeout: Condition timeout. Default value is taken from configuration.
+        :param polling_interval: Condition check interval. Default value is taken from configuration.
         :param message: Part of error message in case of Timeout exception.
         :param exceptions_to_ignore: Possible exceptions that have to be ignored.
+        :param polling_strategy: Strategy of delays between checks. Default value is taken from configuration.
         """
+        result = self.__poll(
+            lambda: self.__is_condition_satisfied(condition, exceptions_to_ignore),
+            timeout,
+            polling_interval,
+            polling_strategy,
+        )
+        if result is None:
+            raise TimeoutError(
+                f"Timed out after {self.__resolve_condition_timeout(timeout)} seconds "
+                f"during wait for condition '{message}'"
+            )
+
+    def __poll(
+        self,
+        condition: Callable[[], T],
+        timeout: timedelta,
+        polling_interval: timedelta,
+        polling_strategy: AbstractPollingStrategy,
+    ) -> Optional[T]:
         wait_timeout = self.__resolve_condition_timeout(timeout)
         check_interval = self.__resolve_polling_interval(polling_interval)
-        start_time = time.time()
+        strategy = self.__resolve_polling_strategy(polling_strategy)
+        end_time = time.monotonic() + wait_timeout
+        attempt = 0
 
         while True:
-            if self.__is_condition_satisfied(condition, exceptions_to_ignore):
-                return
+            result = condition()
+            if result:
+                return result
 
-            current_time = time.time()
-            if (current_time - start_time) > wait_timeout:
-                raise TimeoutError(
-                    f"Timed out after {wait_timeout} seconds during wait for condition '{message}'"
-                )
+            time_left = end_time - time.monotonic()
+            if time_left <= 0:
+                return None
 
-            time.sleep(check_interval)
+            delay = strategy.get_interval(check_interval, attempt).total_seconds()
+            time.sleep(min(delay, time_left))
+            attempt += 1
 
     @staticmethod
     def __is_condition_satisfied(
-        condition: Callable[..., bool], exceptions_to_ignore: List[Type[Exception]] = []
-    ) -> bool:
+        condition: Callable[..., T], exceptions_to_ignore: List[Type[Exception]] = []
+    ) -> T:
         try:
             return condition()
         except Exception as exception:
@@ -207,19 +248,27 @@ class ConditionalWait(AbstractConditionalWait):
                 isinstance(exception, ignored_exception)
                 for ignored_exception in exceptions_to_ignore
             ):
-                return False
+                return cast(T, False)
             raise
 
-    def __resolve_condition_timeout(self, timeout: timedelta) -> int:
+    def __resolve_condition_timeout(self, timeout: timedelta) -> float:
         condition_timeout = (
             timeout if timeout is not None else self.__timeout_configuration.condition
         )
-        return condition_timeout.seconds
+        return condition_timeout.total_seconds()
 
-    def __resolve_polling_interval(self, polling_interval: timedelta) -> int:
-        interval = (
+    def __resolve_polling_interval(self, polling_interval: timedelta) -> timedelta:
+        return (
             polling_interval
             if polling_interval is not None
             else self.__timeout_configuration.polling_interval
         )
-        return interval.seconds
+
+    def __resolve_polling_strategy(
+        self, polling_strategy: AbstractPollingStrategy
+    ) -> AbstractPollingStrategy:
+        return (
+            polling_strategy
+            if polling_strategy is not None
+            else self.__timeout_configuration.polling_strategy
+        )
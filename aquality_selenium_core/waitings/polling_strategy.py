@@ -0,0 +1,122 @@
+"""Module defines strategies of delays between condition checks used by waitings."""
+import random
+from abc import ABC
+from abc import abstractmethod
+from datetime import timedelta
+from enum import Enum
+
+
+class PollingStrategyType(Enum):
+    """Enumeration with polling strategies which could be selected in configuration."""
+
+    FIXED = "fixed"
+    EXPONENTIAL = "exponential"
+    JITTERED = "jittered"
+
+
+class AbstractPollingStrategy(ABC):
+    """Defines delay before the next check of waiting condition."""
+
+    @abstractmethod
+    def get_interval(self, polling_interval: timedelta, attempt: int) -> timedelta:
+        """
+        Get delay before the next check of condition.
+
+        :param polling_interval: Base polling interval of the waiting.
+        :param attempt: Number of failed checks made before, starting from zero.
+        :return: Delay before the next check.
+        """
+        pass
+
+
+class FixedPollingStrategy(AbstractPollingStrategy):
+    """Checks condition with the same polling interval."""
+
+    def get_interval(self, polling_interval: timedelta, attempt: int) -> timedelta:
+        """
+        Get delay before the next check of condition.
+
+        :param polling_interval: Base polling interval of the waiting.
+        :param attempt: Number of failed checks made before, starting from zero.
+        :return: Base polling interval.
+        """
+        return polling_interval
+
+
+class ExponentialPollingStrategy(AbstractPollingStrategy):
+    """Multiplies polling interval after each failed check until it reaches the limit."""
+
+    def __init__(
+        self,
+        multiplier: float = 2.0,
+        max_interval: timedelta = timedelta(seconds=5),
+    ):
+        """Initialize strategy with growth multiplier and maximal interval."""
+        if multiplier < 1:
+            raise ValueError(
+                f"Multiplier of exponential polling should not be less than 1, got {multiplier}"
+            )
+        self.__multiplier = multiplier
+        self.__max_interval = max_interval
+
+    @property
+    def multiplier(self) -> float:
+        """Get multiplier of polling interval."""
+        return self.__multiplier
+
+    @property
+    def max_interval(self) -> timedelta:
+        """Get maximal polling interval."""
+        return self.__max_interval
+
+    def get_interval(self, polling_interval: timedelta, attempt: int) -> timedelta:
+        """
+        Get delay before the next check of condition.
+
+        :param polling_interval: Base polling interval of the waiting.
+        :param attempt: Number of failed checks made before, starting from zero.
+        :return: Base polling interval multiplied for each attempt, but not more than maximal interval.
+        """
+        max_seconds = self.__max_interval.total_seconds()
+        interval_seconds = polling_interval.total_seconds()
+        for _ in range(attempt):
+            if interval_seconds >= max_seconds:
+                break
+            interval_seconds *= self.__multiplier
+        return timedelta(seconds=min(interval_seconds, max_seconds))
+
+
+class JitteredPollingStrategy(AbstractPollingStrategy):
+    """Randomly spreads intervals of another strategy so parallel waitings do not poll simultaneously."""
+
+    def __init__(
+        self,
+        strategy: AbstractPollingStrategy = FixedPollingStrategy(),
+        jitter: float = 0.5,
+    ):
+        """
+        Initialize strategy with base strategy and jitter.
+
+        :param strategy: Strategy which intervals will be spread.
+        :param jitter: Relative deviation of interval, from 0 to 1.
+        """
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"Jitter should be between 0 and 1, got {jitter}")
+        self.__strategy = strategy
+        self.__jitter = jitter
+
+    @property
+    def jitter(self) -> float:
+        """Get relative deviation of interval."""
+        return self.__jitter
+
+    def get_interval(self, polling_interval: timedelta, attempt: int) -> timedelta:
+        """
+        Get delay before the next check of condition.
+
+        :param polling_interval: Base polling interval of the waiting.
+        :param attempt: Number of failed checks made before, starting from zero.
+        :return: Interval of base strategy randomly deviated by jitter.
+        """
+        interval = self.__strategy.get_interval(polling_interval, attempt)
+        return interval * random.uniform(1 - self.__jitter, 1 + self.__jitter)
@@ -0,0 +1,100 @@
+from datetime import timedelta
+from typing import List
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import is_not
+from hamcrest import same_instance
+
+from aquality_selenium_core.applications.application import AbstractApplication
+from aquality_selenium_core.applications.element_cache_registry import (
+    ElementCacheRegistry,
+)
+from aquality_selenium_core.elements.element_cache_handler import ElementCacheHandler
+from aquality_selenium_core.elements.element_state import Displayed
+from tests.test_elements.fakes import FakeElementFinder
+
+
+class TestElementCacheRegistry:
+    def test__get_handler__should_return_the_same_handler_for_element(self):
+        registry = ElementCacheRegistry(Application())
+        first = registry.get_handler("button", self.__create_handler)
+        assert_that(
+            registry.get_handler("button", self.__create_handler), same_instance(first)
+        )
+
+    def test__get_handler__should_evict_least_recently_used_handler(self):
+        registry = ElementCacheRegistry(Application(), max_size=2)
+        first = registry.get_handler("first", self.__create_handler)
+        registry.get_handler("second", self.__create_handler)
+        registry.get_handler("first", self.__create_handler)
+        registry.get_handler("third", self.__create_handler)
+        assert_that(len(registry), equal_to(2))
+        assert_that(
+            registry.get_handler("first", self.__create_handler), same_instance(first)
+        )
+        assert_that(
+            registry.get_handler("second", self.__create_handler),
+            is_not(same_instance(first)),
+        )
+
+    def test__check_navigation__should_invalidate_cache_after_navigation(self):
+        application = Application()
+        registry = ElementCacheRegistry(application, navigation_check_interval=None)
+        first = registry.get_handler("button", self.__create_handler)
+        registry.check_navigation(force=True)
+        application.driver.document = ["document 2", "https://example.com/next"]
+        assert_that(registry.check_navigation(force=True), equal_to(True))
+        assert_that(registry.generation, equal_to(1))
+        assert_that(
+            registry.get_handler("button", self.__create_handler),
+            is_not(same_instance(first)),
+        )
+
+    def test__check_navigation__should_keep_cache_on_the_same_page(self):
+        application = Application()
+        registry = ElementCacheRegistry(application, navigation_check_interval=None)
+        registry.check_navigation(force=True)
+        assert_that(registry.check_navigation(force=True), equal_to(False))
+        assert_that(registry.generation, equal_to(0))
+
+    def test__get_handler__should_check_navigation_once_per_interval(self):
+        application = Application()
+        registry = ElementCacheRegistry(
+            application, navigation_check_interval=timedelta(minutes=1)
+        )
+        for _ in range(3):
+            registry.get_handler("button", self.__create_handler)
+        assert_that(application.driver.scripts_count, equal_to(1))
+
+    @staticmethod
+    def __create_handler() -> ElementCacheHandler:
+        return ElementCacheHandler(
+            ("xpath", "//button"), Displayed(), FakeElementFinder([])
+        )
+
+
+class Driver:
+    def __init__(self):
+        self.document: List[str] = ["document 1", "https://example.com"]
+        self.scripts_count = 0
+
+    def execute_script(self, script: str) -> List[str]:
+        self.scripts_count += 1
+        return self.document
+
+
+class Application(AbstractApplication):
+    def __init__(self):
+        self.__driver = Driver()
+
+    @property
+    def driver(self):
+        return self.__driver
+
+    @property
+    def is_started(self) -> bool:
+        return True
+
+    def set_implicit_wait_timeout(self, value: timedelta) -> None:
+        pass
@@ -0,0 +1,72 @@
+from datetime import timedelta
+from typing import List
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from aquality_selenium_core.applications.application import AbstractApplication
+
+
+class TestImplicitWaitTracker:
+    def test__set_implicit_wait_timeout__should_skip_the_same_value(self):
+        application = Application()
+        tracker = application.implicit_wait_tracker
+        tracker.set_implicit_wait_timeout(timedelta(seconds=1))
+        tracker.set_implicit_wait_timeout(timedelta(seconds=1))
+        assert_that(
+            application.set_timeouts,
+            equal_to([timedelta(seconds=1)]),
+            "The same timeout is set several times",
+        )
+
+    def test__set_implicit_wait_timeout__should_set_value_after_reset(self):
+        application = Application()
+        tracker = application.implicit_wait_tracker
+        tracker.set_implicit_wait_timeout(timedelta())
+        tracker.reset()
+        tracker.set_implicit_wait_timeout(timedelta())
+        assert_that(
+            application.set_timeouts,
+            equal_to([timedelta(), timedelta()]),
+            "Timeout is not set after reset",
+        )
+
+    def test__suspend__should_share_scope_between_nested_waitings(self):
+        application = Application()
+        implicit_timeout = timedelta(seconds=2)
+        with application.implicit_wait_tracker.suspend(implicit_timeout):
+            with application.implicit_wait_tracker.suspend(implicit_timeout):
+                pass
+        assert_that(
+            application.set_timeouts,
+            equal_to([timedelta(), implicit_timeout]),
+            "Nested scopes should not change timeout",
+        )
+
+    def test__suspend__should_not_change_timeout_if_it_is_already_zero(self):
+        application = Application()
+        for _ in range(3):
+            with application.implicit_wait_tracker.suspend(timedelta()):
+                pass
+        assert_that(
+            application.set_timeouts,
+            equal_to([timedelta()]),
+            "Zero timeout is set several times",
+        )
+
+
+class Application(AbstractApplication):
+    def __init__(self):
+        self.set_timeouts: List[timedelta] = []
+
+    @property
+    def driver(self) -> WebDriver:
+        pass
+
+    @property
+    def is_started(self) -> bool:
+        pass
+
+    def set_implicit_wait_timeout(self, value: timedelta) -> None:
+        self.set_timeouts.append(value)
@@ -0,0 +1,64 @@
+import os
+from datetime import timedelta
+
+from hamcrest import assert_that
+from hamcrest import calling
+from hamcrest import equal_to
+from hamcrest import raises
+
+from aquality_selenium_core.configurations.element_cache_configuration import (
+    ElementCacheConfiguration,
+)
+from aquality_selenium_core.configurations.retry_configuration import (
+    RetryConfiguration,
+)
+from aquality_selenium_core.configurations.timeout_configuration import (
+    TimeoutConfiguration,
+)
+from aquality_selenium_core.utilities.settings_file import JsonSettingsFile
+from tests.test_utilities.test_settings_file.conftest import ROOT_DIR
+
+RETRY_NUMBER_KEY = "retry.number"
+
+
+class TestConfigurationSnapshots:
+    def test_should_read_values_once(self):
+        settings_file = CountingSettingsFile()
+        configuration = TimeoutConfiguration(settings_file)
+        reads_count = settings_file.reads_count
+        for _ in range(10):
+            assert_that(configuration.condition, equal_to(timedelta(seconds=1000)))
+            assert_that(
+                configuration.polling_interval, equal_to(timedelta(milliseconds=1000))
+            )
+        assert_that(settings_file.reads_count, equal_to(reads_count))
+
+    def test_should_apply_changes_only_after_reload(self):
+        settings_file = CountingSettingsFile()
+        configuration = RetryConfiguration(settings_file)
+        os.environ[RETRY_NUMBER_KEY] = "3"
+        try:
+            settings_file.refresh_environment()
+            assert_that(configuration.number, equal_to(1000))
+            configuration.reload()
+            assert_that(configuration.number, equal_to(3))
+        finally:
+            del os.environ[RETRY_NUMBER_KEY]
+
+    def test_snapshot_should_be_immutable(self):
+        snapshot = ElementCacheConfiguration(CountingSettingsFile()).snapshot
+        assert_that(snapshot.is_enabled, equal_to(False))
+        assert_that(
+            calling(setattr).with_args(snapshot, "is_enabled", True),
+            raises(AttributeError),
+        )
+
+
+class CountingSettingsFile(JsonSettingsFile):
+    def __init__(self):
+        super().__init__("settings.jsontest.json", ROOT_DIR)
+        self.reads_count = 0
+
+    def get_value(self, path):
+        self.reads_count += 1
+        return super().get_value(path)
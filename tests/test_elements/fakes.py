@@ -0,0 +1,289 @@
+import json
+import shutil
+import subprocess
+from datetime import timedelta
+from typing import Callable
+from typing import cast
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from aquality_selenium_core.applications.application import AbstractApplication
+from aquality_selenium_core.configurations.element_cache_configuration import (
+    AbstractElementCacheConfiguration,
+)
+from aquality_selenium_core.configurations.element_cache_configuration import (
+    ElementCacheMode,
+)
+from aquality_selenium_core.elements.desired_state import DesiredState
+from aquality_selenium_core.elements.element import AbstractElement
+from aquality_selenium_core.elements.element_factory import AbstractElementFactory
+from aquality_selenium_core.elements.element_finder import AbstractElementFinder
+from aquality_selenium_core.elements.element_state import ExistsInAnyState
+from aquality_selenium_core.localization.localization_manager import (
+    AbstractLocalizationManager,
+)
+from aquality_selenium_core.localization.localized_logger import AbstractLocalizedLogger
+from aquality_selenium_core.utilities.element_action_retrier import (
+    AbstractElementActionRetrier,
+)
+from aquality_selenium_core.waitings.conditional_wait import AbstractConditionalWait
+
+
+class FakeWebElement:
+    def __init__(
+        self,
+        name: str,
+        is_displayed: bool = True,
+        children: List["FakeWebElement"] = cast(List, None),
+        is_stale: bool = False,
+        attributes: Dict[str, str] = cast(Dict, None),
+    ):
+        self.name = name
+        self.attributes = attributes if attributes is not None else {}
+        self.__is_displayed = is_displayed
+        self.children = children if children is not None else []
+        self.is_stale = is_stale
+        self.searched_locators: List[Tuple[By, str]] = []
+        self.displayed_checks_count = 0
+
+    @property
+    def text(self) -> str:
+        return self.name
+
+    def is_displayed(self) -> bool:
+        if self.is_stale:
+            raise StaleElementReferenceException()
+        self.displayed_checks_count += 1
+        return self.__is_displayed
+
+    def find_elements(self, by: By, value: str) -> List["FakeWebElement"]:
+        if self.is_stale:
+            raise StaleElementReferenceException()
+        self.searched_locators.append((by, value))
+        return list(self.children)
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.attributes.get(name)
+
+
+class FakeElementFinder(AbstractElementFinder):
+    def __init__(self, elements: List[WebElement]):
+        self.elements = elements
+        self.calls_count = 0
+
+    def find_element(
+        self,
+        locator: Tuple[By, str],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+        timeout: timedelta = cast(timedelta, None),
+    ) -> WebElement:
+        return self.find_elements(locator, desired_state, timeout)[0]
+
+    def find_elements(
+        self,
+        locator: Tuple[By, str],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+        timeout: timedelta = cast(timedelta, None),
+    ) -> List[WebElement]:
+        self.calls_count += 1
+        return list(self.elements)
+
+    def find_elements_in_state(
+        self,
+        locator: Tuple[By, str],
+        desired_state: DesiredState,
+        timeout: timedelta = cast(timedelta, None),
+    ) -> List[WebElement]:
+        return self.find_elements(locator, desired_state.element_state_condition)
+
+    def find_many(
+        self,
+        locators: List[Tuple[By, str]],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+    ) -> Dict[Tuple[By, str], List[WebElement]]:
+        return {
+            locator: self.find_elements(locator, desired_state) for locator in locators
+        }
+
+    def wait_for_many(
+        self,
+        locators: List[Tuple[By, str]],
+        desired_state: Callable[[WebElement], bool] = ExistsInAnyState(),
+        timeout: timedelta = cast(timedelta, None),
+    ) -> Dict[Tuple[By, str], List[WebElement]]:
+        return self.find_many(locators, desired_state)
+
+
+class LocalizationManager(AbstractLocalizationManager):
+    def get_localized_message(self, message_key: str, *message_args) -> str:
+        return message_key
+
+
+class CacheConfiguration(AbstractElementCacheConfiguration):
+    def __init__(
+        self,
+        is_enabled: bool = True,
+        mode: ElementCacheMode = ElementCacheMode.VALIDATING,
+        revalidation_interval: Optional[timedelta] = None,
+    ):
+        self.__is_enabled = is_enabled
+        self.__mode = mode
+        self.__revalidation_interval = revalidation_interval
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.__is_enabled
+
+    @property
+    def mode(self) -> ElementCacheMode:
+        return self.__mode
+
+    @property
+    def revalidation_interval(self) -> Optional[timedelta]:
+        return self.__revalidation_interval
+
+
+class CustomElement(AbstractElement):
+    element_finder: AbstractElementFinder = cast(AbstractElementFinder, None)
+
+    @property
+    def _application(self) -> AbstractApplication:
+        pass
+
+    @property
+    def _element_factory(self) -> AbstractElementFactory:
+        pass
+
+    @property
+    def _element_finder(self) -> AbstractElementFinder:
+        return self.element_finder
+
+    @property
+    def _cache_configuration(self) -> AbstractElementCacheConfiguration:
+        return CacheConfiguration()
+
+    @property
+    def _element_action_retrier(self) -> AbstractElementActionRetrier:
+        pass
+
+    @property
+    def _localized_logger(self) -> AbstractLocalizedLogger:
+        pass
+
+    @property
+    def _localization_manager(self) -> AbstractLocalizationManager:
+        pass
+
+    @property
+    def _conditional_wait(self) -> AbstractConditionalWait:
+        pass
+
+    @property
+    def _element_type(self) -> str:
+        return "Custom"
+
+
+NODE_PATH = shutil.which("node")
+
+NODE_PRELUDE = """
+var window = {pageXOffset: 0, pageYOffset: 0};
+var style = {display: 'block', visibility: 'visible', opacity: '1', overflow: 'visible'};
+var rect = {left: 0, top: 0, width: 10, height: 10};
+
+function createElement(tagName, properties, attributes) {
+    var element = {
+        nodeType: 1,
+        tagName: tagName.toUpperCase(),
+        parentNode: null,
+        innerText: '',
+        ownerDocument: {
+            documentElement: {},
+            defaultView: {
+                getComputedStyle: function () {
+                    return {
+                        getPropertyValue: function (name) {
+                            return style[name] || '';
+                        }
+                    };
+                }
+            }
+        },
+        getBoundingClientRect: function () {
+            return rect;
+        },
+        getClientRects: function () {
+            return [rect];
+        },
+        matches: function (selector) {
+            return selector === ':disabled' && element.disabled === true;
+        },
+        getAttribute: function (name) {
+            return name in attributes ? attributes[name] : null;
+        },
+        getAttributeNode: function (name) {
+            return name in attributes ? {specified: true, value: attributes[name]} : null;
+        },
+        hasAttribute: function (name) {
+            return name in attributes;
+        }
+    };
+    Object.keys(properties).forEach(function (name) {
+        element[name] = properties[name];
+    });
+    return element;
+}
+
+function revive(value) {
+    if (Array.isArray(value)) {
+        return value.map(revive);
+    }
+    if (value !== null && typeof value === 'object' && 'element' in value) {
+        return createElement(value.element[0], value.element[1], value.element[2]);
+    }
+    return value;
+}
+"""
+
+
+class NodeElement:
+    def __init__(
+        self, tag_name: str, properties: Dict[str, Any], attributes: Dict[str, str]
+    ):
+        self.tag_name = tag_name
+        self.properties = properties
+        self.attributes = attributes
+
+
+class NodeDriver:
+    """Driver which executes scripts with Node.js against elements emulated by plain objects."""
+
+    def execute_script(self, script: str, *args):
+        arguments = json.dumps(
+            args,
+            default=lambda element: {
+                "element": [element.tag_name, element.properties, element.attributes]
+            },
+        )
+        source = (
+            f"{NODE_PRELUDE}\n"
+            f"var result = (function () {{\n{script}\n}}).apply(null, revive({arguments}));\n"
+            f"process.stdout.write(JSON.stringify(result === undefined ? null : result));"
+        )
+        completed = subprocess.run(
+            [cast(str, NODE_PATH)],
+            input=source,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        return json.loads(completed.stdout)
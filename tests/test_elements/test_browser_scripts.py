@@ -0,0 +1,100 @@
+from hamcrest import assert_that
+from hamcrest import equal_to
+from selenium.common.exceptions import JavascriptException
+from selenium.common.exceptions import UnknownMethodException
+from selenium.webdriver.remote.webelement import WebElement
+
+from aquality_selenium_core.elements.browser_scripts import filter_elements_in_state
+from aquality_selenium_core.elements.element_state import Clickable
+from aquality_selenium_core.elements.element_state import Displayed
+from aquality_selenium_core.elements.element_state import ExistsInAnyState
+
+
+class TestFilterElementsInState:
+    def test__should_evaluate_known_state_with_single_script(self):
+        driver = Driver([True, False, True])
+        elements = [Element(True), Element(True), Element(True)]
+        assert_that(
+            filter_elements_in_state(driver, elements, Displayed()),
+            equal_to([elements[0], elements[2]]),
+        )
+        assert_that(driver.scripts_count, equal_to(1))
+        assert_that(
+            sum(element.calls_count for element in elements),
+            equal_to(0),
+            "Elements should not be checked one by one",
+        )
+
+    def test__should_not_call_driver_for_any_state(self):
+        driver = Driver([])
+        elements = [Element(False), Element(False)]
+        assert_that(
+            filter_elements_in_state(driver, elements, ExistsInAnyState()),
+            equal_to(elements),
+        )
+        assert_that(driver.scripts_count, equal_to(0))
+
+    def test__should_check_custom_state_for_each_element(self):
+        driver = Driver([])
+        elements = [Element(True), Element(False)]
+        assert_that(
+            filter_elements_in_state(
+                driver, elements, lambda element: element.is_displayed()
+            ),
+            equal_to([elements[0]]),
+        )
+        assert_that(driver.scripts_count, equal_to(0))
+
+    def test__should_check_each_element_if_scripts_are_not_supported(self):
+        driver = Driver(UnknownMethodException())
+        elements = [Element(True), Element(False)]
+        assert_that(
+            filter_elements_in_state(driver, elements, Clickable()),
+            equal_to([elements[0]]),
+        )
+        filter_elements_in_state(driver, elements, Clickable())
+        assert_that(
+            driver.scripts_count,
+            equal_to(1),
+            "Driver without script support should not be asked again",
+        )
+
+    def test__should_keep_using_scripts_after_script_error(self):
+        driver = Driver(JavascriptException())
+        elements = [Element(True), Element(False)]
+        assert_that(
+            filter_elements_in_state(driver, elements, Clickable()),
+            equal_to([elements[0]]),
+        )
+        filter_elements_in_state(driver, elements, Clickable())
+        assert_that(
+            driver.scripts_count,
+            equal_to(2),
+            "Driver should be asked again after script error",
+        )
+
+
+class Driver:
+    def __init__(self, result):
+        self.scripts_count = 0
+        self.__result = result
+
+    def execute_script(self, script, *args):
+        self.scripts_count += 1
+        if isinstance(self.__result, Exception):
+            raise self.__result
+        return self.__result
+
+
+class Element(WebElement):
+    def __init__(self, is_displayed: bool):
+        self.calls_count = 0
+        self.__is_displayed = is_displayed
+
+    def is_displayed(self) -> bool:
+        self.calls_count += 1
+        return self.__is_displayed
+
+    def is_enabled(self) -> bool:
+        self.calls_count += 1
+        return True
@@ -0,0 +1,128 @@
+import time
+from datetime import timedelta
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import none
+from selenium.common.exceptions import UnknownMethodException
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.browser_scripts import get_script_locator
+from aquality_selenium_core.elements.browser_wait_engine import BrowserWaitEngine
+from aquality_selenium_core.elements.element_finder import ElementFinder
+from aquality_selenium_core.elements.element_state import Displayed
+from aquality_selenium_core.elements.element_state import ExistsInAnyState
+from aquality_selenium_core.waitings.conditional_wait import ConditionalWait
+from tests.test_elements.test_element_finder import Logger
+from tests.test_waitings.test_conditional_wait import Application
+from tests.test_waitings.test_conditional_wait import CustomTimeoutConfiguration
+
+
+class TestBrowserWaitEngine:
+    def test__get_script_locator__should_convert_locators_like_webdriver(self):
+        assert_that(
+            [
+                get_script_locator((By.ID, "id")),
+                get_script_locator((By.NAME, "name")),
+                get_script_locator((By.CLASS_NAME, "class")),
+                get_script_locator((By.TAG_NAME, "div")),
+                get_script_locator((By.XPATH, "//div")),
+            ],
+            equal_to(
+                [
+                    (By.CSS_SELECTOR, '[id="id"]'),
+                    (By.CSS_SELECTOR, '[name="name"]'),
+                    (By.CSS_SELECTOR, ".class"),
+                    (By.CSS_SELECTOR, "div"),
+                    (By.XPATH, "//div"),
+                ]
+            ),
+        )
+
+    def test__is_supported__should_reject_custom_state(self):
+        engine = BrowserWaitEngine(DriverApplication(), CustomTimeoutConfiguration())
+        assert_that(
+            engine.is_supported((By.XPATH, "//div"), lambda element: True),
+            equal_to(False),
+            "Custom state could not be compiled to JavaScript",
+        )
+
+    def test__wait_for_elements__should_wait_with_single_command(self):
+        application = DriverApplication()
+        engine = BrowserWaitEngine(application, CustomTimeoutConfiguration())
+        assert_that(
+            engine.wait_for_elements((By.ID, "id"), Displayed(), timedelta(seconds=1)),
+            equal_to((["element"], ["element"])),
+        )
+        assert_that(application.driver.calls_count, equal_to(1))
+
+    def test__wait_for_elements__should_fall_back_when_scripts_are_not_supported(
+        self,
+    ):
+        application = DriverApplication(UnknownMethodException())
+        engine = BrowserWaitEngine(application, CustomTimeoutConfiguration())
+        assert_that(engine.wait_for_elements((By.ID, "id"), ExistsInAnyState()), none())
+        assert_that(
+            engine.is_supported((By.ID, "id"), ExistsInAnyState()),
+            equal_to(False),
+            "Driver without script support should not be used by engine",
+        )
+
+    def test__wait_for_elements__should_keep_using_driver_after_transient_error(
+        self,
+    ):
+        application = DriverApplication(WebDriverException("chrome not reachable"))
+        engine = BrowserWaitEngine(application, CustomTimeoutConfiguration())
+        assert_that(engine.wait_for_elements((By.ID, "id"), ExistsInAnyState()), none())
+        assert_that(
+            engine.is_supported((By.ID, "id"), ExistsInAnyState()),
+            equal_to(True),
+            "Driver should not be excluded after connection failure",
+        )
+
+    def test__find_elements__should_poll_within_rest_of_timeout(self):
+        application = DriverApplication()
+        engine = InterruptedWaitEngine(application, timedelta(milliseconds=400))
+        finder = ElementFinder(
+            Logger(),
+            ConditionalWait(CustomTimeoutConfiguration(), application),
+            wait_engine=engine,
+        )
+        start_time = time.monotonic()
+        finder.find_elements((By.ID, "id"), timeout=timedelta(milliseconds=600))
+        assert_that(time.monotonic() - start_time < 0.9, equal_to(True))
+
+
+class InterruptedWaitEngine(BrowserWaitEngine):
+    def __init__(self, application: Application, duration: timedelta):
+        super().__init__(application, CustomTimeoutConfiguration())
+        self.__duration = duration
+
+    def wait_for_elements(self, locator, state, timeout=None):
+        time.sleep(self.__duration.total_seconds())
+        return None
+
+
+class Driver:
+    def __init__(self, exception: Exception = None):
+        self.calls_count = 0
+        self.__exception = exception
+
+    def execute_async_script(self, script, *args):
+        self.calls_count += 1
+        if self.__exception is not None:
+            raise self.__exception
+        return [["element"], ["element"]]
+
+    def find_elements(self, by, value):
+        return []
+
+
+class DriverApplication(Application):
+    def __init__(self, exception: Exception = None):
+        self.__driver = Driver(exception)
+
+    @property
+    def driver(self):
+        return self.__driver
@@ -0,0 +1,125 @@
+from typing import cast
+from typing import Dict
+from typing import List
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import has_length
+from selenium.common.exceptions import WebDriverException
+
+from aquality_selenium_core.elements.bulk_reader import read_attributes
+from aquality_selenium_core.elements.bulk_reader import read_texts
+from tests.test_elements.fakes import FakeWebElement
+from tests.test_elements.fakes import NODE_PATH
+from tests.test_elements.fakes import NodeDriver
+from tests.test_elements.fakes import NodeElement
+
+ELEMENTS = [
+    FakeWebElement("first", attributes={"href": "/first"}),
+    FakeWebElement("second"),
+]
+
+
+class TestBulkReader:
+    def test__read_texts__should_read_all_texts_with_one_script(self):
+        driver = ReadDriver()
+        texts = read_texts(driver, ELEMENTS)
+        assert_that(texts, equal_to(["first", "second"]))
+        assert_that(driver.calls, equal_to([(ELEMENTS, [], True)]))
+
+    def test__read_attributes__should_return_columns(self):
+        driver = ReadDriver()
+        attributes = read_attributes(driver, ELEMENTS, ["href", "title"])
+        assert_that(
+            attributes, equal_to({"href": ["/first", None], "title": [None, None]})
+        )
+        assert_that(driver.calls, equal_to([(ELEMENTS, ["href", "title"], False)]))
+
+    def test__read_attributes__should_use_commands_without_driver(self):
+        assert_that(
+            read_attributes(None, ELEMENTS, ["href"]),
+            equal_to({"href": ["/first", None]}),
+        )
+
+    def test__read_texts__should_use_commands_if_script_is_not_supported(self):
+        assert_that(
+            read_texts(UnsupportedDriver(), ELEMENTS), equal_to(["first", "second"])
+        )
+
+    def test__read_texts__should_find_queried_elements_with_one_script(self):
+        driver = ReadDriver({"//a": ELEMENTS[0]})
+        assert_that(
+            read_texts(driver, [("xpath", "//a", "displayed"), ELEMENTS[1]]),
+            equal_to(["first", "second"]),
+        )
+        assert_that(driver.calls, has_length(1))
+
+    def test__read_texts__should_resolve_queries_which_match_nothing(self):
+        driver = ReadDriver()
+        texts = read_texts(
+            driver, [("xpath", "//a", "displayed"), ELEMENTS[1]], ELEMENTS.__getitem__
+        )
+        assert_that(texts, equal_to(["first", "second"]))
+        assert_that(
+            driver.calls[-1],
+            equal_to((ELEMENTS, [], True)),
+        )
+
+    def test__read_texts__should_resolve_queries_if_script_is_not_supported(self):
+        assert_that(
+            read_texts(
+                UnsupportedDriver(),
+                [("xpath", "//a", "displayed"), ELEMENTS[1]],
+                ELEMENTS.__getitem__,
+            ),
+            equal_to(["first", "second"]),
+        )
+
+    @pytest.mark.skipif(NODE_PATH is None, reason="Node.js is not installed")
+    def test__read_attributes__should_read_properties_like_webdriver(self):
+        typed_input = NodeElement(
+            "input",
+            {"type": "checkbox", "value": "typed", "checked": True, "disabled": False},
+            {"type": "checkbox", "value": "initial", "checked": ""},
+        )
+        assert_that(
+            read_attributes(
+                NodeDriver(), [typed_input], ["value", "checked", "disabled"]
+            ),
+            equal_to({"value": ["typed"], "checked": ["true"], "disabled": [None]}),
+        )
+
+    def test__read_texts__should_not_call_driver_for_empty_list(self):
+        driver = ReadDriver()
+        assert_that(read_texts(driver, []), equal_to([]))
+        assert_that(driver.calls, equal_to([]))
+
+
+class ReadDriver:
+    def __init__(self, documents: Dict[str, FakeWebElement] = cast(Dict, None)):
+        self.calls: List[tuple] = []
+        self.__documents = documents if documents is not None else {}
+
+    def execute_script(self, script, targets, names, read_texts):
+        self.calls.append((targets, names, read_texts))
+        elements = [
+            self.__documents.get(target[1]) if isinstance(target, list) else target
+            for target in targets
+        ]
+        missing = [index for index, element in enumerate(elements) if element is None]
+        if missing:
+            return {"texts": [], "attributes": {}, "missing": missing}
+        return {
+            "texts": [element.text for element in elements] if read_texts else [],
+            "attributes": {
+                name: [element.get_attribute(name) for element in elements]
+                for name in names
+            },
+            "missing": [],
+        }
+
+
+class UnsupportedDriver:
+    def execute_script(self, *args):
+        raise WebDriverException("Scripts are not supported")
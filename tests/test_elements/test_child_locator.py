@@ -0,0 +1,125 @@
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import instance_of
+from hamcrest import none
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.browser_scripts import get_script_locator
+from aquality_selenium_core.elements.child_locator import ChildLocator
+from aquality_selenium_core.elements.dom_snapshot import DomSnapshot
+from aquality_selenium_core.elements.element_factory import ElementFactory
+from aquality_selenium_core.waitings.conditional_wait import ConditionalWait
+from tests.test_elements.fakes import CustomElement
+from tests.test_elements.fakes import FakeElementFinder
+from tests.test_elements.fakes import FakeWebElement
+from tests.test_elements.fakes import LocalizationManager
+from tests.test_waitings.test_conditional_wait import Application
+from tests.test_waitings.test_conditional_wait import CustomTimeoutConfiguration
+
+PARENT_LOCATOR = (By.XPATH, "//table")
+CHILD_LOCATOR = (By.CSS_SELECTOR, "td")
+
+
+class TestChildLocator:
+    def test__find_elements__should_search_inside_of_parent_element(self):
+        children = [FakeWebElement("first"), FakeWebElement("second")]
+        parent_web_element = FakeWebElement("table", children=children)
+        locator = ChildLocator(self.__get_parent(parent_web_element), CHILD_LOCATOR)
+        assert_that(locator.find_elements(), equal_to(children))
+        assert_that(parent_web_element.searched_locators, equal_to([CHILD_LOCATOR]))
+
+    def test__find_elements__should_search_xpath_from_root_inside_of_parent(self):
+        document = DomSnapshot(
+            "<div><table><tr><td>outer</td></tr></table>"
+            "<table><tr><td>inner</td></tr></table></div>"
+        )
+        parent_web_element = document.find_elements((By.XPATH, ".//table[2]"))[0]
+        parent = self.__get_parent(parent_web_element)
+        for child_locator in [(By.XPATH, "//td"), (By.XPATH, "/tr/td")]:
+            assert_that(
+                [
+                    element.text
+                    for element in ChildLocator(parent, child_locator).find_elements()
+                ],
+                equal_to(["inner"]),
+            )
+
+    def test__find_elements__should_search_parent_again_if_it_is_stale(self):
+        children = [FakeWebElement("first")]
+        stale_parent = FakeWebElement("table", is_stale=True)
+        parent = self.__get_parent(
+            stale_parent,
+            FakeElementFinder([FakeWebElement("table", children=children)]),
+        )
+        locator = ChildLocator(parent, CHILD_LOCATOR)
+        assert_that(locator.find_elements(), equal_to(children))
+        assert_that(
+            parent.get_element().name, equal_to("table"), "Parent cache is refreshed"
+        )
+        assert_that(parent.get_element().is_stale, equal_to(False))
+
+    def test__find_elements__should_return_element_at_index(self):
+        children = [FakeWebElement("first"), FakeWebElement("second")]
+        parent = self.__get_parent(FakeWebElement("table", children=children))
+        locator = ChildLocator(parent, CHILD_LOCATOR).with_index(2)
+        assert_that(locator.find_elements(), equal_to(children[1:]))
+        assert_that(locator.with_index(3).find_elements(), equal_to([]))
+
+    def test__child_locators__should_differ_for_different_parents(self):
+        first_parent = self.__get_parent(FakeWebElement("first"))
+        second_parent = self.__get_parent(FakeWebElement("second"))
+        first_child = ChildLocator(first_parent, CHILD_LOCATOR)
+        second_child = ChildLocator(second_parent, CHILD_LOCATOR)
+        assert_that(first_child == second_child, equal_to(False))
+        assert_that(
+            first_child == ChildLocator(first_parent, CHILD_LOCATOR), equal_to(True)
+        )
+        assert_that(len({first_child: 1, second_child: 2}), equal_to(2))
+
+    def test__child_locator__should_not_be_evaluated_by_scripts(self):
+        parent = self.__get_parent(FakeWebElement("table"))
+        assert_that(get_script_locator(ChildLocator(parent, CHILD_LOCATOR)), none())
+
+    def test__find_child_element__should_keep_absolute_xpath(self):
+        parent = self.__get_parent(FakeWebElement("table"))
+        child = self.__get_factory().find_child_element(
+            parent, CustomElement, (By.XPATH, ".//td")
+        )
+        assert_that(child.locator, instance_of(ChildLocator))
+        assert_that(tuple(child.locator), equal_to((By.XPATH, "//table//td")))
+
+    def test__find_child_element__should_support_css_locator(self):
+        parent = self.__get_parent(FakeWebElement("table"))
+        child = self.__get_factory().find_child_element(
+            parent, CustomElement, CHILD_LOCATOR
+        )
+        assert_that(child.locator.relative_locator, equal_to(CHILD_LOCATOR))
+        assert_that(child.locator.parent, equal_to(parent))
+
+    def test__find_child_elements__should_build_indexed_child_locators(self):
+        children = [FakeWebElement("first"), FakeWebElement("second")]
+        parent = self.__get_parent(FakeWebElement("table", children=children))
+        elements = self.__get_factory(children).find_child_elements(
+            parent, CustomElement, CHILD_LOCATOR
+        )
+        assert_that([element.locator.index for element in elements], equal_to([1, 2]))
+        assert_that(
+            [element.locator.find_elements() for element in elements],
+            equal_to([children[:1], children[1:]]),
+        )
+
+    @staticmethod
+    def __get_parent(
+        parent_web_element: FakeWebElement, finder: FakeElementFinder = None
+    ) -> CustomElement:
+        parent = CustomElement(PARENT_LOCATOR, "Table", lambda element: True)
+        parent.element_finder = finder
+        parent._seed_cache(parent_web_element)
+        return parent
+
+    @staticmethod
+    def __get_factory(elements=None) -> ElementFactory:
+        conditional_wait = ConditionalWait(CustomTimeoutConfiguration(), Application())
+        return ElementFactory(
+            conditional_wait, FakeElementFinder(elements or []), LocalizationManager()
+        )
@@ -0,0 +1,156 @@
+import json
+from datetime import timedelta
+
+from hamcrest import assert_that
+from hamcrest import calling
+from hamcrest import equal_to
+from hamcrest import raises
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.child_locator import ChildLocator
+from aquality_selenium_core.elements.dom_snapshot import DomSnapshot
+from aquality_selenium_core.elements.element_finder import ElementFinder
+from aquality_selenium_core.elements.element_state import Displayed
+from aquality_selenium_core.utilities.element_action_retrier import (
+    AbstractElementActionRetrier,
+)
+from tests.test_elements.fakes import CustomElement
+from aquality_selenium_core.waitings.conditional_wait import ConditionalWait
+from tests.test_elements.fakes import FakeWebElement
+from tests.test_elements.test_element_finder import Logger
+from tests.test_waitings.test_conditional_wait import Application
+from tests.test_waitings.test_conditional_wait import CustomTimeoutConfiguration
+
+HTML = """
+<table id="report">
+  <tr class="row first"><td>Name</td><td data-kind="total">10</td></tr>
+  <tr class="row" style="display: none"><td>Hidden</td><td>20</td></tr>
+  <tr class="row"><td>Other <b>value</b></td><td><input type="checkbox" disabled></td></tr>
+</table>
+"""
+
+
+class TestDomSnapshot:
+    def test__find_elements__should_support_locator_strategies(self):
+        snapshot = DomSnapshot(HTML)
+        assert_that(len(snapshot.find_elements((By.TAG_NAME, "td"))), equal_to(6))
+        assert_that(len(snapshot.find_elements((By.CLASS_NAME, "row"))), equal_to(3))
+        assert_that(
+            [
+                node.text
+                for node in snapshot.find_elements((By.CSS_SELECTOR, "tr.first > td"))
+            ],
+            equal_to(["Name", "10"]),
+        )
+        assert_that(
+            snapshot.find_elements((By.XPATH, ".//td[@data-kind='total']"))[0].text,
+            equal_to("10"),
+        )
+        assert_that(
+            [node.text for node in snapshot.find_elements((By.XPATH, ".//tr/td[1]"))],
+            equal_to(["Name", "", "Other value"]),
+        )
+        assert_that(
+            [
+                node.is_displayed()
+                for node in snapshot.find_elements((By.XPATH, "(//td)[3]"))
+            ],
+            equal_to([False]),
+        )
+        assert_that(
+            snapshot.find_elements((By.XPATH, "//table[@id='report']")),
+            equal_to([snapshot.root]),
+        )
+
+    def test__nodes__should_support_state_checks(self):
+        snapshot = DomSnapshot(HTML)
+        rows = snapshot.find_elements((By.TAG_NAME, "tr"))
+        assert_that([Displayed()(row) for row in rows], equal_to([True, False, True]))
+        checkbox = snapshot.root.find_element(By.TAG_NAME, "input")
+        assert_that(checkbox.is_enabled(), equal_to(False))
+        assert_that(checkbox.get_attribute("disabled"), equal_to("true"))
+
+    def test__text__should_separate_only_block_elements(self):
+        snapshot = DomSnapshot(
+            "<div><p><b>a</b>b</p><p>a<span>b</span>\n  c</p>"
+            "<div>d<br>e</div><table><tr><td>f</td><td>g</td></tr></table></div>"
+        )
+        assert_that(snapshot.root.text, equal_to("ab\nab c\nd\ne\nf g"))
+
+    def test__find_elements__should_reject_unsupported_locators(self):
+        snapshot = DomSnapshot(HTML)
+        assert_that(
+            calling(snapshot.find_elements).with_args((By.XPATH, "//td[text()='10']")),
+            raises(InvalidSelectorException),
+        )
+
+    def test__nodes__should_become_stale_after_release(self):
+        with DomSnapshot(HTML) as snapshot:
+            root = snapshot.root
+            assert_that(root.tag_name, equal_to("table"))
+        assert_that(calling(lambda: root.text), raises(StaleElementReferenceException))
+
+    def test__child_locator__should_search_in_active_snapshot(self):
+        parent_web_element = FakeWebElement("table", attributes={"outerHTML": HTML})
+        parent = SnapshotParent((By.ID, "report"), "Report", Displayed())
+        parent._seed_cache(parent_web_element)
+        locator = ChildLocator(parent, (By.CSS_SELECTOR, "td"))
+        with parent.capture_dom_snapshot():
+            assert_that(locator.find_elements()[1].text, equal_to("10"))
+        assert_that(parent_web_element.searched_locators, equal_to([]))
+        assert_that(locator.find_elements(), equal_to([]))
+        assert_that(
+            parent_web_element.searched_locators, equal_to([(By.CSS_SELECTOR, "td")])
+        )
+
+    def test__element_finder__should_check_states_of_snapshot_nodes(self):
+        parent = SnapshotParent((By.ID, "report"), "Report", Displayed())
+        parent._seed_cache(FakeWebElement("table", attributes={"outerHTML": HTML}))
+        locator = ChildLocator(parent, (By.TAG_NAME, "tr"))
+        application = SerializingApplication()
+        finder = ElementFinder(
+            Logger(), ConditionalWait(CustomTimeoutConfiguration(), application)
+        )
+        with parent.capture_dom_snapshot():
+            rows = finder.find_elements(locator, Displayed(), timedelta())
+            assert_that(
+                [row.get_attribute("class") for row in rows],
+                equal_to(["row first", "row"]),
+            )
+        assert_that(application.driver.scripts_count, equal_to(0))
+
+
+class SerializingDriver:
+    def __init__(self):
+        self.scripts_count = 0
+
+    def execute_script(self, script, *args):
+        self.scripts_count += 1
+        json.dumps(args)
+        return []
+
+
+class SerializingApplication(Application):
+    def __init__(self):
+        self.__driver = SerializingDriver()
+
+    @property
+    def driver(self):
+        return self.__driver
+
+
+class Retrier(AbstractElementActionRetrier):
+    def do_with_retry(self, function, handled_exceptions=None):
+        return function()
+
+    @property
+    def get_handled_exceptions(self):
+        return []
+
+
+class SnapshotParent(CustomElement):
+    @property
+    def _element_action_retrier(self) -> AbstractElementActionRetrier:
+        return Retrier()
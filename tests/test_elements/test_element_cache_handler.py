@@ -0,0 +1,96 @@
+import time
+from datetime import timedelta
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.configurations.element_cache_configuration import (
+    ElementCacheMode,
+)
+from aquality_selenium_core.elements.element_cache_handler import ElementCacheHandler
+from aquality_selenium_core.elements.element_state import Displayed
+from tests.test_elements.fakes import CacheConfiguration
+from tests.test_elements.fakes import FakeElementFinder
+from tests.test_elements.fakes import FakeWebElement
+
+LOCATOR = (By.XPATH, "//button")
+
+
+class TestElementCacheHandler:
+    def test__get_element__should_check_element_in_validating_mode(self):
+        element = FakeWebElement("button")
+        handler = self.__get_handler(FakeElementFinder([element]))
+        handler.get_element()
+        handler.get_element()
+        assert_that(element.displayed_checks_count, equal_to(1))
+        assert_that(handler.misses_count, equal_to(1))
+        assert_that(handler.hits_count, equal_to(1))
+
+    def test__get_element__should_search_element_again_if_it_is_stale(self):
+        stale_element = FakeWebElement("stale", is_stale=True)
+        handler = self.__get_handler(FakeElementFinder([FakeWebElement("fresh")]))
+        handler.seed_element(stale_element)
+        assert_that(handler.get_element().name, equal_to("fresh"))
+
+    def test__get_element__should_not_check_element_in_optimistic_mode(self):
+        element = FakeWebElement("button")
+        finder = FakeElementFinder([element])
+        handler = self.__get_handler(finder, ElementCacheMode.OPTIMISTIC)
+        for _ in range(3):
+            handler.get_element()
+        assert_that(element.displayed_checks_count, equal_to(0))
+        assert_that(finder.calls_count, equal_to(1))
+        assert_that(handler.hits_count, equal_to(2))
+        assert_that(handler.misses_count, equal_to(1))
+
+    def test__get_element__should_search_element_again_after_invalidation(self):
+        finder = FakeElementFinder([FakeWebElement("button")])
+        handler = self.__get_handler(finder, ElementCacheMode.OPTIMISTIC)
+        handler.get_element()
+        handler.invalidate()
+        handler.get_element()
+        assert_that(finder.calls_count, equal_to(2))
+
+    def test__get_element__should_search_element_again_if_generation_changed(self):
+        finder = FakeElementFinder([FakeWebElement("button")])
+        generation = {"value": 1}
+        handler = ElementCacheHandler(
+            LOCATOR,
+            Displayed(),
+            finder,
+            CacheConfiguration(mode=ElementCacheMode.OPTIMISTIC),
+            lambda: generation["value"],
+        )
+        handler.get_element()
+        handler.get_element()
+        generation["value"] = 2
+        handler.get_element()
+        assert_that(finder.calls_count, equal_to(2))
+
+    def test__get_element__should_revalidate_element_after_interval(self):
+        element = FakeWebElement("button")
+        handler = self.__get_handler(
+            FakeElementFinder([element]),
+            ElementCacheMode.OPTIMISTIC,
+            timedelta(milliseconds=50),
+        )
+        handler.get_element()
+        handler.get_element()
+        assert_that(element.displayed_checks_count, equal_to(0))
+        time.sleep(0.06)
+        handler.get_element()
+        assert_that(element.displayed_checks_count, equal_to(1))
+
+    @staticmethod
+    def __get_handler(
+        finder: FakeElementFinder,
+        mode: ElementCacheMode = ElementCacheMode.VALIDATING,
+        revalidation_interval: timedelta = None,
+    ) -> ElementCacheHandler:
+        return ElementCacheHandler(
+            LOCATOR,
+            Displayed(),
+            finder,
+            CacheConfiguration(mode=mode, revalidation_interval=revalidation_interval),
+        )
@@ -0,0 +1,61 @@
+from typing import List
+from typing import Tuple
+
+from hamcrest import assert_that
+from hamcrest import calling
+from hamcrest import equal_to
+from hamcrest import raises
+
+from aquality_selenium_core.elements.element_collection import ElementCollection
+
+
+class TestElementCollection:
+    def test__len__should_load_only_first_chunk(self):
+        loader = ChunkLoader(95)
+        assert_that(len(self.__get_collection(loader)), equal_to(95))
+        assert_that(loader.ranges, equal_to([(0, 10)]))
+
+    def test__getitem__should_load_chunk_with_requested_element(self):
+        loader = ChunkLoader(95)
+        collection = self.__get_collection(loader)
+        assert_that(collection[42], equal_to("element 42"))
+        assert_that(collection[-1], equal_to("element 94"))
+        assert_that(loader.ranges, equal_to([(40, 50), (90, 100)]))
+
+    def test__getitem__should_support_slices(self):
+        collection = self.__get_collection(ChunkLoader(95))
+        assert_that(
+            collection[8:12], equal_to([f"element {index}" for index in range(8, 12)])
+        )
+
+    def test__getitem__should_raise_index_error_out_of_range(self):
+        collection = self.__get_collection(ChunkLoader(5))
+        assert_that(calling(collection.__getitem__).with_args(5), raises(IndexError))
+
+    def test__first__should_stop_loading_after_found_element(self):
+        loader = ChunkLoader(95)
+        element = self.__get_collection(loader).first(lambda item: item.endswith("15"))
+        assert_that(element, equal_to("element 15"))
+        assert_that(loader.ranges, equal_to([(0, 10), (10, 20)]))
+
+    def test__iter__should_iterate_over_all_elements(self):
+        assert_that(
+            list(self.__get_collection(ChunkLoader(25))),
+            equal_to([f"element {index}" for index in range(25)]),
+        )
+
+    @staticmethod
+    def __get_collection(loader: "ChunkLoader") -> ElementCollection[str]:
+        return ElementCollection(
+            loader, lambda index, web_element: f"element {web_element}", 10
+        )
+
+
+class ChunkLoader:
+    def __init__(self, total: int):
+        self.ranges: List[Tuple[int, int]] = []
+        self.__total = total
+
+    def __call__(self, start: int, end: int) -> Tuple[int, List[int]]:
+        self.ranges.append((start, end))
+        return self.__total, list(range(start, min(end, self.__total)))
@@ -0,0 +1,278 @@
+from typing import cast
+from typing import List
+from typing import Tuple
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import has_length
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.element_factory import ElementFactory
+from aquality_selenium_core.elements.element_state import Displayed
+from aquality_selenium_core.elements.elements_count import ElementsCount
+from aquality_selenium_core.utilities.java_script import JavaScript
+from aquality_selenium_core.waitings.conditional_wait import ConditionalWait
+from tests.test_elements.fakes import CacheConfiguration
+from tests.test_elements.fakes import CustomElement
+from tests.test_elements.fakes import FakeElementFinder
+from tests.test_elements.fakes import FakeWebElement
+from tests.test_elements.fakes import LocalizationManager
+from tests.test_waitings.test_conditional_wait import Application
+from tests.test_waitings.test_conditional_wait import CustomTimeoutConfiguration
+
+LOCATOR = (By.XPATH, "//tr")
+
+
+class TestElementFactory:
+    def test__find_elements__should_search_elements_once(self):
+        finder = FakeElementFinder([FakeWebElement("first"), FakeWebElement("second")])
+        elements = self.__get_factory(finder).find_elements(
+            CustomElement, LOCATOR, expected_count=ElementsCount.MORE_THAN_ZERO
+        )
+        assert_that(elements, has_length(2))
+        assert_that(finder.calls_count, equal_to(1), "Elements should be searched once")
+
+    def test__find_elements__should_seed_found_elements_to_cache(self):
+        finder = FakeElementFinder([FakeWebElement("first"), FakeWebElement("second")])
+        elements = self.__get_factory(finder).find_elements(CustomElement, LOCATOR)
+        CustomElement.element_finder = finder
+        assert_that(
+            [element.get_element().name for element in elements],
+            equal_to(["first", "second"]),
+        )
+        assert_that(
+            finder.calls_count,
+            equal_to(1),
+            "Elements should not be searched again after creation",
+        )
+
+    def test__find_elements__should_not_register_caches_if_cache_is_disabled(self):
+        finder = FakeElementFinder([FakeWebElement("first"), FakeWebElement("second")])
+        UncachedElement.application = Application()
+        self.__get_factory(finder).find_elements(UncachedElement, LOCATOR)
+        assert_that(
+            len(UncachedElement.application.element_cache_registry), equal_to(0)
+        )
+
+    def test__find_elements__should_build_positional_locators(self):
+        finder = FakeElementFinder([FakeWebElement("first"), FakeWebElement("second")])
+        elements = self.__get_factory(finder).find_elements(CustomElement, LOCATOR)
+        assert_that(
+            [element.locator for element in elements],
+            equal_to([(By.XPATH, "(//tr)[1]"), (By.XPATH, "(//tr)[2]")]),
+        )
+
+    def test__find_elements__should_keep_positions_of_elements_filtered_by_state(
+        self,
+    ):
+        finder = FakeElementFinder(
+            [
+                FakeWebElement("hidden", is_displayed=False),
+                FakeWebElement("first"),
+                FakeWebElement("second"),
+            ]
+        )
+        elements = self.__get_factory(finder).find_elements(CustomElement, LOCATOR)
+        CustomElement.element_finder = finder
+        assert_that(
+            [(element.locator, element.get_element().name) for element in elements],
+            equal_to(
+                [
+                    ((By.XPATH, "(//tr)[2]"), "first"),
+                    ((By.XPATH, "(//tr)[3]"), "second"),
+                ]
+            ),
+        )
+
+    def test__find_elements__should_build_positional_locators_for_css(self):
+        finder = FakeElementFinder([FakeWebElement("first")])
+        elements = self.__get_factory(finder).find_elements(
+            CustomElement, (By.CSS_SELECTOR, "table td")
+        )
+        assert_that(
+            [element.locator for element in elements],
+            equal_to([(By.XPATH, "(//table//td)[1]")]),
+        )
+
+    def test__find_element_collection__should_load_elements_by_chunks(self):
+        application = ScriptApplication(120)
+        finder = FakeElementFinder([])
+        collection = self.__get_factory(finder, application).find_element_collection(
+            CustomElement, LOCATOR, chunk_size=50
+        )
+        assert_that(collection[70].name, equal_to("element 71"))
+        assert_that(len(collection), equal_to(120))
+        assert_that(application.driver.ranges, equal_to([(0, 0), (50, 100)]))
+        assert_that(
+            application.driver.counted_ranges,
+            equal_to([(0, 0)]),
+            "Only the first call should evaluate all elements",
+        )
+        assert_that(finder.calls_count, equal_to(0))
+
+    def test__find_element_collection__should_keep_positions_of_elements_in_state(
+        self,
+    ):
+        application = ScriptApplication(10, hidden_count=2)
+        collection = self.__get_factory(
+            FakeElementFinder([]), application
+        ).find_element_collection(CustomElement, LOCATOR)
+        assert_that(
+            [element.locator for element in collection[:2]],
+            equal_to([(By.XPATH, "(//tr)[3]"), (By.XPATH, "(//tr)[4]")]),
+        )
+
+    def test__prefetch__should_find_elements_with_one_script(self):
+        application = QueriesApplication([[FakeWebElement("login")], []])
+        finder = FakeElementFinder([FakeWebElement("searched")])
+        CustomElement.element_finder = finder
+        login = CustomElement((By.ID, "login"), "Login", Displayed())
+        missing = CustomElement((By.ID, "missing"), "Missing", Displayed())
+        custom = CustomElement((By.ID, "custom"), "Custom", lambda element: True)
+        prefetched_count = self.__get_factory(finder, application).prefetch(
+            [login, missing, custom]
+        )
+        assert_that(prefetched_count, equal_to(1))
+        assert_that(
+            application.driver.queries,
+            equal_to(
+                [
+                    [
+                        ["css selector", '[id="login"]', "displayed"],
+                        ["css selector", '[id="missing"]', "displayed"],
+                    ]
+                ]
+            ),
+        )
+        assert_that(login.get_element().name, equal_to("login"))
+        assert_that(finder.calls_count, equal_to(0))
+
+    def test__attributes__should_read_found_elements_with_one_script(self):
+        application = ReadApplication()
+        finder = FakeElementFinder(
+            [FakeWebElement("first", attributes={"id": "1"}), FakeWebElement("second")]
+        )
+        CustomElement.element_finder = finder
+        factory = self.__get_factory(finder, application)
+        elements = factory.find_elements(CustomElement, LOCATOR)
+        assert_that(factory.attributes(elements, ["id"]), equal_to({"id": ["1", None]}))
+        assert_that(application.driver.calls_count, equal_to(1))
+        assert_that(finder.calls_count, equal_to(1))
+
+    def test__texts__should_find_uncached_elements_with_read_script(self):
+        application = ReadApplication()
+        finder = FakeElementFinder([FakeWebElement("first"), FakeWebElement("second")])
+        UncachedElement.application = application
+        UncachedElement.element_finder = finder
+        factory = self.__get_factory(finder, application)
+        elements = factory.find_elements(UncachedElement, LOCATOR)
+        assert_that(
+            factory.texts(elements),
+            equal_to(["(//tr)[1]", "(//tr)[2]"]),
+        )
+        assert_that(application.driver.calls_count, equal_to(1))
+        assert_that(
+            finder.calls_count,
+            equal_to(1),
+            "Elements should be found by read script instead of finder",
+        )
+
+    @staticmethod
+    def __get_factory(
+        finder: FakeElementFinder, application: Application = None
+    ) -> ElementFactory:
+        conditional_wait = ConditionalWait(CustomTimeoutConfiguration(), Application())
+        return ElementFactory(
+            conditional_wait, finder, LocalizationManager(), application
+        )
+
+
+class UncachedElement(CustomElement):
+    application: Application = cast(Application, None)
+
+    @property
+    def _application(self) -> Application:
+        return self.application
+
+    @property
+    def _cache_configuration(self) -> CacheConfiguration:
+        return CacheConfiguration(is_enabled=False)
+
+
+class ScriptDriver:
+    def __init__(self, total: int, hidden_count: int = 0):
+        self.ranges: List[Tuple[int, int]] = []
+        self.counted_ranges: List[Tuple[int, int]] = []
+        self.__total = total
+        self.__hidden_count = hidden_count
+
+    def execute_script(self, script, strategy, value, state, start, end, count_all):
+        self.ranges.append((start, end))
+        if count_all:
+            self.counted_ranges.append((start, end))
+        indexes = range(start, min(end, self.__total))
+        return [
+            self.__total if count_all else None,
+            [FakeWebElement(str(index)) for index in indexes],
+            [self.__hidden_count + index + 1 for index in indexes],
+        ]
+
+
+class ScriptApplication(Application):
+    def __init__(self, total: int, hidden_count: int = 0):
+        self.__driver = ScriptDriver(total, hidden_count)
+
+    @property
+    def driver(self):
+        return self.__driver
+
+
+class QueriesDriver:
+    def __init__(self, result: List[List[FakeWebElement]]):
+        self.queries: List[List[List[str]]] = []
+        self.__result = result
+
+    def execute_script(self, script, queries, limit):
+        self.queries.append(queries)
+        return self.__result
+
+
+class QueriesApplication(Application):
+    def __init__(self, result: List[List[FakeWebElement]]):
+        self.__driver = QueriesDriver(result)
+
+    @property
+    def driver(self):
+        return self.__driver
+
+
+class ReadDriver:
+    def __init__(self):
+        self.calls_count = 0
+
+    def execute_script(self, script, elements, *args):
+        if script == JavaScript.EVALUATE_STATES.script:
+            return [element.is_displayed() for element in elements]
+        names, read_texts = args
+        self.calls_count += 1
+        elements = [
+            FakeWebElement(target[1]) if isinstance(target, list) else target
+            for target in elements
+        ]
+        return {
+            "texts": [element.text for element in elements] if read_texts else [],
+            "attributes": {
+                name: [element.get_attribute(name) for element in elements]
+                for name in names
+            },
+            "missing": [],
+        }
+
+
+class ReadApplication(Application):
+    def __init__(self):
+        self.__driver = ReadDriver()
+
+    @property
+    def driver(self):
+        return self.__driver
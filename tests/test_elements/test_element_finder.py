@@ -0,0 +1,119 @@
+import logging
+from datetime import timedelta
+from typing import List
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import has_length
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.element_finder import ElementFinder
+from aquality_selenium_core.elements.element_state import Displayed
+from aquality_selenium_core.localization.localization_manager import LocalizationManager
+from aquality_selenium_core.localization.localized_logger import LocalizedLogger
+from aquality_selenium_core.utilities.java_script import JavaScript
+from aquality_selenium_core.waitings.conditional_wait import ConditionalWait
+from tests.test_elements.fakes import FakeWebElement
+from tests.test_localization.test_localization_manager import LoggerConfiguration
+from tests.test_waitings.test_conditional_wait import Application
+from tests.test_waitings.test_conditional_wait import CustomTimeoutConfiguration
+
+FIRST_LOCATOR = (By.ID, "first")
+SECOND_LOCATOR = (By.XPATH, "//second")
+NATIVE_LOCATOR = ("accessibility id", "native")
+
+
+class TestFindMany:
+    def test__find_many__should_search_all_locators_with_one_script(self):
+        first, second = FakeWebElement("first"), FakeWebElement("second")
+        driver = ManyDriver([[[first], [second]]])
+        result = self.__get_finder(driver).find_many(
+            [FIRST_LOCATOR, SECOND_LOCATOR], Displayed()
+        )
+        assert_that(
+            result, equal_to({FIRST_LOCATOR: [first], SECOND_LOCATOR: [second]})
+        )
+        assert_that(driver.queries_count, equal_to(1))
+
+    def test__find_many__should_search_unsupported_locators_by_driver(self):
+        first, native = FakeWebElement("first"), FakeWebElement("native")
+        driver = ManyDriver([[[first]]], [native])
+        result = self.__get_finder(driver).find_many([FIRST_LOCATOR, NATIVE_LOCATOR])
+        assert_that(
+            result, equal_to({FIRST_LOCATOR: [first], NATIVE_LOCATOR: [native]})
+        )
+        assert_that(driver.searched_locators, equal_to([NATIVE_LOCATOR]))
+
+    def test__wait_for_many__should_poll_all_locators_together(self):
+        first, second = FakeWebElement("first"), FakeWebElement("second")
+        driver = ManyDriver([[[first], []], [[first], []], [[first], [second]]])
+        result = self.__get_finder(driver).wait_for_many(
+            [FIRST_LOCATOR, SECOND_LOCATOR], Displayed(), timedelta(seconds=5)
+        )
+        assert_that(
+            result, equal_to({FIRST_LOCATOR: [first], SECOND_LOCATOR: [second]})
+        )
+        assert_that(driver.queries_count, equal_to(3))
+
+    def test__wait_for_many__should_return_partial_result_after_timeout(self):
+        first = FakeWebElement("first")
+        driver = ManyDriver([[[first], []]])
+        result = self.__get_finder(driver).wait_for_many(
+            [FIRST_LOCATOR, SECOND_LOCATOR], Displayed(), timedelta(milliseconds=300)
+        )
+        assert_that(result, equal_to({FIRST_LOCATOR: [first], SECOND_LOCATOR: []}))
+
+    def test__wait_for_many__should_log_missing_locators_after_timeout(self, caplog):
+        caplog.set_level(logging.DEBUG)
+        configuration = LoggerConfiguration()
+        logger = LocalizedLogger(LocalizationManager(configuration), configuration)
+        driver = ManyDriver([[[FakeWebElement("first")], []]])
+        self.__get_finder(driver, logger).wait_for_many(
+            [FIRST_LOCATOR, SECOND_LOCATOR], Displayed(), timedelta(milliseconds=300)
+        )
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if str(SECOND_LOCATOR) in record.getMessage()
+        ]
+        assert_that(messages, has_length(1))
+
+    @staticmethod
+    def __get_finder(driver: "ManyDriver", logger=None) -> ElementFinder:
+        conditional_wait = ConditionalWait(
+            CustomTimeoutConfiguration(), DriverApplication(driver)
+        )
+        return ElementFinder(logger or Logger(), conditional_wait)
+
+
+class ManyDriver:
+    def __init__(self, polls: List[List], native_elements: List = []):
+        self.__polls = polls
+        self.__native_elements = native_elements
+        self.queries_count = 0
+        self.searched_locators: List = []
+
+    def execute_script(self, script, *args):
+        if script == JavaScript.FIND_MANY.script:
+            result = self.__polls[min(self.queries_count, len(self.__polls) - 1)]
+            self.queries_count += 1
+            return result
+        return [element.is_displayed() for element in args[0]]
+
+    def find_elements(self, by, value):
+        self.searched_locators.append((by, value))
+        return list(self.__native_elements)
+
+
+class DriverApplication(Application):
+    def __init__(self, driver: ManyDriver):
+        self.__driver = driver
+
+    @property
+    def driver(self):
+        return self.__driver
+
+
+class Logger:
+    def debug(self, *args, **kwargs):
+        pass
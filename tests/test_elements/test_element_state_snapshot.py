@@ -0,0 +1,109 @@
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.element_state_provider import (
+    ElementStateProvider,
+)
+from aquality_selenium_core.elements.element_state_snapshot import (
+    take_element_snapshot,
+)
+from aquality_selenium_core.waitings.conditional_wait import ConditionalWait
+from tests.test_elements.fakes import FakeElementFinder
+from tests.test_elements.fakes import FakeWebElement
+from tests.test_elements.fakes import NODE_PATH
+from tests.test_elements.fakes import NodeDriver
+from tests.test_elements.fakes import NodeElement
+from tests.test_elements.test_element_finder import DriverApplication
+from tests.test_waitings.test_conditional_wait import CustomTimeoutConfiguration
+
+SCRIPT_RESULT = {
+    "displayed": True,
+    "enabled": False,
+    "rect": {"x": 1, "y": 2, "width": 30, "height": 40},
+    "text": "Submit",
+    "attributes": {"type": "submit", "title": None},
+}
+
+
+class TestElementStateSnapshot:
+    def test__take_element_snapshot__should_read_state_with_one_script(self):
+        driver = SnapshotDriver()
+        snapshot = take_element_snapshot(
+            driver, FakeWebElement("button"), ["type", "title"]
+        )
+        assert_that(driver.scripts_count, equal_to(1))
+        assert_that(
+            [snapshot.is_exist, snapshot.is_displayed, snapshot.is_enabled],
+            equal_to([True, True, False]),
+        )
+        assert_that(snapshot.is_clickable, equal_to(False))
+        assert_that(snapshot.text, equal_to("Submit"))
+        assert_that(snapshot.rect, equal_to(SCRIPT_RESULT["rect"]))
+        assert_that(snapshot.get_attribute("type"), equal_to("submit"))
+        assert_that(snapshot.get_attribute("title"), equal_to(None))
+
+    @pytest.mark.skipif(NODE_PATH is None, reason="Node.js is not installed")
+    def test__take_element_snapshot__should_read_properties_like_webdriver(self):
+        typed_input = NodeElement(
+            "input",
+            {"type": "checkbox", "value": "typed", "checked": True, "disabled": False},
+            {"type": "checkbox", "value": "initial", "checked": ""},
+        )
+        snapshot = take_element_snapshot(
+            NodeDriver(), typed_input, ["value", "checked", "disabled"]
+        )
+        assert_that(
+            snapshot.attributes,
+            equal_to({"value": "typed", "checked": "true", "disabled": None}),
+        )
+
+    def test__take_element_snapshot__should_use_commands_without_driver(self):
+        snapshot = take_element_snapshot(None, SnapshotElement(), ["type"])
+        assert_that(snapshot.is_clickable, equal_to(True))
+        assert_that(snapshot.text, equal_to("Submit"))
+        assert_that(snapshot.attributes, equal_to({"type": "type value"}))
+
+    def test__take_element_snapshot__should_return_absent_element_state(self):
+        assert_that(take_element_snapshot(None, None).is_exist, equal_to(False))
+        stale_element = FakeWebElement("stale", is_stale=True)
+        assert_that(
+            take_element_snapshot(None, stale_element).is_exist, equal_to(False)
+        )
+
+    def test__snapshot__should_find_element_once(self):
+        driver = SnapshotDriver()
+        finder = FakeElementFinder([FakeWebElement("button")])
+        provider = ElementStateProvider(
+            (By.ID, "submit"),
+            ConditionalWait(CustomTimeoutConfiguration(), DriverApplication(driver)),
+            finder,
+            DriverApplication(driver),
+        )
+        assert_that(provider.snapshot(["type"]).is_displayed, equal_to(True))
+        assert_that(finder.calls_count, equal_to(1))
+        assert_that(driver.scripts_count, equal_to(1))
+
+
+class SnapshotDriver:
+    def __init__(self):
+        self.scripts_count = 0
+
+    def execute_script(self, script, element, attributes):
+        self.scripts_count += 1
+        return SCRIPT_RESULT
+
+
+class SnapshotElement(FakeWebElement):
+    rect = {"x": 0, "y": 0, "width": 10, "height": 10}
+    text = "Submit"
+
+    def __init__(self):
+        super().__init__("button")
+
+    def get_attribute(self, name):
+        if self.is_stale:
+            raise StaleElementReferenceException()
+        return f"{name} value"
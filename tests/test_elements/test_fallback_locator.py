@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import none
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.element_factory import ElementFactory
+from aquality_selenium_core.elements.element_finder import ElementFinder
+from aquality_selenium_core.elements.element_state import Displayed
+from aquality_selenium_core.elements.fallback_locator import FallbackLocator
+from aquality_selenium_core.elements.fallback_locator import FallbackMatch
+from aquality_selenium_core.waitings.conditional_wait import ConditionalWait
+from tests.test_elements.fakes import CustomElement
+from tests.test_elements.fakes import FakeElementFinder
+from tests.test_elements.fakes import FakeWebElement
+from tests.test_elements.fakes import LocalizationManager
+from tests.test_elements.test_element_finder import DriverApplication
+from tests.test_elements.test_element_finder import ManyDriver
+from tests.test_waitings.test_conditional_wait import Application
+from tests.test_waitings.test_conditional_wait import CustomTimeoutConfiguration
+
+PRIMARY_LOCATOR = (By.ID, "submit")
+ALTERNATE_LOCATOR = (By.XPATH, "//button[@type='submit']")
+
+
+class TestFallbackLocator:
+    def test__fallback_locator__should_look_like_primary_locator(self):
+        locator = FallbackLocator([PRIMARY_LOCATOR, ALTERNATE_LOCATOR])
+        assert_that(tuple(locator), equal_to(PRIMARY_LOCATOR))
+
+    def test__fallback_locator__should_differ_from_primary_locator(self):
+        locator = FallbackLocator([PRIMARY_LOCATOR, ALTERNATE_LOCATOR])
+        other_locator = FallbackLocator([PRIMARY_LOCATOR, (By.NAME, "submit")])
+        assert_that(locator == PRIMARY_LOCATOR, equal_to(False))
+        assert_that(PRIMARY_LOCATOR == locator, equal_to(False))
+        assert_that(locator == other_locator, equal_to(False))
+        assert_that(
+            locator == FallbackLocator([PRIMARY_LOCATOR, ALTERNATE_LOCATOR]),
+            equal_to(True),
+        )
+        assert_that(
+            len({PRIMARY_LOCATOR: 1, locator: 2, other_locator: 3}), equal_to(3)
+        )
+
+    def test__fallback_locator__should_not_be_empty(self):
+        with pytest.raises(ValueError):
+            FallbackLocator([])
+
+    def test__find_elements__should_reject_chain_without_positional_alternatives(
+        self,
+    ):
+        factory = ElementFactory(
+            ConditionalWait(CustomTimeoutConfiguration(), Application()),
+            FakeElementFinder([FakeWebElement("link")]),
+            LocalizationManager(),
+        )
+        locator = FallbackLocator([(By.LINK_TEXT, "Submit"), (By.LINK_TEXT, "Send")])
+        with pytest.raises(ValueError, match="is not supported"):
+            factory.find_elements(CustomElement, locator)
+
+    def test__find_elements__should_use_first_matching_locator(self):
+        button = FakeWebElement("button")
+        context = SearchContext({ALTERNATE_LOCATOR: [button]})
+        locator = FallbackLocator([PRIMARY_LOCATOR, ALTERNATE_LOCATOR])
+        assert_that(
+            locator.find_elements(context),
+            equal_to(FallbackMatch(ALTERNATE_LOCATOR, [button])),
+        )
+
+    def test__find_elements__should_return_no_locator_if_nothing_matched(self):
+        locator = FallbackLocator([PRIMARY_LOCATOR, ALTERNATE_LOCATOR])
+        match = locator.find_elements(SearchContext({}))
+        assert_that(match.locator, none())
+        assert_that(match.elements, equal_to([]))
+
+    def test__find_elements_in_state__should_poll_all_locators_with_one_script(self):
+        button = FakeWebElement("button")
+        driver = ManyDriver([[[], []], [[], [button]]])
+        logger = Logger()
+        finder = ElementFinder(
+            logger,
+            ConditionalWait(CustomTimeoutConfiguration(), DriverApplication(driver)),
+        )
+        locator = FallbackLocator([PRIMARY_LOCATOR, ALTERNATE_LOCATOR])
+        elements = finder.find_elements(locator, Displayed(), timedelta(seconds=5))
+        assert_that(elements, equal_to([button]))
+        assert_that(driver.queries_count, equal_to(2))
+        assert_that(
+            logger.messages,
+            equal_to([("loc.elements.found.by.fallback.locator", ALTERNATE_LOCATOR)]),
+        )
+
+    def test__find_elements_in_state__should_report_elements_found_not_in_state(
+        self,
+    ):
+        hidden_button = FakeWebElement("button", is_displayed=False)
+        driver = ManyDriver([[[hidden_button], []]])
+        logger = Logger()
+        finder = ElementFinder(
+            logger,
+            ConditionalWait(CustomTimeoutConfiguration(), DriverApplication(driver)),
+        )
+        locator = FallbackLocator([PRIMARY_LOCATOR, ALTERNATE_LOCATOR])
+        assert_that(
+            finder.find_elements(locator, Displayed(), timedelta()), equal_to([])
+        )
+        assert_that(
+            logger.messages,
+            equal_to([("loc.elements.were.found.but.not.in.state", locator)]),
+        )
+
+
+class SearchContext:
+    def __init__(self, elements):
+        self.__elements = elements
+
+    def find_elements(self, by, value):
+        return self.__elements.get((by, value), [])
+
+
+class Logger:
+    def __init__(self):
+        self.messages = []
+
+    def debug(self, message_key, *args, **kwargs):
+        self.messages.append((message_key, *args[:1]))
@@ -0,0 +1,76 @@
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import none
+from hamcrest import same_instance
+from selenium.webdriver.common.by import By
+
+from aquality_selenium_core.elements.child_locator import ChildLocator
+from aquality_selenium_core.elements.locator_compiler import compile_locator
+from aquality_selenium_core.elements.locator_compiler import to_css
+from aquality_selenium_core.elements.locator_compiler import to_xpath
+
+
+class TestLocatorCompiler:
+    @pytest.mark.parametrize(
+        "locator, expected_xpath",
+        [
+            ((By.TAG_NAME, "td"), "//td"),
+            ((By.ID, "main"), '//*[@id="main"]'),
+            ((By.NAME, "login"), '//*[@name="login"]'),
+            (
+                (By.CLASS_NAME, "item"),
+                "//*[contains(concat(' ', normalize-space(@class), ' '), ' item ')]",
+            ),
+            (
+                (By.CSS_SELECTOR, "#main > td[data-id='1']"),
+                "//*[@id='main']/td[@data-id=\"1\"]",
+            ),
+            ((By.CSS_SELECTOR, "table td"), "//table//td"),
+        ],
+    )
+    def test__to_xpath__should_translate_locator(self, locator, expected_xpath):
+        assert_that(to_xpath(locator), equal_to((By.XPATH, expected_xpath)))
+
+    @pytest.mark.parametrize(
+        "locator, expected_css",
+        [
+            ((By.ID, "main"), '[id="main"]'),
+            ((By.XPATH, "//div[@id='main']/a"), 'div[id="main"] > a'),
+            ((By.XPATH, ".//td[@data-id]"), "td[data-id]"),
+            ((By.XPATH, "//*[@name='login']"), '[name="login"]'),
+        ],
+    )
+    def test__to_css__should_translate_locator(self, locator, expected_css):
+        assert_that(to_css(locator), equal_to((By.CSS_SELECTOR, expected_css)))
+
+    @pytest.mark.parametrize(
+        "locator",
+        [
+            (By.XPATH, "//div[1]"),
+            (By.XPATH, "//div[text()='value']"),
+            (By.XPATH, "/html/body"),
+            (By.XPATH, "//div/.."),
+            (By.LINK_TEXT, "link"),
+        ],
+    )
+    def test__to_css__should_not_translate_complex_locator(self, locator):
+        assert_that(to_css(locator), none())
+
+    def test__to_xpath__should_not_translate_pseudo_classes(self):
+        assert_that(to_xpath((By.CSS_SELECTOR, "a:hover")), none())
+
+    def test__compile_locator__should_prefer_css_for_simple_xpath(self):
+        locator = (By.XPATH, "//table//td")
+        assert_that(compile_locator(locator), same_instance(locator))
+        assert_that(
+            compile_locator(locator, prefer_fastest_engine=True),
+            equal_to((By.CSS_SELECTOR, "table td")),
+        )
+
+    def test__compile_locator__should_keep_child_locator(self):
+        locator = ChildLocator(None, (By.XPATH, ".//td"))
+        assert_that(
+            compile_locator(locator, prefer_fastest_engine=True),
+            same_instance(locator),
+        )
@@ -1,4 +1,7 @@
+import pytest
 from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import empty
 from hamcrest import equal_to
 from hamcrest import is_not
 from hamcrest import none
@@ -25,16 +28,28 @@ class TestLocalizationManager:
             "Not possible to request not existing key",
         )
 
+    @pytest.mark.parametrize("language", ["en", "ru", "be"])
+    def test_core_catalogs_should_contain_valid_templates(self, language, caplog):
+        manager = self.__get_localization_manager(language)
+        assert_that(caplog.records, empty())
+        assert_that(
+            manager.get_localized_message("loc.no.elements.found.in.state", "id", "x"),
+            contains_string("id"),
+        )
+
     @staticmethod
-    def __get_localization_manager():
-        logger_configuration = LoggerConfiguration()
+    def __get_localization_manager(language: str = "en"):
+        logger_configuration = LoggerConfiguration(language)
         return LocalizationManager(logger_configuration)
 
 
 class LoggerConfiguration(AbstractLoggerConfiguration):
+    def __init__(self, language: str = "en"):
+        self.__language = language
+
     @property
     def language(self) -> str:
-        return "en"
+        return self.__language
 
     @property
     def log_page_source(self) -> bool:
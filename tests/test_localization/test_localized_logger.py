@@ -0,0 +1,58 @@
+import logging
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+
+from aquality_selenium_core.localization.localization_manager import (
+    AbstractLocalizationManager,
+)
+from aquality_selenium_core.localization.localized_logger import LocalizedLogger
+from tests.test_localization.test_localization_manager import LoggerConfiguration
+
+
+class TestLocalizedLogger:
+    def test_should_not_localize_messages_of_disabled_level(self, caplog):
+        caplog.set_level(logging.WARNING)
+        localization_manager = CountingLocalizationManager()
+        logger = LocalizedLogger(localization_manager, LoggerConfiguration())
+        logger.info_element_action("Button", "Submit", "loc.clicking")
+        logger.debug("loc.clicking")
+        assert_that(localization_manager.calls_count, equal_to(0))
+        assert_that(caplog.records, equal_to([]))
+
+    def test_should_localize_emitted_messages_once(self, caplog):
+        caplog.set_level(logging.INFO)
+        localization_manager = CountingLocalizationManager()
+        logger = LocalizedLogger(localization_manager, LoggerConfiguration())
+        logger.info_element_action("Button", "Submit", "loc.text.value", "text")
+        assert_that(
+            [record.getMessage() for record in caplog.records],
+            equal_to(["Button 'Submit' :: loc.text.value('text',)"]),
+        )
+        caplog.records[0].getMessage()
+        assert_that(localization_manager.calls_count, equal_to(1))
+
+    def test_should_provide_configuration(self):
+        configuration = LoggerConfiguration("ru")
+        logger = LocalizedLogger(CountingLocalizationManager(), configuration)
+        assert_that(logger.configuration.language, equal_to("ru"))
+
+    def test_should_not_start_queued_logging(self):
+        handlers = list(logging.getLogger().handlers)
+        LocalizedLogger(CountingLocalizationManager(), QueuedLoggerConfiguration())
+        assert_that(logging.getLogger().handlers, equal_to(handlers))
+
+
+class QueuedLoggerConfiguration(LoggerConfiguration):
+    @property
+    def is_queue_enabled(self) -> bool:
+        return True
+
+
+class CountingLocalizationManager(AbstractLocalizationManager):
+    def __init__(self):
+        self.calls_count = 0
+
+    def get_localized_message(self, message_key: str, *message_args) -> str:
+        self.calls_count += 1
+        return f"{message_key}{message_args}"
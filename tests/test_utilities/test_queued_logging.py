@@ -0,0 +1,163 @@
+import logging
+import queue
+import threading
+from logging.handlers import QueueListener
+from typing import List
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import has_item
+from hamcrest import is_
+from hamcrest import is_not
+
+from aquality_selenium_core.configurations.logger_configuration import (
+    QueueOverflowPolicy,
+)
+from aquality_selenium_core.utilities.queued_logging import BoundedQueueHandler
+from aquality_selenium_core.utilities.queued_logging import QueuedLoggingPipeline
+
+
+class TestQueuedLogging:
+    def test_should_write_records_in_background_and_flush_on_stop(self):
+        logger = logging.getLogger("tests.queued_logging")
+        logger.propagate = False
+        handler = CollectingHandler()
+        logger.addHandler(handler)
+        try:
+            pipeline = QueuedLoggingPipeline(batch_size=10, logger=logger)
+            pipeline.start()
+            assert_that(logger.handlers, is_not(equal_to([handler])))
+            for index in range(25):
+                logger.warning("message %s", index)
+            pipeline.stop()
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+        assert_that(handler.messages, equal_to([f"message {i}" for i in range(25)]))
+        assert_that(
+            set(handler.thread_names),
+            is_not(equal_to({threading.current_thread().name})),
+        )
+        assert_that(handler.flushes_count > 0, equal_to(True))
+
+    @pytest.mark.parametrize(
+        "policy, expected_message",
+        [
+            (QueueOverflowPolicy.DROP_NEWEST, "first"),
+            (QueueOverflowPolicy.DROP_OLDEST, "second"),
+        ],
+    )
+    def test_should_apply_overflow_policy(self, policy, expected_message):
+        records_queue: queue.Queue = queue.Queue(maxsize=1)
+        handler = BoundedQueueHandler(records_queue, policy)
+        for message in ["first", "second"]:
+            handler.handle(
+                logging.LogRecord("test", logging.INFO, "", 0, message, None, None)
+            )
+        assert_that(records_queue.get_nowait().getMessage(), equal_to(expected_message))
+        assert_that(handler.dropped_count, equal_to(1))
+
+    def test_should_not_drop_stop_signal_of_listener(self):
+        records_queue: queue.Queue = queue.Queue(maxsize=1)
+        records_queue.put_nowait(QueueListener._sentinel)
+        handler = BoundedQueueHandler(records_queue, QueueOverflowPolicy.DROP_OLDEST)
+        handler.handle(logging.LogRecord("test", logging.INFO, "", 0, "", None, None))
+        assert_that(records_queue.get_nowait(), is_(QueueListener._sentinel))
+        assert_that(handler.dropped_count, equal_to(1))
+
+    def test_should_write_records_by_last_resort_if_logger_has_no_handlers(
+        self, monkeypatch
+    ):
+        handler = CollectingHandler()
+        monkeypatch.setattr(logging, "lastResort", handler)
+        logger = logging.getLogger("tests.queued_logging.no_handlers")
+        logger.propagate = False
+        try:
+            pipeline = QueuedLoggingPipeline(logger=logger)
+            pipeline.start()
+            logger.warning("message")
+            pipeline.stop()
+        finally:
+            logger.propagate = True
+        assert_that(handler.messages, equal_to(["message"]))
+        assert_that(logger.handlers, equal_to([]))
+
+    def test_should_write_records_by_last_resort_if_logger_has_only_capture_handlers(
+        self, monkeypatch, caplog
+    ):
+        handler = CollectingHandler()
+        monkeypatch.setattr(logging, "lastResort", handler)
+        logger = logging.getLogger("tests.queued_logging.capture_handlers")
+        logger.propagate = False
+        logger.addHandler(caplog.handler)
+        try:
+            pipeline = QueuedLoggingPipeline(logger=logger)
+            pipeline.start()
+            logger.warning("message")
+            pipeline.stop()
+        finally:
+            logger.removeHandler(caplog.handler)
+            logger.propagate = True
+        assert_that(handler.messages, equal_to(["message"]))
+        assert_that(caplog.messages, equal_to(["message"]))
+
+    def test_should_reset_dropped_count_on_stop(self):
+        logger = logging.getLogger("tests.queued_logging.dropped_count")
+        logger.propagate = False
+        handler = BlockingHandler()
+        logger.addHandler(handler)
+        try:
+            pipeline = QueuedLoggingPipeline(
+                1, QueueOverflowPolicy.DROP_NEWEST, logger=logger
+            )
+            pipeline.start()
+            for index in range(5):
+                logger.warning("message %s", index)
+                if index == 0:
+                    handler.is_emitting.wait(5)
+            assert_that(pipeline.dropped_count > 0, equal_to(True))
+            handler.is_unblocked.set()
+            pipeline.stop()
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+        assert_that(pipeline.dropped_count, equal_to(0))
+
+    def test_should_keep_capture_handlers_of_pytest(self, caplog):
+        logger = logging.getLogger()
+        pipeline = QueuedLoggingPipeline(logger=logger)
+        pipeline.start()
+        try:
+            assert_that(logger.handlers, has_item(caplog.handler))
+            logging.getLogger("tests.queued_logging").warning("captured")
+            assert_that(caplog.messages, equal_to(["captured"]))
+        finally:
+            pipeline.stop()
+        assert_that(logger.handlers, has_item(caplog.handler))
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages: List[str] = []
+        self.thread_names: List[str] = []
+        self.flushes_count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+        self.thread_names.append(threading.current_thread().name)
+
+    def flush(self) -> None:
+        self.flushes_count += 1
+
+
+class BlockingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.is_emitting = threading.Event()
+        self.is_unblocked = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.is_emitting.set()
+        self.is_unblocked.wait(5)
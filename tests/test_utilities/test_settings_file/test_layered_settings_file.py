@@ -0,0 +1,52 @@
+import json
+
+from hamcrest import assert_that
+from hamcrest import calling
+from hamcrest import equal_to
+from hamcrest import raises
+
+from aquality_selenium_core.utilities.settings_file import LayeredSettingsFile
+
+BASE = {
+    "timeouts": {"timeoutCondition": 30, "timeoutCommand": 60},
+    "arguments": {"start": ["first", "second"]},
+    "logger": {"language": "en"},
+}
+PROFILE = {"timeouts": {"timeoutCondition": 10}, "arguments": {"start": ["third"]}}
+LOCAL = {"logger": {"language": "ru", "logPageSource": False}}
+
+
+class TestLayeredSettingsFile:
+    def test_should_deep_merge_layers_in_order(self, tmp_path):
+        settings_file = self.__create_settings_file(
+            tmp_path, BASE, PROFILE, LOCAL, "settings.absent.json"
+        )
+        assert_that(settings_file.get_value("timeouts.timeoutCondition"), equal_to(10))
+        assert_that(settings_file.get_value("timeouts.timeoutCommand"), equal_to(60))
+        assert_that(settings_file.get_list("arguments.start"), equal_to(["third"]))
+        assert_that(
+            settings_file.get_dictionary("logger"),
+            equal_to({"language": "ru", "logPageSource": False}),
+        )
+
+    def test_should_require_base_file(self, tmp_path):
+        (tmp_path / "resources").mkdir()
+        assert_that(
+            calling(LayeredSettingsFile).with_args([], str(tmp_path)),
+            raises(ValueError),
+        )
+
+    @staticmethod
+    def __create_settings_file(tmp_path, *layers) -> LayeredSettingsFile:
+        (tmp_path / "resources").mkdir()
+        names = []
+        for position, layer in enumerate(layers):
+            if isinstance(layer, str):
+                names.append(layer)
+                continue
+            name = f"settings.layer{position}.json"
+            (tmp_path / "resources" / name).write_text(
+                json.dumps(layer), encoding="utf8"
+            )
+            names.append(name)
+        return LayeredSettingsFile(names, str(tmp_path))
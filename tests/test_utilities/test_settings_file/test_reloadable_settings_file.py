@@ -0,0 +1,102 @@
+import json
+import os
+import time
+from datetime import timedelta
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+
+from aquality_selenium_core.configurations.timeout_configuration import (
+    TimeoutConfiguration,
+)
+from aquality_selenium_core.utilities.settings_file import ReloadableJsonSettingsFile
+from tests.test_utilities.test_settings_file.conftest import ROOT_DIR
+
+SETTINGS_NAME = "settings.jsontest.json"
+
+
+class TestReloadableSettingsFile:
+    def test_should_reload_changed_file_and_notify_configurations(self, tmp_path):
+        settings_file = self.__create_settings_file(tmp_path)
+        configuration = TimeoutConfiguration(settings_file)
+        assert_that(settings_file.check_for_changes(), equal_to(False))
+        self.__write_condition(tmp_path, 5)
+        assert_that(settings_file.check_for_changes(), equal_to(True))
+        assert_that(configuration.condition, equal_to(timedelta(seconds=5)))
+
+    def test_should_keep_previous_settings_if_file_is_invalid(self, tmp_path):
+        settings_file = self.__create_settings_file(tmp_path)
+        (tmp_path / "resources" / SETTINGS_NAME).write_text("{", encoding="utf8")
+        assert_that(settings_file.check_for_changes(), equal_to(False))
+        assert_that(
+            settings_file.get_value("timeouts.timeoutCondition"), equal_to(1000)
+        )
+
+    def test_should_watch_file_in_background(self, tmp_path):
+        settings_file = self.__create_settings_file(
+            tmp_path, timedelta(milliseconds=10)
+        )
+        settings_file.start_watching()
+        try:
+            self.__write_condition(tmp_path, 7)
+            deadline = time.monotonic() + 5
+            while (
+                settings_file.get_value("timeouts.timeoutCondition") != 7
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+        finally:
+            settings_file.stop_watching()
+        assert_that(settings_file.get_value("timeouts.timeoutCondition"), equal_to(7))
+
+    def test_should_notify_other_subscribers_if_subscriber_fails(self, tmp_path):
+        settings_file = self.__create_settings_file(tmp_path)
+        notifications = []
+        settings_file.subscribe(self.__fail)
+        settings_file.subscribe(lambda: notifications.append(True))
+        self.__write_condition(tmp_path, 5)
+        assert_that(settings_file.check_for_changes(), equal_to(True))
+        assert_that(notifications, equal_to([True]))
+
+    def test_should_keep_watching_if_subscriber_fails(self, tmp_path):
+        settings_file = self.__create_settings_file(
+            tmp_path, timedelta(milliseconds=10)
+        )
+        settings_file.subscribe(self.__fail)
+        settings_file.start_watching()
+        try:
+            for value in [7, 70]:
+                self.__write_condition(tmp_path, value)
+                deadline = time.monotonic() + 5
+                while (
+                    settings_file.get_value("timeouts.timeoutCondition") != value
+                    and time.monotonic() < deadline
+                ):
+                    time.sleep(0.01)
+        finally:
+            settings_file.stop_watching()
+        assert_that(settings_file.get_value("timeouts.timeoutCondition"), equal_to(70))
+
+    @staticmethod
+    def __fail() -> None:
+        raise ValueError("Subscriber failed")
+
+    @staticmethod
+    def __create_settings_file(
+        tmp_path, check_interval: timedelta = timedelta(seconds=1)
+    ) -> ReloadableJsonSettingsFile:
+        (tmp_path / "resources").mkdir()
+        with open(
+            os.path.join(ROOT_DIR, "resources", SETTINGS_NAME), encoding="utf8"
+        ) as source:
+            (tmp_path / "resources" / SETTINGS_NAME).write_text(
+                source.read(), encoding="utf8"
+            )
+        return ReloadableJsonSettingsFile(SETTINGS_NAME, str(tmp_path), check_interval)
+
+    @staticmethod
+    def __write_condition(tmp_path, value: int) -> None:
+        path = tmp_path / "resources" / SETTINGS_NAME
+        content = json.loads(path.read_text(encoding="utf8"))
+        content["timeouts"]["timeoutCondition"] = value
+        path.write_text(json.dumps(content), encoding="utf8")
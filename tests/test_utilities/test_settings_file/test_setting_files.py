@@ -1,3 +1,4 @@
+import logging
 import os
 from distutils.util import strtobool
 
@@ -5,9 +6,11 @@ import pytest
 from hamcrest import assert_that
 from hamcrest import calling
 from hamcrest import equal_to
+from hamcrest import has_item
 from hamcrest import not_none
 from hamcrest import raises
 
+from aquality_selenium_core.utilities.settings_file import _compile_json_path
 from aquality_selenium_core.utilities.settings_file import AbstractSettingsFile
 from tests.test_utilities.test_settings_file.values import TestValues
 
@@ -20,6 +23,7 @@ class TestSettingsFiles:
         old_value = get_profile.get_value(key)
         target_value = not old_value
         os.environ[key] = str(target_value)
+        get_profile.refresh_environment()
         assert_that(
             bool(strtobool(get_profile.get_value(key))),
             equal_to(target_value),
@@ -37,6 +41,7 @@ class TestSettingsFiles:
         )
         target_value = str(True)
         os.environ[key] = target_value
+        get_profile.refresh_environment()
         assert_that(
             get_profile.is_value_present(key),
             equal_to(True),
@@ -69,6 +74,7 @@ class TestSettingsFiles:
 
         new_lang = "newLang"
         os.environ[language_path] = new_lang
+        get_profile.refresh_environment()
 
         language = get_profile.get_value(language_path)
         assert_that(
@@ -93,6 +99,7 @@ class TestSettingsFiles:
         expected_arguments = ["firstNew", "secondNew"]
         new_args = "firstNew,secondNew"
         os.environ[TestValues.ARGUMENTS_ENV_KEY] = new_args
+        get_profile.refresh_environment()
         arguments = get_profile.get_list(arguments_path)
         assert_that(arguments, not_none(), "Arguments list is none")
         assert_that(
@@ -117,6 +124,7 @@ class TestSettingsFiles:
         new_language_value = "newLangMap"
         expected_languages = {"language": new_language_value}
         os.environ[TestValues.LANGUAGE_ENV_KEY] = new_language_value
+        get_profile.refresh_environment()
         languages = get_profile.get_dictionary(logger_path)
 
         assert_that(languages, not_none(), "Languages list is none")
@@ -168,3 +176,64 @@ class TestSettingsFiles:
             calling(getattr(get_profile, func.__name__)).with_args(wrong_path),
             raises(ValueError),
         )
+
+    def test_should_read_values_by_indexed_and_json_paths_equally(self, get_profile):
+        assert_that(get_profile.get_value("arguments.start[1]"), equal_to("second"))
+        assert_that(get_profile.get_value("arguments.start[*]"), equal_to("first"))
+        assert_that(get_profile.get_value("$.timeouts.timeoutCommand"), equal_to(1000))
+        assert_that(get_profile.get_value_or_default("timeouts.absent", 5), equal_to(5))
+        assert_that(get_profile.get_value_or_default("nullValue", 5), equal_to(None))
+
+    def test_should_not_evaluate_json_path_for_simple_paths(self, get_profile):
+        misses = _compile_json_path.cache_info().misses
+        get_profile.get_value("timeouts.timeoutImplicit")
+        get_profile.get_dictionary("retry")
+        get_profile.is_value_present("timeouts.absent")
+        assert_that(_compile_json_path.cache_info().misses, equal_to(misses))
+
+    def test_should_capture_environment_variables_once(self, get_profile, caplog):
+        os.environ[TestValues.LANGUAGE_ENV_KEY] = "captured"
+        assert_that(get_profile.get_value("logger.language"), equal_to("ru"))
+        get_profile.refresh_environment()
+        caplog.set_level(logging.DEBUG)
+        for _ in range(3):
+            assert_that(get_profile.get_value("logger.language"), equal_to("captured"))
+        assert_that(
+            [record.message for record in caplog.records],
+            equal_to(
+                [
+                    "***** Using variable passed from environment "
+                    "logger.language=captured"
+                ]
+            ),
+        )
+
+    def test_should_match_environment_variables_ignoring_case_and_underscores(
+        self, get_profile
+    ):
+        os.environ["TIMEOUTS_TIMEOUTCOMMAND"] = "5"
+        try:
+            get_profile.refresh_environment()
+            assert_that(get_profile.get_value("timeouts.timeoutCommand"), equal_to("5"))
+        finally:
+            del os.environ["TIMEOUTS_TIMEOUTCOMMAND"]
+
+    def test_should_warn_about_environment_variables_of_the_same_setting(
+        self, get_profile, caplog
+    ):
+        os.environ["TIMEOUTS_TIMEOUTCOMMAND"] = "5"
+        os.environ["timeouts_timeoutCommand"] = "7"
+        try:
+            get_profile.refresh_environment()
+            assert_that(get_profile.get_value("timeouts.timeoutCommand"), equal_to("5"))
+        finally:
+            del os.environ["TIMEOUTS_TIMEOUTCOMMAND"]
+            del os.environ["timeouts_timeoutCommand"]
+        assert_that(
+            [record.message for record in caplog.records],
+            has_item(
+                "Environment variables TIMEOUTS_TIMEOUTCOMMAND and timeouts_timeoutCommand "
+                "override the same setting timeouts.timeoutcommand, "
+                "value of TIMEOUTS_TIMEOUTCOMMAND is used"
+            ),
+        )
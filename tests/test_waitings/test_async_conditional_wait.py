@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+from hamcrest import assert_that
+from hamcrest import calling
+from hamcrest import equal_to
+from hamcrest import less_than
+from hamcrest import raises
+
+from aquality_selenium_core.waitings.async_conditional_wait import (
+    AbstractAsyncConditionalWait,
+)
+from aquality_selenium_core.waitings.async_conditional_wait import (
+    AsyncConditionalWait,
+)
+from tests.test_waitings.test_conditional_wait import Application
+from tests.test_waitings.test_conditional_wait import CustomException
+from tests.test_waitings.test_conditional_wait import CustomTimeoutConfiguration
+
+
+class TestAsyncConditionalWait:
+    def test__wait_for__should_be_possible_to_wait_for_coroutine_condition(self):
+        async def func():
+            return True
+
+        assert_that(
+            self.__run(self.__get_conditional_wait().wait_for(func)),
+            equal_to(True),
+            "Coroutine condition is not satisfied",
+        )
+
+    def test__wait_for__should_be_possible_to_wait_for_blocking_condition(self):
+        checks = {"count": 0}
+
+        def func():
+            checks["count"] += 1
+            return checks["count"] > 1
+
+        assert_that(
+            self.__run(self.__get_conditional_wait().wait_for(func)),
+            equal_to(True),
+            "Blocking condition is not satisfied",
+        )
+
+    def test__wait_for__should_be_possible_to_ignore_custom_exception(self):
+        async def func():
+            raise CustomException()
+
+        assert_that(
+            self.__run(
+                self.__get_conditional_wait().wait_for(
+                    func, exceptions_to_ignore=[CustomException]
+                )
+            ),
+            equal_to(False),
+            "Custom exception is not ignored",
+        )
+
+    def test__wait_for_true__should_raise_timeout_error_when_condition_is_not_satisfied(
+        self,
+    ):
+        async def func():
+            return False
+
+        assert_that(
+            calling(self.__run).with_args(
+                self.__get_conditional_wait().wait_for_true(func, message="message")
+            ),
+            raises(TimeoutError, "message"),
+            "Timeout error is not raised",
+        )
+
+    def test__wait_for__should_not_block_concurrent_waitings(self):
+        async def func():
+            return False
+
+        conditional_wait = self.__get_conditional_wait()
+        waitings_count = 10
+        start_time = time.monotonic()
+
+        async def wait_all():
+            await asyncio.gather(
+                *[conditional_wait.wait_for(func) for _ in range(waitings_count)]
+            )
+
+        self.__run(wait_all())
+        assert_that(
+            time.monotonic() - start_time,
+            less_than(CustomTimeoutConfiguration().condition.total_seconds() * 2),
+            "Concurrent waitings block each other",
+        )
+
+    @staticmethod
+    def __run(awaitable):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(awaitable)
+        finally:
+            loop.close()
+
+    @staticmethod
+    def __get_conditional_wait() -> AbstractAsyncConditionalWait:
+        return AsyncConditionalWait(CustomTimeoutConfiguration(), Application())
@@ -3,7 +3,9 @@ from datetime import timedelta
 from hamcrest import assert_that
 from hamcrest import calling
 from hamcrest import equal_to
+from hamcrest import greater_than_or_equal_to
 from hamcrest import is_not
+from hamcrest import less_than_or_equal_to
 from hamcrest import raises
 from selenium.webdriver.remote.webdriver import WebDriver
 
@@ -13,6 +15,9 @@ from aquality_selenium_core.configurations.timeout_configuration import (
 )
 from aquality_selenium_core.waitings.conditional_wait import AbstractConditionalWait
 from aquality_selenium_core.waitings.conditional_wait import ConditionalWait
+from aquality_selenium_core.waitings.polling_strategy import (
+    ExponentialPollingStrategy,
+)
 
 
 class TestConditionalWait:
@@ -123,6 +128,38 @@ class TestConditionalWait:
             "Custom exception is not raised",
         )
 
+    def test__wait_for__should_poll_with_sub_second_interval(self):
+        checks = {"count": 0}
+
+        def func():
+            checks["count"] += 1
+            return False
+
+        self.__get_conditional_wait().wait_for(func)
+        assert_that(
+            checks["count"],
+            greater_than_or_equal_to(4),
+            "Polling interval less than a second is not respected",
+        )
+
+    def test__wait_for__should_be_possible_to_pass_polling_strategy(self):
+        checks = {"count": 0}
+
+        def func():
+            checks["count"] += 1
+            return False
+
+        self.__get_conditional_wait().wait_for(
+            func,
+            polling_interval=timedelta(milliseconds=100),
+            polling_strategy=ExponentialPollingStrategy(4, timedelta(milliseconds=800)),
+        )
+        assert_that(
+            checks["count"],
+            less_than_or_equal_to(4),
+            "Polling strategy passed to the waiting is not used",
+        )
+
     @staticmethod
     def __get_conditional_wait() -> AbstractConditionalWait:
         timeout_configuration = CustomTimeoutConfiguration()
@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+from hamcrest import assert_that
+from hamcrest import calling
+from hamcrest import equal_to
+from hamcrest import greater_than_or_equal_to
+from hamcrest import less_than_or_equal_to
+from hamcrest import raises
+
+from aquality_selenium_core.waitings.polling_strategy import (
+    ExponentialPollingStrategy,
+)
+from aquality_selenium_core.waitings.polling_strategy import FixedPollingStrategy
+from aquality_selenium_core.waitings.polling_strategy import JitteredPollingStrategy
+
+POLLING_INTERVAL = timedelta(milliseconds=300)
+
+
+class TestPollingStrategy:
+    def test__fixed__should_return_polling_interval(self):
+        assert_that(
+            FixedPollingStrategy().get_interval(POLLING_INTERVAL, 10),
+            equal_to(POLLING_INTERVAL),
+            "Fixed polling interval is changed",
+        )
+
+    def test__exponential__should_multiply_interval_for_each_attempt(self):
+        strategy = ExponentialPollingStrategy(2, timedelta(seconds=5))
+        assert_that(
+            [strategy.get_interval(POLLING_INTERVAL, attempt) for attempt in range(3)],
+            equal_to(
+                [
+                    timedelta(milliseconds=300),
+                    timedelta(milliseconds=600),
+                    timedelta(milliseconds=1200),
+                ]
+            ),
+            "Polling interval is not multiplied",
+        )
+
+    def test__exponential__should_not_exceed_max_interval(self):
+        strategy = ExponentialPollingStrategy(2, timedelta(seconds=1))
+        assert_that(
+            strategy.get_interval(POLLING_INTERVAL, 1000),
+            equal_to(timedelta(seconds=1)),
+            "Polling interval exceeds max interval",
+        )
+
+    def test__exponential__should_raise_error_if_multiplier_less_than_one(self):
+        assert_that(
+            calling(ExponentialPollingStrategy).with_args(0.5), raises(ValueError)
+        )
+
+    def test__jittered__should_deviate_interval_within_jitter(self):
+        strategy = JitteredPollingStrategy(FixedPollingStrategy(), 0.5)
+        for attempt in range(20):
+            interval = strategy.get_interval(POLLING_INTERVAL, attempt)
+            assert_that(interval, greater_than_or_equal_to(POLLING_INTERVAL * 0.5))
+            assert_that(interval, less_than_or_equal_to(POLLING_INTERVAL * 1.5))
+
+    def test__jittered__should_raise_error_if_jitter_is_out_of_range(self):
+        assert_that(
+            calling(JitteredPollingStrategy).with_args(jitter=2), raises(ValueError)
+        )